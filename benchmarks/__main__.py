@@ -0,0 +1,70 @@
+"""Benchmarks runner.
+
+python -m benchmarks [-k FILTER] [--save baseline.json] [--compare baseline.json] [--threshold 0.25]
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import Dict, List
+
+from . import suite
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def compare(
+    results: Dict[str, suite.Measurement], baseline: Dict[str, dict], threshold: float
+) -> List[str]:
+    """Return regressions, measurements worse than baseline by more than threshold."""
+    regressions = []
+    for name, measurement in results.items():
+        if name not in baseline or baseline[name]["unit"] != measurement.unit:
+            continue
+        before = baseline[name]["value"]
+        if before and (measurement.value - before) / before > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv: List[str] = None) -> int:
+    """Run benchmarks, save or compare against a baseline."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("-k", "--filter", default="", help="run benchmarks containing FILTER")
+    parser.add_argument("--save", nargs="?", const=DEFAULT_BASELINE, help="save results")
+    parser.add_argument("--compare", nargs="?", const=DEFAULT_BASELINE, help="compare results")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown ratio")
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+
+    results = {}
+    for name in (name for name in suite.BENCHMARKS if args.filter in name):
+        results[name] = measurement = suite.BENCHMARKS[name]()
+        line = f"{name:<32} {measurement.value:>12.3f} {measurement.unit:<6}"
+        if name in baseline:
+            before = baseline[name]["value"]
+            line += f" baseline {before:>12.3f} ({(measurement.value - before) / before:+.1%})"
+        print(line, flush=True)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as file:
+            saved = {
+                name: {"value": round(m.value, 3), "unit": m.unit} for name, m in results.items()
+            }
+            json.dump(saved, file, indent=2)
+            file.write("\n")
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"Regressions over {args.threshold:.0%}: {', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
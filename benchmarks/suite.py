@@ -0,0 +1,343 @@
+"""Benchmark Suite.
+
+Every benchmark returns a single measurement where lower is better: time per operation,
+peak memory, or import time.
+"""
+
+from collections import namedtuple
+import gc
+import subprocess
+import sys
+import tempfile
+import timeit
+import tracemalloc
+from typing import Callable, Dict, List
+
+Measurement = namedtuple("Measurement", ["value", "unit"])
+
+BENCHMARKS: Dict[str, Callable[[], Measurement]] = {}
+REPEAT = 5
+SCALING_KEYS = (10, 100, 1000, 10000)
+VALIDATOR_VALUES = {
+    "Str": "google",
+    "Bool": "true",
+    "Number": "0.23",
+    "Port": "8000",
+    "Email": "test@gmail.com",
+    "IPAddress": "192.168.0.1:8000",
+    "Url": "https://www.google.com/path?q=1",
+    "Json": '{"concurrency": 20, "hosts": ["a", "b"], "nested": {"x": 1}}',
+}
+
+
+def benchmark(name: str):
+    """Register a benchmark function."""
+
+    def register(func: Callable[[], Measurement]):
+        BENCHMARKS[name] = func
+        return func
+
+    return register
+
+
+def time_per_call(func: Callable[[], object], unit: str = "us") -> Measurement:
+    """Best time per call over REPEAT runs, calls per run picked by timeit autorange."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=REPEAT, number=number)) / number
+    scale = {"ns": 1e9, "us": 1e6, "ms": 1e3}[unit]
+    return Measurement(best * scale, f"{unit}/op")
+
+
+def _register_validator(name: str, value: str):
+    """Register per validator throughput benchmark."""
+
+    @benchmark(f"validator.{name}")
+    def run() -> Measurement:
+        import envalidate  # pylint: disable=import-outside-toplevel
+
+        validator = getattr(envalidate, name)()
+        return time_per_call(lambda: validator.envalidate(value), unit="ns")
+
+    @benchmark(f"validator.{name}.construct")
+    def construct() -> Measurement:
+        import envalidate  # pylint: disable=import-outside-toplevel
+
+        validator_class = getattr(envalidate, name)
+        return time_per_call(
+            lambda: validator_class(default=value, desc="description", example=value), unit="ns"
+        )
+
+
+for _name, _value in VALIDATOR_VALUES.items():
+    _register_validator(_name, _value)
+
+
+def _large_json(size: int) -> str:
+    """Json config of about size bytes."""
+    import json  # pylint: disable=import-outside-toplevel
+
+    hosts = [
+        {"host": f"host-{index}.internal", "port": 8000 + index} for index in range(size // 40)
+    ]
+    return json.dumps({"hosts": hosts, "limits": {"cpu": 2, "memory": "1Gi"}})
+
+
+def _register_large_json(stdlib: bool):
+    """Register a 32 KiB Json config benchmark, with the default or the stdlib decoder."""
+
+    @benchmark(f"validator.Json.kb_32{'.stdlib' if stdlib else ''}")
+    def run() -> Measurement:
+        import json  # pylint: disable=import-outside-toplevel
+
+        from envalidate import Json  # pylint: disable=import-outside-toplevel
+
+        validator = Json(decoder=json.loads if stdlib else None)
+        value = _large_json(32 * 1024)
+        return time_per_call(lambda: validator.__validate__value__(value), unit="us")
+
+
+_register_large_json(stdlib=False)
+_register_large_json(stdlib=True)
+
+
+@benchmark("validator.Url.allow_lists")
+def url_allow_lists() -> Measurement:
+    """Url validator returning parsed urls, with schemes, hosts and ports allow-lists."""
+    from envalidate import Url  # pylint: disable=import-outside-toplevel
+
+    validator = Url(
+        parsed=True, schemes={"https"}, hosts={"*.google.com"}, port_range=(1, 65535)
+    )
+    value = VALIDATOR_VALUES["Url"]
+    return time_per_call(lambda: validator.envalidate(value), unit="ns")
+
+
+@benchmark("validator.IPAddress.networks_10000")
+def ip_networks() -> Measurement:
+    """IPAddress validator checking addresses against a 10000 networks allowlist."""
+    from envalidate import IPAddress  # pylint: disable=import-outside-toplevel
+
+    networks = [f"10.{index // 256}.{index % 256}.0/24" for index in range(10000)]
+    networks += [f"2001:db8:{index:x}::/48" for index in range(0, 1000)]
+    validator = IPAddress(choices=networks)
+    return time_per_call(lambda: validator.envalidate("10.39.15.200:8000"), unit="ns")
+
+
+@benchmark("validator.function")
+def function_validator() -> Measurement:
+    """Plain callable validator throughput."""
+    from envalidate import FunctionValidator  # pylint: disable=import-outside-toplevel
+
+    validator = FunctionValidator(int)
+    return time_per_call(lambda: validator.envalidate("8000"), unit="ns")
+
+
+@benchmark("validator.function.construct")
+def function_validator_construct() -> Measurement:
+    """Plain callable validator construction."""
+    from envalidate import FunctionValidator  # pylint: disable=import-outside-toplevel
+
+    return time_per_call(lambda: FunctionValidator(int, default=8000, desc="port"), unit="ns")
+
+
+def _scaling_schema(keys: int):
+    """Mixed validators and a valid environment of keys variables."""
+    from envalidate import Bool, Number, Port, Str  # pylint: disable=import-outside-toplevel
+
+    kinds = ((Str, "value"), (Bool, "true"), (Number, "42"), (Port, "8000"))
+    validators, environment = {}, {}
+    for index in range(keys):
+        validator, value = kinds[index % len(kinds)]
+        validators[f"KEY_{index}"] = validator()
+        environment[f"KEY_{index}"] = value
+    return validators, environment
+
+
+def _register_scaling(keys: int):
+    """Register read_env scaling benchmarks."""
+
+    @benchmark(f"read_env.keys_{keys}")
+    def run() -> Measurement:
+        from envalidate import read_env  # pylint: disable=import-outside-toplevel
+
+        validators, environment = _scaling_schema(keys)
+        return time_per_call(lambda: read_env(environment, validators), unit="ms")
+
+    @benchmark(f"read_env.slots.keys_{keys}")
+    def run_slots() -> Measurement:
+        from envalidate import read_env  # pylint: disable=import-outside-toplevel
+
+        validators, environment = _scaling_schema(keys)
+        return time_per_call(lambda: read_env(environment, validators, result="slots"), unit="ms")
+
+
+for _keys in SCALING_KEYS:
+    _register_scaling(_keys)
+
+
+@benchmark("read_env.patterns.vars_10000")
+def patterns() -> Measurement:
+    """read_env classifying 10000 env vars through 20 patterns."""
+    from envalidate import Bool, Pattern, read_env  # pylint: disable=import-outside-toplevel
+
+    validators = {f"GROUP_{index}": Pattern(f"G{index}_*", Bool()) for index in range(20)}
+    environment = {f"G{index % 25}_KEY_{index}": "true" for index in range(10000)}
+    return time_per_call(lambda: read_env(environment, validators, result="slots"), unit="ms")
+
+
+@benchmark("read_env.errors.keys_1000")
+def errors_path() -> Measurement:
+    """read_env with every value invalid, and a non raising reporter."""
+    from envalidate import read_env  # pylint: disable=import-outside-toplevel
+    from envalidate.reporters import DefaultReporter  # pylint: disable=import-outside-toplevel
+
+    validators, _ = _scaling_schema(1000)
+    environment = {key: "invalid" for key in validators}
+    for key in list(validators)[::4]:
+        del environment[key]
+    reporter = DefaultReporter(on_error=lambda errors: None)
+    reporter.__logger__.disabled = True
+    return time_per_call(lambda: read_env(environment, validators, reporter), unit="ms")
+
+
+@benchmark("read_env.sources.keys_1000")
+def sources_path() -> Measurement:
+    """read_env over three layered Sources (overrides, file, environment), with provenance."""
+    from envalidate import read_env, Sources  # pylint: disable=import-outside-toplevel
+
+    validators, environment = _scaling_schema(1000)
+    keys = list(environment)
+    overrides = {key: environment[key] for key in keys[:10]}
+    file_values = {key: environment[key] for key in keys[:500]}
+    sources = Sources([overrides, file_values, environment])
+    return time_per_call(lambda: read_env(sources, validators, result="slots"), unit="ms")
+
+
+def _batch_environments(count: int):
+    """Validators of 20 keys and count environments, with a few distinct values per key."""
+    validators, environment = _scaling_schema(20)
+    environments = []
+    for index in range(count):
+        values = dict(environment)
+        values["KEY_2"] = str(index % 16)
+        values["KEY_3"] = str(8000 + index % 32)
+        environments.append(values)
+    return validators, environments
+
+
+@benchmark("read_env_many.envs_5000")
+def batch() -> Measurement:
+    """read_env_many over 5000 environments, slots results."""
+    from envalidate import read_env_many  # pylint: disable=import-outside-toplevel
+
+    validators, environments = _batch_environments(5000)
+    return time_per_call(lambda: read_env_many(environments, validators, result="slots"), unit="ms")
+
+
+@benchmark("read_env_many.loop.envs_5000")
+def batch_loop() -> Measurement:
+    """Reference for read_env_many: read_env over the same 5000 environments, one at a time."""
+    from envalidate import compile_schema, read_env  # pylint: disable=import-outside-toplevel
+
+    validators, environments = _batch_environments(5000)
+    schema = compile_schema(validators)
+    return time_per_call(
+        lambda: [read_env(environment, schema, result="slots") for environment in environments],
+        unit="ms",
+    )
+
+
+@benchmark("memory.read_env.keys_10000")
+def peak_memory() -> Measurement:
+    """Peak memory allocated by compiling and reading a 10000 keys schema."""
+    from envalidate import read_env  # pylint: disable=import-outside-toplevel
+    from envalidate.schema import clear_schema_cache  # pylint: disable=import-outside-toplevel
+
+    validators, environment = _scaling_schema(10000)
+    clear_schema_cache()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        read_env(environment, validators, result="slots")
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return Measurement(peak / 1024, "KiB")
+
+
+def _snapshot_schema(keys: int):
+    """Costlier validators (Json, Url, Email, IPAddress), where snapshots pay off."""
+    from envalidate import Email, IPAddress, Json, Url  # pylint: disable=import-outside-toplevel
+
+    kinds = ((Json, "Json"), (Url, "Url"), (Email, "Email"), (IPAddress, "IPAddress"))
+    validators, environment = {}, {}
+    for index in range(keys):
+        validator, name = kinds[index % len(kinds)]
+        validators[f"KEY_{index}"] = validator()
+        environment[f"KEY_{index}"] = VALIDATOR_VALUES[name]
+    return validators, environment
+
+
+@benchmark("snapshot.cold.keys_1000")
+def snapshot_cold() -> Measurement:
+    """read_env with an empty snapshot cache, validating and storing the snapshot."""
+    from envalidate import read_env  # pylint: disable=import-outside-toplevel
+    from envalidate.snapshot import SnapshotCache  # pylint: disable=import-outside-toplevel
+
+    validators, environment = _snapshot_schema(1000)
+    with tempfile.TemporaryDirectory() as directory:
+        snapshot = SnapshotCache(directory)
+
+        def cold():
+            snapshot.clear()
+            read_env(environment, validators, result="slots", snapshot=snapshot)
+
+        return time_per_call(cold, unit="ms")
+
+
+@benchmark("snapshot.warm.keys_1000")
+def snapshot_warm() -> Measurement:
+    """read_env loading a stored snapshot."""
+    from envalidate import read_env  # pylint: disable=import-outside-toplevel
+    from envalidate.snapshot import SnapshotCache  # pylint: disable=import-outside-toplevel
+
+    validators, environment = _snapshot_schema(1000)
+    with tempfile.TemporaryDirectory() as directory:
+        snapshot = SnapshotCache(directory)
+        read_env(environment, validators, result="slots", snapshot=snapshot)
+        return time_per_call(
+            lambda: read_env(environment, validators, result="slots", snapshot=snapshot),
+            unit="ms",
+        )
+
+
+@benchmark("import.envalidate")
+def import_time() -> Measurement:
+    """Best import time of envalidate, in a fresh interpreter."""
+    return _import_time("import envalidate")
+
+
+@benchmark("import.read_env")
+def import_read_env_time() -> Measurement:
+    """Best import time of read_env and the validators, in a fresh interpreter."""
+    return _import_time("from envalidate import read_env, Str")
+
+
+def _import_time(statement: str) -> Measurement:
+    """Best import time of statement, over REPEAT fresh interpreters."""
+    code = f"import time; t = time.perf_counter(); {statement}; print(time.perf_counter() - t)"
+    best = min(
+        float(
+            subprocess.run(
+                [sys.executable, "-c", code], capture_output=True, text=True, check=True
+            ).stdout
+        )
+        for _ in range(REPEAT)
+    )
+    return Measurement(best * 1e3, "ms")
+
+
+def run(names: List[str] = None) -> Dict[str, Measurement]:
+    """Run benchmarks, all by default."""
+    return {name: BENCHMARKS[name]() for name in (names or BENCHMARKS)}
@@ -1,22 +1,83 @@
-"""Init."""
-
-from .envalidate import read_env
-from .validators import (
-    Bool,
-    Email,
-    EnValidator,
-    IPAddress,
-    Json,
-    Number,
-    Port,
-    Str,
-    Url,
-)
+"""Init.
+
+Public names are imported lazily on first access, so "import envalidate" stays cheap for short
+lived processes, and pydantic is only loaded once read_env builds a model result, or the schema is
+exported.
+"""
+
+from typing import TYPE_CHECKING
+
 from .version import VERSION
 
+if TYPE_CHECKING:  # pragma: no cover
+    from .aio import aread_env, AsyncEnValidator
+    from .batch import read_env_many
+    from .envalidate import read_env, read_env_file
+    from .live import LiveEnv
+    from .resolvers import SecretResolver
+    from .results import FrozenEnv, LazyEnv
+    from .schema import compile_schema, EnvSchema, Group, Pattern
+    from .sources import Source, Sources
+    from .validators import (
+        Bool,
+        Email,
+        EnValidator,
+        FunctionValidator,
+        IPAddress,
+        Json,
+        Number,
+        Port,
+        Str,
+        Url,
+        validator,
+    )
+
+_LAZY_EXPORTS = {
+    "EnValidator": ".validators",
+    "read_env": ".envalidate",
+    "read_env_many": ".batch",
+    "read_env_file": ".envalidate",
+    "aread_env": ".aio",
+    "AsyncEnValidator": ".aio",
+    "EnvSchema": ".schema",
+    "compile_schema": ".schema",
+    "Group": ".schema",
+    "Pattern": ".schema",
+    "FrozenEnv": ".results",
+    "LiveEnv": ".live",
+    "LazyEnv": ".results",
+    "SecretResolver": ".resolvers",
+    "Source": ".sources",
+    "Sources": ".sources",
+    "Str": ".validators",
+    "Bool": ".validators",
+    "Email": ".validators",
+    "IPAddress": ".validators",
+    "Number": ".validators",
+    "Port": ".validators",
+    "Url": ".validators",
+    "Json": ".validators",
+    "FunctionValidator": ".validators",
+    "validator": ".validators",
+}
+
 __all__ = (
     "EnValidator",
     "read_env",
+    "read_env_many",
+    "read_env_file",
+    "aread_env",
+    "AsyncEnValidator",
+    "EnvSchema",
+    "compile_schema",
+    "Group",
+    "Pattern",
+    "FrozenEnv",
+    "LiveEnv",
+    "LazyEnv",
+    "SecretResolver",
+    "Source",
+    "Sources",
     "Str",
     "Bool",
     "Email",
@@ -25,5 +86,24 @@ __all__ = (
     "Port",
     "Url",
     "Json",
+    "FunctionValidator",
+    "validator",
     "VERSION",
 )
+
+
+def __getattr__(name):
+    """Import public names on first access."""
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module  # pylint: disable=import-outside-toplevel
+
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Dir including lazy names."""
+    return sorted({*globals(), *_LAZY_EXPORTS})
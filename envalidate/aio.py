@@ -0,0 +1,195 @@
+"""Asyncio Support."""
+
+from abc import ABC, abstractmethod
+import asyncio
+from typing import Any, Dict, Iterable, List, Tuple
+
+from .exceptions import EnvError, EnvMissingError
+from .reporters import Reporter
+from .results import attach_sources
+from .schema import compile_schema, DEFAULT_REPORTER, EnvSchema, Group, Pattern
+from .validators import EnValidator, NOT_IN_CHOICES
+
+DEFAULT_CONCURRENCY = 16
+_MISSING = object()
+
+
+class AsyncEnValidator(EnValidator, ABC):
+    """Validator whose __validate__value__ is a coroutine (eg. I/O bound checks).
+
+    :param timeout: max validation time, in seconds.
+    """
+
+    __slots__ = ("timeout",)
+    __cost__ = 100
+    timeout: float
+
+    def envalidate(self, value: str) -> Any:
+        """Validate outside an event loop."""
+        return asyncio.run(self.aenvalidate(value))
+
+    async def aenvalidate(self, value: str) -> Any:
+        """Valid key and raise error if invalid or return value if valid."""
+        try:
+            valid_value = await asyncio.wait_for(self.__validate__value__(value), self.timeout)
+        except asyncio.TimeoutError as ex:
+            raise self.error(value, "validation timed out") from ex
+        if self.choices and valid_value not in self.choices:
+            raise self.error(value, NOT_IN_CHOICES)
+        return valid_value
+
+    @abstractmethod
+    async def __validate__value__(self, value) -> Any:
+        """Validate Value."""
+
+
+async def avalidate(
+    environment,
+    schema: EnvSchema,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    timeout: float = None,
+):
+    """Validate environment, without reporting.
+
+    Sync validators run inline, async validators (including those of groups and patterns) run
+    concurrently.
+
+    :param environment: An object containing your env vars (eg. os.environ)
+    :param schema: compiled EnvSchema.
+    :param concurrency: max async validators running at once.
+    :param timeout: overall deadline of the async validators, in seconds.
+    :return: cleaned values and errors, both keyed by env var name, in schema order.
+    """
+    if not any(_is_async(validator) for validator in schema.validators.values()):
+        return schema.validate(environment)
+    errors: Dict[str, EnvError] = {}
+    jobs: List[Tuple] = []
+    orders: List[Tuple[Dict[str, Any], List[str]]] = []
+    cleaned = _validate_sync(environment, schema, "", jobs, errors, orders)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    tasks: Dict[asyncio.Future, str] = {
+        asyncio.ensure_future(_run(semaphore, errors, *job)): job[2] for job in jobs
+    }
+    _, pending = await asyncio.wait(list(tasks), timeout=timeout)
+    for task in pending:
+        task.cancel()
+        name = tasks[task]
+        errors[name] = EnvError(f"validation deadline of {timeout}s exceeded", key=name)
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+    for values, keys in orders:
+        ordered = _ordered(values, keys)
+        values.clear()
+        values.update(ordered)
+    ordered_errors = _ordered(errors, schema.keys)
+    ordered_errors.update(errors)
+    return cleaned, ordered_errors
+
+
+async def _run(
+    semaphore: asyncio.Semaphore,
+    errors: Dict[str, EnvError],
+    values: Dict[str, Any],
+    key: str,
+    name: str,
+    validator: AsyncEnValidator,
+    value: Any,
+):
+    """Validate value into values[key], any exception is an error keyed by env var name."""
+    async with semaphore:
+        try:
+            if value is _MISSING:
+                if not validator.default:
+                    raise EnvMissingError(key)
+                value = validator.default
+            values[key] = await validator.aenvalidate(value)
+        except EnvError as ex:
+            ex.key = name
+            errors[name] = ex
+        except Exception as ex:  # pylint: disable=broad-except
+            error = validator.error(value, str(ex) or type(ex).__name__)
+            error.key = name
+            errors[name] = error
+
+
+def _is_async(validator) -> bool:
+    """Whether validator is async, or a group or pattern with async validators."""
+    if isinstance(validator, Group):
+        return any(_is_async(nested) for nested in validator.validators.values())
+    if isinstance(validator, Pattern):
+        validator = validator.validator
+    return isinstance(validator, AsyncEnValidator)
+
+
+def _validate_sync(
+    environment,
+    schema: EnvSchema,
+    prefix: str,
+    jobs: List[Tuple],
+    errors: Dict[str, EnvError],
+    orders: List[Tuple[Dict[str, Any], List[str]]],
+) -> Dict[str, Any]:
+    """Validate the sync keys of schema, and queue a job per async value.
+
+    :param prefix: env var names prefix of the schema, set when nested in a group.
+    :param jobs: (values, key, env var name, validator, value) per async value, appended.
+    :param errors: errors of the sync keys, keyed by env var name, updated.
+    :param orders: values dict, and its keys order, per dict filled by jobs, appended.
+    :return: cleaned values, without the async ones.
+    """
+    validators = schema.validators
+    sync_keys = [key for key, validator in validators.items() if not _is_async(validator)]
+    cleaned, sync_errors = schema.validate(environment, sync_keys)
+    for name, error in sync_errors.items():
+        error.key = prefix + name
+        errors[error.key] = error
+    index = schema.index(environment)
+    for key, validator in validators.items():
+        if isinstance(validator, AsyncEnValidator):
+            jobs.append((cleaned, key, prefix + key, validator, environment.get(key, _MISSING)))
+        elif isinstance(validator, Group) and _is_async(validator):
+            group_prefix = prefix + validator.prefix
+            cleaned[key] = _validate_sync(
+                index[key], validator.schema, group_prefix, jobs, errors, orders
+            )
+        elif isinstance(validator, Pattern) and _is_async(validator):
+            values = cleaned[key] = {}
+            orders.append((values, list(index[key])))
+            for name, value in index[key].items():
+                jobs.append((values, name, prefix + name, validator.validator, value))
+    orders.append((cleaned, list(validators)))
+    return cleaned
+
+
+def _ordered(values: Dict[str, Any], keys: Iterable[str]) -> Dict[str, Any]:
+    """Order values by keys."""
+    return {key: values[key] for key in keys if key in values}
+
+
+async def aread_env(
+    environment,
+    validators: Dict[str, EnValidator],
+    reporter: Reporter = DEFAULT_REPORTER,
+    result: str = "model",
+    concurrency: int = DEFAULT_CONCURRENCY,
+    timeout: float = None,
+):
+    """Returns a sanitized, immutable environment object, running async validators concurrently.
+
+    :param environment: An object containing your env vars (eg. os.environ)
+    :param validators: An object that specifies the format of required vars,
+    or an EnvSchema compiled from it.
+    :param reporter: Pass in a function to override the default error handling and console output.
+    :param result: result backend, see read_env.
+    :param concurrency: max async validators running at once.
+    :param timeout: overall deadline of the async validators, in seconds, keys still validating
+    are reported as errors.
+    """
+    schema: EnvSchema = compile_schema(validators)
+    provenance = schema.provenance(environment)
+    cleaned_env, errors = await avalidate(environment, schema, concurrency, timeout)
+    if provenance and errors:
+        attach_sources(errors, provenance)
+    reporter.report(errors)
+    return schema.build(cleaned_env, result, provenance)
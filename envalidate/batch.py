@@ -0,0 +1,205 @@
+"""Batch Validation."""
+
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Tuple
+
+from .exceptions import EnvError, EnvMissingError
+from .schema import compile_schema, EnvSchema
+from .validators import Bool, EnValidator, Number, Port
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+NUMPY_THRESHOLD = 64
+_MISSING = object()
+_SHAREABLE = (str, bytes, bool, int, float, complex, type(None), tuple, frozenset, EnvError)
+
+
+def _apply(validator: EnValidator, value) -> Any:
+    """Scalar reference implementation, returning the EnvError instead of raising it."""
+    try:
+        return validator.envalidate(value)
+    except EnvError as ex:
+        return ex
+
+
+def _check_choices(validator: EnValidator, uniques: List, results: List) -> List:
+    """Replace results not in choices with the scalar validator error."""
+    choices = validator.choices
+    if not choices:
+        return results
+    return [
+        result if isinstance(result, EnvError) or result in choices else _apply(validator, raw)
+        for raw, result in zip(uniques, results)
+    ]
+
+
+def _parse_floats(uniques: List[str]) -> List:
+    """Parse strings into floats, None where unparsable."""
+    if np is not None and len(uniques) >= NUMPY_THRESHOLD:
+        try:
+            return np.array(uniques, dtype=np.str_).astype(np.float64).tolist()
+        except ValueError:
+            pass
+    floats = []
+    for raw in uniques:
+        try:
+            floats.append(float(raw))
+        except ValueError:
+            floats.append(None)
+    return floats
+
+
+def _number_kernel(validator: EnValidator, uniques: List[str]) -> List:
+    """Number column kernel."""
+    results = [
+        (
+            _apply(validator, raw)
+            if number is None
+            else (int(number) if number.is_integer() else number)
+        )
+        for raw, number in zip(uniques, _parse_floats(uniques))
+    ]
+    return _check_choices(validator, uniques, results)
+
+
+def _port_kernel(validator: EnValidator, uniques: List[str]) -> List:
+    """Port column kernel."""
+    results = [
+        (
+            int(number)
+            if number is not None and number.is_integer() and 1 <= number <= 65535
+            else _apply(validator, raw)
+        )
+        for raw, number in zip(uniques, _parse_floats(uniques))
+    ]
+    return _check_choices(validator, uniques, results)
+
+
+_BOOLS = {"0": False, "false": False, "1": True, "true": True}
+
+
+def _bool_kernel(validator: EnValidator, uniques: List[str]) -> List:
+    """Bool column kernel."""
+    results = []
+    for raw in uniques:
+        result = _BOOLS.get(raw.lower(), _MISSING)
+        results.append(_apply(validator, raw) if result is _MISSING else result)
+    return _check_choices(validator, uniques, results)
+
+
+def _scalar_kernel(validator: EnValidator, uniques: List[str]) -> List:
+    """Any validator column kernel."""
+    return [_apply(validator, raw) for raw in uniques]
+
+
+KERNELS: Dict[type, Callable[[EnValidator, List[str]], List]] = {
+    Number: _number_kernel,
+    Port: _port_kernel,
+    Bool: _bool_kernel,
+}
+
+
+def _column_results(validator: EnValidator, uniques: List, key: str) -> Dict:
+    """Result of each distinct raw value of a column, _MISSING values take the default."""
+    strings = [raw for raw in uniques if raw.__class__ is str]
+    kernel = KERNELS.get(type(validator), _scalar_kernel)
+    results = dict(zip(strings, kernel(validator, strings))) if strings else {}
+    for raw in uniques:
+        if raw is _MISSING:
+            default = validator.default
+            results[raw] = _apply(validator, default) if default else EnvMissingError(key)
+        elif raw.__class__ is not str:
+            results[raw] = _apply(validator, raw)
+    for result in results.values():
+        if isinstance(result, EnvError):
+            result.key = key
+    return results
+
+
+def _validate_one(validator: EnValidator, raw, key: str) -> Any:
+    """Result of a single raw value of a column holding unhashable values."""
+    try:
+        hash(raw)
+    except TypeError:
+        result = _apply(validator, raw)
+        if isinstance(result, EnvError):
+            result.key = key
+        return result
+    return _column_results(validator, [raw], key)[raw]
+
+
+def _validate_column(validator: EnValidator, column: List, key: str) -> Tuple[List, bool]:
+    """Validate a column of raw values (_MISSING where not set), once per distinct raw value.
+
+    Mutable results (eg. parsed Json) are revalidated for every repeated raw value,
+    so environments never share them.
+
+    :return: column results, and whether some are EnvErrors.
+    """
+    try:
+        uniques = dict.fromkeys(column)
+    except TypeError:
+        results = [_validate_one(validator, raw, key) for raw in column]
+        return results, any(isinstance(result, EnvError) for result in results)
+    results = _column_results(validator, list(uniques), key)
+    invalid = any(isinstance(result, EnvError) for result in results.values())
+    if all(isinstance(result, _SHAREABLE) for result in results.values()):
+        return list(map(results.__getitem__, column)), invalid
+    used = set()
+    column_results = []
+    for raw in column:
+        result = results[raw]
+        if not isinstance(result, _SHAREABLE):
+            if raw in used:
+                result = _apply(validator, validator.default if raw is _MISSING else raw)
+            used.add(raw)
+        column_results.append(result)
+    return column_results, invalid
+
+
+def read_env_many(
+    environments: Iterable[Mapping[str, str]], validators, result: str = "model"
+) -> Tuple[List, List[Dict[str, EnvError]]]:
+    """Validate many environments against the same validators, without reporting.
+
+    Environments are pivoted into per key columns, each distinct raw value is validated once,
+    and Number, Port and Bool columns run through vectorized kernels (NumPy when installed).
+    Validated columns are zipped back into per environment values.
+
+    :param environments: env var mappings (eg. one per container).
+    :param validators: An object that specifies the format of required vars, or an EnvSchema.
+    :param result: result backend, see EnvSchema.build.
+    :return: per environment results and per environment errors, in input order.
+    """
+    schema: EnvSchema = compile_schema(validators)
+    environments = list(environments)
+    errors: List[Dict[str, EnvError]] = [{} for _ in environments]
+    nested = schema.nested
+    keys = [key for key in schema.validators if key not in nested]
+    getters = [environment.get for environment in environments]
+    columns, invalid_keys = [], []
+    for key in keys:
+        column = [get(key, _MISSING) for get in getters]
+        column, invalid = _validate_column(schema.validators[key], column, key)
+        columns.append(column)
+        if invalid:
+            invalid_keys.append((key, column))
+    if columns:
+        cleaned = [dict(zip(keys, row)) for row in zip(*columns)]
+    else:
+        cleaned = [{} for _ in environments]
+    for key, column in invalid_keys:
+        for index, value in enumerate(column):
+            if isinstance(value, EnvError):
+                del cleaned[index][key]
+                errors[index][key] = value
+    if nested:
+        for index, environment in enumerate(environments):
+            nested_values, nested_errors = schema.validate(environment, nested)
+            values = cleaned[index]
+            values.update(nested_values)
+            cleaned[index] = {key: values[key] for key in schema.keys if key in values}
+            errors[index].update(nested_errors)
+    return [schema.build(values, result) for values in cleaned], errors
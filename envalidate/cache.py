@@ -0,0 +1,120 @@
+"""Validator Results Cache."""
+
+from collections import namedtuple, OrderedDict
+import copy
+import sys
+import threading
+from typing import Any, Hashable, Optional
+
+from .utils import freeze
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "maxbytes", "currsize", "bytes"])
+
+_IMMUTABLE = (str, bytes, bool, int, float, complex, type(None), frozenset)
+_MISS = object()
+
+
+class LRU:
+    """Bounded, thread safe, least recently used cache of validator results.
+
+    Keyed on (validator result key, raw value). Errors are cached too, and re-raised as copies.
+    Mutable results (eg. parsed json) are deep copied on every hit, or stored deeply frozen
+    and shared when frozen is set.
+    """
+
+    def __init__(self, maxsize: Optional[int] = 1024, maxbytes: int = None, frozen: bool = False):
+        """Init LRU.
+
+        :param maxsize: max entries, None for unbounded.
+        :param maxbytes: max approximate size of raw values and results, in bytes.
+        :param frozen: store deeply immutable results instead of copying them on hit.
+        """
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.frozen = frozen
+        self.hits = 0
+        self.misses = 0
+        self.bytes = 0
+        self.__entries__: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self.__lock__ = threading.Lock()
+
+    def __len__(self):
+        """Entries count."""
+        return len(self.__entries__)
+
+    def info(self) -> CacheInfo:
+        """Cache statistics."""
+        return CacheInfo(
+            self.hits, self.misses, self.maxsize, self.maxbytes, len(self.__entries__), self.bytes
+        )
+
+    def clear(self):
+        """Remove all entries, and reset statistics."""
+        with self.__lock__:
+            self.__entries__.clear()
+            self.hits = self.misses = self.bytes = 0
+
+    def get(self, key: Hashable) -> Any:
+        """Return cached (is_error, result), or None on miss."""
+        with self.__lock__:
+            entry = self.__entries__.get(key, _MISS)
+            if entry is _MISS:
+                self.misses += 1
+                return None
+            self.__entries__.move_to_end(key)
+            self.hits += 1
+        is_error, result, _ = entry
+        if is_error:
+            return True, _copy_error(result)
+        if self.frozen or isinstance(result, _IMMUTABLE):
+            return False, result
+        return False, copy.deepcopy(result)
+
+    def put(self, key: Hashable, result: Any, is_error: bool = False) -> Any:
+        """Cache a validator result, or error.
+
+        :return: the result to hand to the caller, frozen when frozen is set.
+        """
+        stored = result
+        if not is_error and not isinstance(result, _IMMUTABLE):
+            if self.frozen:
+                stored = result = freeze(result)
+            else:
+                stored = copy.deepcopy(result)
+        size = sys.getsizeof(key[-1]) + sys.getsizeof(stored)
+        if self.maxbytes is not None and size > self.maxbytes:
+            return result
+        with self.__lock__:
+            previous = self.__entries__.pop(key, None)
+            if previous is not None:
+                self.bytes -= previous[2]
+            self.__entries__[key] = (is_error, stored, size)
+            self.bytes += size
+            while (self.maxsize is not None and len(self.__entries__) > self.maxsize) or (
+                self.maxbytes is not None and self.bytes > self.maxbytes
+            ):
+                _, (_, _, evicted_size) = self.__entries__.popitem(last=False)
+                self.bytes -= evicted_size
+        return result
+
+
+def _copy_error(error: Exception) -> Exception:
+    """Copy a cached error, so each raise has its own traceback."""
+    try:
+        return copy.copy(error)
+    except TypeError:
+        return error
+
+
+_DEFAULT_CACHE: Optional[LRU] = None
+
+
+def set_default_cache(cache: Optional[LRU]):
+    """Set the cache used by validators without their own cache, None disables it."""
+    global _DEFAULT_CACHE  # pylint: disable=global-statement
+    _DEFAULT_CACHE = cache
+
+
+def get_default_cache() -> Optional[LRU]:
+    """Return the cache used by validators without their own cache."""
+    return _DEFAULT_CACHE
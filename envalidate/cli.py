@@ -0,0 +1,138 @@
+"""Command Line Interface.
+
+envalidate audit <schema-module> <paths...>
+"""
+
+import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from importlib import import_module
+import itertools
+import json
+import os
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .dotenv import validate_dotenv
+from .exceptions import EnvError
+from .schema import compile_schema, EnvSchema
+
+DEFAULT_VALIDATORS_ATTRIBUTE = "VALIDATORS"
+DEFAULT_CHUNKSIZE = 64
+
+_WORKER_SCHEMA: Optional[EnvSchema] = None
+
+
+def load_validators(spec: str):
+    """Import validators from "package.module[:attribute]".
+
+    :param spec: module path, and validators attribute (VALIDATORS by default).
+    """
+    module_name, _, attribute = spec.partition(":")
+    return getattr(import_module(module_name), attribute or DEFAULT_VALIDATORS_ATTRIBUTE)
+
+
+def iter_env_files(paths: Iterable[str]) -> Iterator[str]:
+    """Yield files, walking directories for ".env" and "*.env" files, lazily."""
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                if name.endswith(".env"):
+                    yield os.path.join(root, name)
+
+
+def audit_file(schema: EnvSchema, path: str) -> Dict[str, Any]:
+    """Validate a single dotenv file into an audit record."""
+    try:
+        _, errors = validate_dotenv(path, schema)
+    except (OSError, UnicodeDecodeError, EnvError) as ex:
+        return {"path": path, "valid": False, "error": str(ex)}
+    if path in errors:
+        return {"path": path, "valid": False, "error": str(errors[path])}
+    return {
+        "path": path,
+        "valid": not errors,
+        "errors": {key: error.message for key, error in errors.items()},
+    }
+
+
+def _init_worker(spec: str):
+    """Compile the schema once per worker process."""
+    global _WORKER_SCHEMA  # pylint: disable=global-statement
+    _WORKER_SCHEMA = compile_schema(load_validators(spec))
+
+
+def _audit_chunk(paths: List[str]) -> List[Dict[str, Any]]:
+    """Audit a chunk of files in a worker process."""
+    return [audit_file(_WORKER_SCHEMA, path) for path in paths]
+
+
+def _chunks(iterable: Iterable[str], size: int) -> Iterator[List[str]]:
+    """Split iterable into lists of size, lazily."""
+    iterator = iter(iterable)
+    chunk = list(itertools.islice(iterator, size))
+    while chunk:
+        yield chunk
+        chunk = list(itertools.islice(iterator, size))
+
+
+def audit(
+    spec: str, paths: Iterable[str], workers: int = None, chunksize: int = DEFAULT_CHUNKSIZE
+) -> Iterator[Dict[str, Any]]:
+    """Audit dotenv files, yielding one record per file, in input order.
+
+    Files are sharded in chunks across a process pool. Only a bounded number of chunks is in
+    flight at any time, so memory stays flat regardless of the number of files.
+
+    :param spec: validators spec, see load_validators.
+    :param paths: dotenv files or directories.
+    :param workers: worker processes (os.cpu_count() by default), 1 validates in process.
+    :param chunksize: files per work unit.
+    """
+    files = iter_env_files(paths)
+    if workers == 1:
+        schema = compile_schema(load_validators(spec))
+        for path in files:
+            yield audit_file(schema, path)
+        return
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(spec,)) as executor:
+        pending: deque = deque()
+        for chunk in _chunks(files, chunksize):
+            pending.append(executor.submit(_audit_chunk, chunk))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def _audit_command(args) -> int:
+    """Audit command, writing JSON lines to stdout."""
+    valid = True
+    for record in audit(args.schema, args.paths, args.workers, args.chunksize):
+        valid = valid and record["valid"]
+        sys.stdout.write(json.dumps(record) + "\n")
+    return 0 if valid else 1
+
+
+def main(argv: List[str] = None) -> int:
+    """Envalidate console script."""
+    parser = argparse.ArgumentParser(prog="envalidate")
+    commands = parser.add_subparsers(dest="command")
+    commands.required = True
+    audit_parser = commands.add_parser("audit", help="validate dotenv files, one JSON line each")
+    audit_parser.add_argument("schema", help="validators module, eg. package.module[:VALIDATORS]")
+    audit_parser.add_argument("paths", nargs="+", help="dotenv files or directories")
+    audit_parser.add_argument("-w", "--workers", type=int, default=None)
+    audit_parser.add_argument("-c", "--chunksize", type=int, default=DEFAULT_CHUNKSIZE)
+    audit_parser.set_defaults(handler=_audit_command)
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
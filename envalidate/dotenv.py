@@ -0,0 +1,166 @@
+"""Dotenv Files.
+
+Streaming parser over a memory mapped file, supporting comments, blank lines, "export "
+prefixes, single quoted (literal) values, double quoted values with escapes, and quoted
+values spanning multiple lines. Only the values of the requested keys are decoded.
+"""
+
+import mmap
+import re
+from typing import Any, Collection, Dict, Iterator, Optional, Tuple, Union
+
+from .exceptions import EnvError
+from .schema import EnvSchema
+
+_WHITESPACE = b" \t\r"
+_EXPORT = b"export"
+_DOUBLE_QUOTE = ord('"')
+_SINGLE_QUOTE = ord("'")
+_COMMENT = ord("#")
+_BACKSLASH = ord("\\")
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", '"': '"', "\\": "\\", "$": "$"}
+_ESCAPE_RE = re.compile(r"\\(.)", re.DOTALL)
+
+
+def _skip_whitespace(buf, pos: int, end: int) -> int:
+    """Return position of the first non whitespace byte."""
+    while pos < end and buf[pos] in _WHITESPACE:
+        pos += 1
+    return pos
+
+
+def _closing_quote(buf, pos: int, quote: int) -> int:
+    """Return position of the closing quote, -1 if unterminated."""
+    while True:
+        pos = buf.find(bytes((quote,)), pos)
+        if pos == -1 or quote == _SINGLE_QUOTE:
+            return pos
+        backslashes = 0
+        while buf[pos - 1 - backslashes] == _BACKSLASH:
+            backslashes += 1
+        if backslashes % 2 == 0:
+            return pos
+        pos += 1
+
+
+def _count_newlines(buf, start: int, end: int) -> int:
+    """Count newlines between start and end, without copying."""
+    count = 0
+    pos = buf.find(b"\n", start, end)
+    while pos != -1:
+        count += 1
+        pos = buf.find(b"\n", pos + 1, end)
+    return count
+
+
+def _comment_start(buf, start: int, end: int) -> int:
+    """Return position of the inline comment ("#" after a space or a tab), end if none."""
+    pos = buf.find(b"#", start + 1, end)
+    while pos != -1 and buf[pos - 1] not in _WHITESPACE:
+        pos = buf.find(b"#", pos + 1, end)
+    return end if pos == -1 else pos
+
+
+def _unescape(value: str) -> str:
+    """Replace double quoted escapes."""
+    return _ESCAPE_RE.sub(lambda match: _ESCAPES.get(match.group(1), match.group(0)), value)
+
+
+def parse_dotenv(
+    buf: Union[bytes, mmap.mmap], keys: Optional[Collection[str]] = None
+) -> Iterator[Tuple[str, str, int]]:
+    """Parse dotenv content into (key, value, line number) entries.
+
+    :param buf: dotenv content, eg. a memory mapped file.
+    :param keys: decode only the values of these keys, all keys by default.
+    """
+    wanted = None if keys is None else {key.encode("utf-8") for key in keys}
+    size = len(buf)
+    pos = 0
+    line = 1
+    while pos < size:
+        end = buf.find(b"\n", pos)
+        end = size if end == -1 else end
+        start = _skip_whitespace(buf, pos, end)
+        if start == end or buf[start] == _COMMENT:
+            pos = end + 1
+            line += 1
+            continue
+        if buf[start : start + len(_EXPORT) + 1] in (b"export ", b"export\t"):
+            start = _skip_whitespace(buf, start + len(_EXPORT), end)
+        equals = buf.find(b"=", start, end)
+        key = buf[start:equals].strip() if equals != -1 else b""
+        if not key:
+            raise EnvError(f"Invalid dotenv line {line}: missing key or '='")
+        value_start = _skip_whitespace(buf, equals + 1, end)
+        quote = buf[value_start] if value_start < end else None
+        newlines = 0
+        if quote in (_DOUBLE_QUOTE, _SINGLE_QUOTE):
+            value_start += 1
+            value_end = _closing_quote(buf, value_start, quote)
+            if value_end == -1:
+                raise EnvError(f"Invalid dotenv line {line}: unterminated quoted value")
+            newlines = _count_newlines(buf, value_start, value_end)
+            end = buf.find(b"\n", value_end)
+            end = size if end == -1 else end
+        else:
+            value_end = _comment_start(buf, value_start, end)
+            while value_end > value_start and buf[value_end - 1] in _WHITESPACE:
+                value_end -= 1
+        if wanted is None or key in wanted:
+            value = buf[value_start:value_end].decode("utf-8")
+            if quote == _DOUBLE_QUOTE:
+                value = _unescape(value)
+            yield key.decode("utf-8"), value, line
+        pos = end + 1
+        line += 1 + newlines
+
+
+def iter_dotenv(
+    path: str, keys: Optional[Collection[str]] = None
+) -> Iterator[Tuple[str, str, int]]:
+    """Stream (key, value, line number) entries of a memory mapped dotenv file.
+
+    :param path: dotenv file path.
+    :param keys: decode only the values of these keys, all keys by default.
+    """
+    with open(path, "rb") as file:
+        file.seek(0, 2)
+        if not file.tell():
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            yield from parse_dotenv(buf, keys)
+
+
+def load_dotenv(path: str, keys: Optional[Collection[str]] = None) -> Dict[str, str]:
+    """Load dotenv file into a dict, later entries overriding earlier ones.
+
+    :param path: dotenv file path.
+    :param keys: load only these keys, all keys by default.
+    """
+    return {key: value for key, value, _ in iter_dotenv(path, keys)}
+
+
+def validate_dotenv(path: str, schema: EnvSchema) -> Tuple[Dict[str, Any], Dict[str, EnvError]]:
+    """Validate dotenv file, without reporting.
+
+    Errors sources are the file path and line number, a malformed file is a single error keyed
+    by its path.
+
+    :param path: dotenv file path.
+    :param schema: compiled EnvSchema.
+    """
+    environment: Dict[str, str] = {}
+    lines: Dict[str, int] = {}
+    try:
+        for key, value, line in iter_dotenv(path, None if schema.nested else schema.keys):
+            environment[key] = value
+            lines[key] = line
+    except EnvError as ex:
+        ex.key = path
+        return {}, {path: ex}
+    cleaned, errors = schema.validate(environment)
+    for key, error in errors.items():
+        if key in lines:
+            error.source = f"{path}:{lines[key]}"
+    return cleaned, errors
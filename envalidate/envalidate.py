@@ -1,67 +1,101 @@
 """Main Envalidate."""
 
-from typing import Any, Dict
+from typing import Dict, Iterable, TYPE_CHECKING
 
-from pydantic import BaseModel, create_model
-
-from .exceptions import EnvError, EnvMissingError
-from .reporters import DefaultReporter, Reporter
+from .reporters import Reporter
+from .schema import compile_schema, DEFAULT_REPORTER, EnvSchema
 from .validators import EnValidator
 
-DEFAULT_REPORTER = DefaultReporter()
-
+if TYPE_CHECKING:  # pragma: no cover
+    from .instrumentation import Instrumentation
+    from .resolvers import SecretResolver
+    from .snapshot import SnapshotCache
 
-class FrozenModel(BaseModel):
-    """Frozen Model."""
+__all__ = ("DEFAULT_REPORTER", "FrozenModel", "read_env", "read_env_file")  # noqa: F822
 
-    @classmethod
-    def with_fields(cls, model_name, **field_definitions):
-        """Create FrozenModel with dynamic fields."""
-        return create_model(model_name, __base__=cls, **field_definitions)
 
-    class Config:
-        """Config."""
+def __getattr__(name):
+    """FrozenModel, imported on first access."""
+    if name != "FrozenModel":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from .models import FrozenModel  # pylint: disable=import-outside-toplevel
 
-        allow_mutation = False
-        arbitrary_types_allowed = True
-        allow_population_by_field_name = True
+    return FrozenModel
 
 
 def read_env(
-    environment, validators: Dict[str, EnValidator], reporter: Reporter = DEFAULT_REPORTER
+    environment,
+    validators: Dict[str, EnValidator],
+    reporter: Reporter = DEFAULT_REPORTER,
+    result: str = "model",
+    lazy: bool = False,
+    eager: Iterable[str] = (),
+    resolver: "SecretResolver" = None,
+    instrumentation: "Instrumentation" = None,
+    fail_fast: bool = False,
+    cheapest_first: bool = False,
+    snapshot: "SnapshotCache" = None,
 ):
     """Returns a sanitized, immutable environment object, and accepts three positional arguments.
 
     :param environment: An object containing your env vars (eg. os.environ)
-    :param validators: An object that specifies the format of required vars.
+    :param validators: An object that specifies the format of required vars,
+    or an EnvSchema compiled from it.
     :param reporter: Pass in a function to override the default error handling and console output.
     See reporters.py for the default implementation
+    :param result: "model" (default) returns a pydantic FrozenModel,
+    "slots" returns a lightweight FrozenEnv, see results.py.
+    :param lazy: return a LazyEnv, validating (and memoizing) each value on first access,
+    errors are reported through reporter on access, or all together by validate_all().
+    :param eager: keys validated immediately in lazy mode.
+    :param resolver: SecretResolver resolving references such as "vault://path#key"
+    before validation, see resolvers.py.
+    :param instrumentation: Instrumentation receiving per key timing events and aggregate
+    counters, see instrumentation.py. Disabled (None) by default.
+    :param fail_fast: stop validating at the first error, and report it alone.
+    :param cheapest_first: validate keys by ascending validator cost (eg. Str before Json), so
+    fail_fast reads reject broken environments sooner.
+    :param snapshot: SnapshotCache, loading the cleaned values from disk when the schema and the
+    raw values match a previous valid read, see snapshot.py.
     :return: By default, will log an error message and
     throw TypeError if any required env vars are missing or invalid.
     if all env are validated then Frozen CleanEnv will return.
     """
+    schema: EnvSchema = compile_schema(validators)
+    return schema.read(
+        environment,
+        reporter,
+        result,
+        lazy,
+        eager,
+        resolver,
+        instrumentation,
+        fail_fast,
+        cheapest_first,
+        snapshot,
+    )
+
+
+def read_env_file(
+    path: str,
+    validators: Dict[str, EnValidator],
+    reporter: Reporter = DEFAULT_REPORTER,
+    result: str = "model",
+):
+    """Returns a sanitized, immutable environment object, read from a dotenv file.
 
-    def read_key(_key, _validator, _environment) -> str:
-        """Read key value from environment."""
-        if _key not in _environment and not _validator.default:
-            raise EnvMissingError(_key)
-        return environment.get(_key, _validator.default)
+    The file is memory mapped and streamed, and only the values of the validators keys are
+    materialized. Errors messages include the file path and line number.
 
-    def create_frozen_model(values: Dict[str, Any]):
-        """Create frozen model."""
-        fields = {k: (type(v), ...) for k, v in values.items()}
-        env_model = FrozenModel.with_fields("CleanEnv", **fields)
-        return env_model(**values)
+    :param path: dotenv file path.
+    :param validators: An object that specifies the format of required vars,
+    or an EnvSchema compiled from it.
+    :param reporter: Pass in a function to override the default error handling and console output.
+    :param result: result backend, see read_env.
+    """
+    from .dotenv import validate_dotenv  # pylint: disable=import-outside-toplevel
 
-    cleaned_env: Dict[str, Any] = {}
-    errors: Dict[str, EnvError] = {}
-    for key, envalidator in validators.items():
-        try:
-            value = read_key(key, envalidator, environment)
-            valid_value = envalidator.envalidate(value)
-            cleaned_env[key] = valid_value
-        except (EnvError, EnvMissingError) as ex:
-            errors[key] = ex
+    schema: EnvSchema = compile_schema(validators)
+    cleaned_env, errors = validate_dotenv(path, schema)
     reporter.report(errors)
-
-    return create_frozen_model(cleaned_env)
+    return schema.build(cleaned_env, result)
@@ -1,21 +1,111 @@
 """Exceptions."""
 
+from typing import Any, Dict
+
 
 class EnvError(EnvironmentError):
-    """Env Error."""
+    """Env Error.
+
+    Carries structured fields (key, validator, raw value, reason and source), the message is
+    rendered from them on first access only.
+    """
 
-    def __init__(self, message):
+    def __init__(
+        self,
+        message: str = None,
+        key: str = None,
+        validator=None,
+        value: Any = None,
+        reason: str = None,
+        source: str = None,
+    ):
         """Init EnvError.
 
-        :param message:
+        :param message: error message, rendered from the other fields when not given.
+        :param key: env var name.
+        :param validator: EnValidator that rejected the value.
+        :param value: raw value.
+        :param reason: why the value was rejected, the value itself when not given.
+        :param source: name of the configuration source that supplied the value, see sources.py.
         """
-        super().__init__(message)
+        super().__init__(*(() if message is None else (message,)))
         self.__message__ = message
+        self.__key__ = key
+        self.__validator__ = validator
+        self.__value__ = value
+        self.__reason__ = reason
+        self.__source__ = source
 
     @property
     def message(self):
+        """Message, ending with the source of the value when known."""
+        if self.__message__ is None:
+            self.__message__ = self.render()
+        if self.__source__ is None:
+            return self.__message__
+        return f"{self.__message__} (from {self.__source__})"
+
+    @property
+    def key(self):
+        """Env var name."""
+        return self.__key__
+
+    @key.setter
+    def key(self, key: str):
+        """Set env var name."""
+        self.__key__ = key
+
+    @property
+    def validator(self):
+        """Validator."""
+        return self.__validator__
+
+    @property
+    def value(self):
+        """Raw value."""
+        return self.__value__
+
+    @property
+    def reason(self):
+        """Reason."""
+        return self.__reason__
+
+    @property
+    def source(self):
+        """Name of the configuration source that supplied the value."""
+        return self.__source__
+
+    @source.setter
+    def source(self, source: str):
+        """Set source name."""
+        self.__source__ = source
+
+    def render(self) -> str:
+        """Render message from the structured fields."""
+        if self.__validator__ is not None:
+            return self.__validator__.format_error(self.__value__, self.__reason__)
+        reason = self.__value__ if self.__reason__ is None else self.__reason__
+        return f"Invalid input: {reason}"
+
+    def __str__(self):
         """Message."""
-        return self.__message__
+        return self.message
+
+    def __reduce__(self):
+        """Pickle and copy support, keeping the structured fields (eg. across processes)."""
+        return _restore_error, (self.__class__, self.args, dict(self.__dict__))
+
+    def __repr__(self):
+        """Repr, rendering the message."""
+        return f"{self.__class__.__name__}({self.message!r})"
+
+
+def _restore_error(cls, args: tuple, state: Dict[str, Any]) -> EnvError:
+    """Rebuild a pickled or copied EnvError, without calling its __init__."""
+    error = cls.__new__(cls, *args)
+    error.args = args
+    error.__dict__.update(state)
+    return error
 
 
 class EnvMissingError(EnvError):
@@ -27,7 +117,7 @@ class EnvMissingError(EnvError):
         :param env_name:
         """
         message = "missing environment key"
-        super().__init__(message)
+        super().__init__(message, key=env_name, reason="missing")
         self.__env_name__ = env_name
 
     @property
@@ -0,0 +1,158 @@
+"""Instrumentation.
+
+Instrumentation receives an event before and after each key is validated, and aggregate counters
+once the read is done. Reads without instrumentation take the uninstrumented path, so disabled
+instrumentation costs nothing.
+"""
+
+from collections import namedtuple
+from typing import Any, Dict, List
+
+KeyEvent = namedtuple("KeyEvent", ["key", "validator", "duration", "outcome", "size"])
+KeyEvent.__doc__ = """Validation of a single key.
+
+duration is in seconds, outcome is one of OUTCOMES, size is the raw value length (None if
+missing).
+"""
+
+ReadStats = namedtuple("ReadStats", ["keys", "valid", "invalid", "missing", "duration", "size"])
+ReadStats.__doc__ = """Aggregate counters of a read, duration in seconds, size in characters."""
+
+OUTCOMES = ("valid", "invalid", "missing")
+
+
+class Instrumentation:
+    """No-op instrumentation, override the hooks of interest."""
+
+    def read_started(self, keys: int):
+        """Read started.
+
+        :param keys: number of keys to validate.
+        """
+
+    def key_started(self, key: str, validator: str):
+        """Key validation started.
+
+        :param key: env var name.
+        :param validator: validator class name.
+        """
+
+    def key_finished(self, event: KeyEvent):
+        """Key validation finished.
+
+        :param event: key validation event.
+        """
+
+    def read_finished(self, stats: ReadStats):
+        """Read finished.
+
+        :param stats: aggregate counters.
+        """
+
+
+class ProfileInstrumentation(Instrumentation):
+    """Collects key events, and formats a text profile of the slowest keys."""
+
+    def __init__(self):
+        """Init ProfileInstrumentation."""
+        self.events: List[KeyEvent] = []
+        self.stats: List[ReadStats] = []
+
+    def key_finished(self, event: KeyEvent):
+        """Collect event."""
+        self.events.append(event)
+
+    def read_finished(self, stats: ReadStats):
+        """Collect stats."""
+        self.stats.append(stats)
+
+    def slowest(self, limit: int = 10) -> List[KeyEvent]:
+        """Slowest key events first."""
+        return sorted(self.events, key=lambda event: event.duration, reverse=True)[:limit]
+
+    def report(self, limit: int = 10) -> str:
+        """Text profile of the slowest keys.
+
+        :param limit: max keys listed.
+        """
+        total = sum(event.duration for event in self.events) or 1.0
+        lines = [f"{'key':<32} {'validator':<16} {'outcome':<8} {'size':>8} {'ms':>10} {'%':>6}"]
+        for event in self.slowest(limit):
+            size = "-" if event.size is None else event.size
+            lines.append(
+                f"{event.key:<32} {event.validator:<16} {event.outcome:<8} {size:>8} "
+                f"{event.duration * 1e3:>10.3f} {event.duration / total:>6.1%}"
+            )
+        if self.stats:
+            stats = self.stats[-1]
+            lines.append(
+                f"{stats.keys} keys, {stats.valid} valid, {stats.invalid} invalid, "
+                f"{stats.missing} missing, {stats.duration * 1e3:.3f} ms"
+            )
+        return "\n".join(lines)
+
+    def clear(self):
+        """Clear collected events and stats."""
+        self.events.clear()
+        self.stats.clear()
+
+
+class SpanInstrumentation(Instrumentation):
+    """Emits OpenTelemetry style spans, an "envalidate.read_env" span with a child span per key.
+
+    Works with an opentelemetry.trace.Tracer, or any tracer exposing
+    start_span(name, context=None) returning spans with set_attribute(key, value) and end().
+    """
+
+    def __init__(self, tracer=None):
+        """Init SpanInstrumentation.
+
+        :param tracer: tracer, opentelemetry.trace.get_tracer("envalidate") by default.
+        """
+        if tracer is None:
+            from opentelemetry import trace  # pylint: disable=import-outside-toplevel
+
+            tracer = trace.get_tracer("envalidate")
+        self.tracer = tracer
+        self.__read_span__ = None
+        self.__context__ = None
+        self.__key_spans__: Dict[str, Any] = {}
+
+    def _child_context(self, span):
+        """Context whose current span is span, None without opentelemetry."""
+        try:
+            from opentelemetry import trace  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            return None
+        return trace.set_span_in_context(span)
+
+    def read_started(self, keys: int):
+        """Start read span."""
+        self.__read_span__ = self.tracer.start_span("envalidate.read_env")
+        self.__read_span__.set_attribute("envalidate.keys", keys)
+        self.__context__ = self._child_context(self.__read_span__)
+
+    def key_started(self, key: str, validator: str):
+        """Start key span."""
+        span = self.tracer.start_span(f"envalidate.validate {key}", context=self.__context__)
+        span.set_attribute("envalidate.key", key)
+        span.set_attribute("envalidate.validator", validator)
+        self.__key_spans__[key] = span
+
+    def key_finished(self, event: KeyEvent):
+        """End key span."""
+        span = self.__key_spans__.pop(event.key)
+        span.set_attribute("envalidate.outcome", event.outcome)
+        if event.size is not None:
+            span.set_attribute("envalidate.size", event.size)
+        span.end()
+
+    def read_finished(self, stats: ReadStats):
+        """End read span."""
+        span, self.__read_span__, self.__context__ = self.__read_span__, None, None
+        if span is None:
+            return
+        for name, value in stats._asdict().items():
+            if name != "duration":
+                span.set_attribute(f"envalidate.{name}", value)
+        span.end()
@@ -0,0 +1,350 @@
+"""JSON Schema.
+
+A JSON Schema subset compiled once into nested checker functions, so validating a parsed value
+walks the schema without re-reading its keywords. Supported keywords: type, enum, const,
+properties, required, additionalProperties, minProperties, maxProperties, items, minItems,
+maxItems, uniqueItems, minLength, maxLength, pattern, minimum, maximum, exclusiveMinimum,
+exclusiveMaximum, allOf, anyOf, oneOf and not. Annotations (title, description, default,
+format...) are ignored. Schemas using other keywords (eg. $ref) need the jsonschema package
+(envalidate[jsonschema]), which compiles them once, and are rejected when compiling otherwise,
+so a schema is never silently checked differently depending on the installed packages.
+
+Like JSON Schema, enum, const and uniqueItems compare booleans and numbers as distinct values,
+at any depth (True does not equal 1).
+"""
+
+from typing import Any, Callable, Hashable, List, Mapping
+
+Checker = Callable[[Any, str], None]
+
+ANNOTATIONS = frozenset(
+    {
+        "$schema",
+        "$id",
+        "$comment",
+        "title",
+        "description",
+        "default",
+        "examples",
+        "example",
+        "format",
+    }
+)
+_NUMBER_BOUNDS = {
+    "minimum": (lambda value, bound: value >= bound, "less than"),
+    "maximum": (lambda value, bound: value <= bound, "greater than"),
+    "exclusiveMinimum": (lambda value, bound: value > bound, "less than or equal to"),
+    "exclusiveMaximum": (lambda value, bound: value < bound, "greater than or equal to"),
+}
+_TYPES = frozenset({"object", "array", "string", "boolean", "null", "number", "integer"})
+_SIZES = {
+    "minLength": (str, "characters", False),
+    "maxLength": (str, "characters", True),
+    "minItems": ((list, tuple), "items", False),
+    "maxItems": ((list, tuple), "items", True),
+    "minProperties": (Mapping, "properties", False),
+    "maxProperties": (Mapping, "properties", True),
+}
+
+
+class JsonSchemaError(ValueError):
+    """Parsed value not matching the schema."""
+
+    def __init__(self, path: str, message: str):
+        """Init JsonSchemaError.
+
+        :param path: path of the rejected value, eg. "$.hosts[0]".
+        :param message: what is wrong with the value.
+        """
+        super().__init__(path, message)
+        self.path = path
+        self.message = message
+
+    def __str__(self):
+        """Path and message."""
+        return f"{self.path}: {self.message}"
+
+
+def _is_type(value: Any, name: str) -> bool:
+    """JSON type check, booleans are not numbers, integral floats are integers."""
+    if name == "object":
+        return isinstance(value, Mapping)
+    if name == "array":
+        return isinstance(value, (list, tuple))
+    if name == "string":
+        return isinstance(value, str)
+    if name == "boolean":
+        return isinstance(value, bool)
+    if name == "null":
+        return value is None
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return False
+    return name == "number" or isinstance(value, int) or float.is_integer(value)
+
+
+def _type_checker(types) -> Checker:
+    """Check the value type."""
+    names = (types,) if isinstance(types, str) else tuple(types)
+    unknown = [name for name in names if name not in _TYPES]
+    if unknown:
+        raise ValueError(f"Unsupported JSON Schema type: {', '.join(map(str, unknown))}")
+
+    def check(value, path):
+        if not any(_is_type(value, name) for name in names):
+            raise JsonSchemaError(path, f"expected {' or '.join(names)}")
+
+    return check
+
+
+def _size_checker(keyword: str, bound: int) -> Checker:
+    """Check strings, arrays or objects size."""
+    kinds, unit, is_max = _SIZES[keyword]
+    message = f"expected {'at most' if is_max else 'at least'} {bound} {unit}"
+
+    def check(value, path):
+        if isinstance(value, kinds) and (len(value) > bound if is_max else len(value) < bound):
+            raise JsonSchemaError(path, message)
+
+    return check
+
+
+def _bound_checker(keyword: str, bound) -> Checker:
+    """Check numbers bounds."""
+    compare, failure = _NUMBER_BOUNDS[keyword]
+
+    def check(value, path):
+        if _is_type(value, "number") and not compare(value, bound):
+            raise JsonSchemaError(path, f"{value} is {failure} {bound}")
+
+    return check
+
+
+def _pattern_checker(pattern: str) -> Checker:
+    """Check strings match pattern."""
+    import re  # pylint: disable=import-outside-toplevel
+
+    search = re.compile(pattern).search
+
+    def check(value, path):
+        if isinstance(value, str) and not search(value):
+            raise JsonSchemaError(path, f"does not match {pattern}")
+
+    return check
+
+
+def _json_key(value: Any) -> Hashable:
+    """Comparison key of a JSON value, booleans distinct from numbers at any depth."""
+    if isinstance(value, bool):
+        return bool, value
+    if isinstance(value, (int, float)):
+        return float, value
+    if isinstance(value, Mapping):
+        return Mapping, frozenset((key, _json_key(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return list, tuple(_json_key(item) for item in value)
+    return type(value), value
+
+
+def _values_checker(keyword: str, values) -> Checker:
+    """Check enum or const values."""
+    allowed = list(values) if keyword == "enum" else [values]
+    keys = frozenset(_json_key(item) for item in allowed)
+
+    def check(value, path):
+        if _json_key(value) not in keys:
+            raise JsonSchemaError(path, f"{value!r} not in {allowed!r}")
+
+    return check
+
+
+def _unique_checker(_, unique: bool) -> Checker:
+    """Check array items are unique."""
+    if not unique:
+        return _accept
+
+    def check(value, path):
+        if isinstance(value, (list, tuple)):
+            seen = set()
+            for position, item in enumerate(value):
+                key = _json_key(item)
+                if key in seen:
+                    raise JsonSchemaError(f"{path}[{position}]", "duplicate item")
+                seen.add(key)
+
+    return check
+
+
+def _object_checker(schema: Mapping[str, Any]) -> Checker:
+    """Check object properties, required and additional properties."""
+    properties = {key: _compile(item) for key, item in schema.get("properties", {}).items()}
+    required = tuple(schema.get("required", ()))
+    additional = schema.get("additionalProperties", True)
+    additional = None if additional is True else _compile(additional)
+
+    def check(value, path):
+        if not isinstance(value, Mapping):
+            return
+        for key in required:
+            if key not in value:
+                raise JsonSchemaError(path, f"missing required property {key!r}")
+        for key, item in value.items():
+            checker = properties.get(key, additional)
+            if checker is not None:
+                checker(item, f"{path}.{key}")
+
+    return check
+
+
+def _items_checker(_, items) -> Checker:
+    """Check every array item."""
+    if not isinstance(items, (Mapping, bool)):
+        raise ValueError("Unsupported JSON Schema items: only a single schema is supported")
+    item_checker = _compile(items)
+
+    def check(value, path):
+        if isinstance(value, (list, tuple)):
+            for position, item in enumerate(value):
+                item_checker(item, f"{path}[{position}]")
+
+    return check
+
+
+def _not_checker(_, schema) -> Checker:
+    """Check the value does not match schema."""
+    negated = _compile(schema)
+
+    def check(value, path):
+        try:
+            negated(value, path)
+        except JsonSchemaError:
+            return
+        raise JsonSchemaError(path, "matches a schema it must not match")
+
+    return check
+
+
+def _combination_checker(keyword: str, schemas) -> Checker:
+    """Check allOf, anyOf or oneOf."""
+    checkers = [_compile(item) for item in schemas]
+    if keyword == "allOf":
+        return _all_checker(checkers)
+
+    def check(value, path):
+        matches = 0
+        for checker in checkers:
+            try:
+                checker(value, path)
+            except JsonSchemaError:
+                continue
+            if keyword == "anyOf":
+                return
+            matches += 1
+        if keyword == "anyOf":
+            raise JsonSchemaError(path, f"none of {len(checkers)} schemas match")
+        if matches != 1:
+            raise JsonSchemaError(path, f"{matches} of {len(checkers)} schemas match, expected one")
+
+    return check
+
+
+def _all_checker(checkers: List[Checker]) -> Checker:
+    """Run every checker."""
+    if len(checkers) == 1:
+        return checkers[0]
+
+    def check(value, path):
+        for checker in checkers:
+            checker(value, path)
+
+    return check
+
+
+def _accept(value, path):
+    """Accept any value."""
+
+
+def _reject(value, path):
+    """Reject any value."""
+    raise JsonSchemaError(path, "no value is allowed")
+
+
+_OBJECT_KEYWORDS = frozenset({"properties", "required", "additionalProperties"})
+_FACTORIES = {
+    "type": lambda _, types: _type_checker(types),
+    "enum": _values_checker,
+    "const": _values_checker,
+    "items": _items_checker,
+    "uniqueItems": _unique_checker,
+    "pattern": lambda _, pattern: _pattern_checker(pattern),
+    "not": _not_checker,
+    "allOf": _combination_checker,
+    "anyOf": _combination_checker,
+    "oneOf": _combination_checker,
+    **dict.fromkeys(_SIZES, _size_checker),
+    **dict.fromkeys(_NUMBER_BOUNDS, _bound_checker),
+}
+
+
+def _compile(schema) -> Checker:
+    """Compile a schema into a checker, raising JsonSchemaError."""
+    if schema is True:
+        return _accept
+    if schema is False:
+        return _reject
+    if not isinstance(schema, Mapping):
+        raise ValueError(f"JSON Schema must be an object or a boolean, not {schema!r}")
+    checkers: List[Checker] = []
+    for keyword, argument in sorted(schema.items(), key=lambda item: item[0] != "type"):
+        if keyword in ANNOTATIONS or keyword in _OBJECT_KEYWORDS:
+            continue
+        factory = _FACTORIES.get(keyword)
+        if factory is None:
+            raise ValueError(f"Unsupported JSON Schema keyword: {keyword}")
+        checkers.append(factory(keyword, argument))
+    if not _OBJECT_KEYWORDS.isdisjoint(schema):
+        checkers.append(_object_checker(schema))
+    return _all_checker(checkers) if checkers else _accept
+
+
+def _jsonschema_checker(schema) -> Checker:
+    """Check with the jsonschema package, raising ImportError when not installed."""
+    import jsonschema  # pylint: disable=import-outside-toplevel
+
+    cls = jsonschema.validators.validator_for(schema)
+    try:
+        cls.check_schema(schema)
+    except jsonschema.SchemaError as ex:
+        raise ValueError(f"Invalid JSON Schema: {ex.message}") from ex
+    iter_errors = cls(schema).iter_errors
+
+    def check(value, path):
+        error = jsonschema.exceptions.best_match(iter_errors(value))
+        if error is not None:
+            parts = (f"[{part}]" if isinstance(part, int) else f".{part}" for part in error.path)
+            raise JsonSchemaError(path + "".join(parts), error.message)
+
+    return check
+
+
+def compile_json_schema(schema) -> Callable[[Any], None]:
+    """Compile a JSON Schema into a checker, raising JsonSchemaError on mismatch.
+
+    Schemas outside the supported subset are checked by jsonschema, and rejected with ValueError
+    when it is not installed.
+
+    :param schema: JSON Schema, as a dict (or a boolean).
+    """
+    try:
+        checker = _compile(schema)
+    except ValueError as unsupported:
+        try:
+            checker = _jsonschema_checker(schema)
+        except ImportError:
+            raise ValueError(
+                f"{unsupported}, install envalidate[jsonschema] to check the full JSON Schema"
+            ) from None
+
+    def check(value):
+        checker(value, "$")
+
+    return check
@@ -0,0 +1,128 @@
+"""Live Environment."""
+
+from collections import namedtuple
+import threading
+from typing import Any, Dict, Mapping
+
+from .exceptions import EnvError
+from .reporters import Reporter
+from .schema import compile_schema, DEFAULT_REPORTER, EnvSchema
+
+EnvDiff = namedtuple("EnvDiff", ["added", "changed", "removed", "invalid"])
+EnvDiff.__doc__ = """Keys affected by a LiveEnv refresh, each a tuple of env var names."""
+
+_MISSING = object()
+_UNSEEN = object()
+
+
+class LiveEnv:
+    """Validated environment, revalidating only the keys whose raw value changed.
+
+    Unchanged values are shared between successive results. Keys that become invalid are
+    reported, and keep their last valid value (the whole group or pattern mapping when one of
+    their env vars is invalid).
+    """
+
+    def __init__(
+        self,
+        environment: Mapping[str, str],
+        validators,
+        reporter: Reporter = DEFAULT_REPORTER,
+        result: str = "slots",
+    ):
+        """Init LiveEnv, validating the whole environment.
+
+        :param environment: An object containing your env vars (eg. os.environ)
+        :param validators: An object that specifies the format of required vars, or an EnvSchema.
+        :param reporter: Reporter handling errors, see reporters.py.
+        :param result: result backend, see EnvSchema.build.
+        """
+        self.__environment__ = environment
+        self.__schema__: EnvSchema = compile_schema(validators)
+        self.__reporter__ = reporter
+        self.__result__ = result
+        self.__raw__: Dict[str, Any] = {}
+        self.__values__: Dict[str, Any] = {}
+        self.__errors__: Dict[str, EnvError] = {}
+        self.__owners__: Dict[str, str] = {}
+        self.__env__ = None
+        self.__lock__ = threading.Lock()
+        self.refresh()
+
+    @property
+    def env(self):
+        """Current frozen environment."""
+        return self.__env__
+
+    @property
+    def errors(self) -> Mapping[str, EnvError]:
+        """Errors of the keys currently invalid."""
+        return dict(self.__errors__)
+
+    def refresh(self, environment: Mapping[str, str] = None) -> EnvDiff:
+        """Revalidate keys whose raw value changed since the last refresh.
+
+        :param environment: new env vars mapping, the last one (eg. os.environ) by default.
+        :return: EnvDiff of added, changed, removed and newly invalid keys.
+        """
+        with self.__lock__:
+            if environment is not None:
+                self.__environment__ = environment
+            environment = self.__environment__
+            seen = self.__raw__
+            current = self.__schema__.raw(environment)
+            raw = {}
+            for key in self.__schema__.keys:
+                value = current.get(key, _MISSING)
+                if seen.get(key, _UNSEEN) != value:
+                    raw[key] = value
+            if not raw:
+                return EnvDiff((), (), (), ())
+
+            cleaned, errors = self.__schema__.validate(environment, raw)
+            self.__reporter__.report(errors)
+
+            previous = self.__values__
+            owners = self._owners(errors, current)
+            invalid = set(owners.values())
+            cleaned = {k: v for k, v in cleaned.items() if k not in invalid or k not in previous}
+            removed = tuple(key for key, value in raw.items() if value is _MISSING and key in seen)
+            diff = EnvDiff(
+                added=tuple(key for key in cleaned if key not in previous and key not in removed),
+                changed=tuple(key for key in cleaned if key in previous and key not in removed),
+                removed=removed,
+                invalid=tuple(key for key in errors if key not in self.__errors__),
+            )
+            values = dict(previous)
+            values.update(cleaned)
+            kept = {k: v for k, v in self.__errors__.items() if self.__owners__[k] not in raw}
+            self.__owners__ = {k: self.__owners__[k] for k in kept}
+            self.__owners__.update(owners)
+            kept.update(errors)
+            seen.update(raw)
+            self.__values__ = values
+            self.__errors__ = kept
+            self.__env__ = self.__schema__.build(values, self.__result__)
+            return diff
+
+    def _owners(self, errors: Mapping[str, EnvError], current: Mapping[str, Any]) -> Dict[str, str]:
+        """Schema key of each error, errors of groups and patterns are keyed by env var name.
+
+        :param errors: errors, keyed by env var name.
+        :param current: raw values, see EnvSchema.raw.
+        """
+        schema = self.__schema__
+        validators = schema.validators
+        patterns = schema.patterns
+        prefixes = sorted(
+            ((validators[key].prefix, key) for key in schema.groups), key=lambda item: -len(item[0])
+        )
+        owners = {}
+        for name in errors:
+            owner = name if name in validators else None
+            if owner is None:
+                owner = next((key for key in patterns if name in current.get(key, ())), None)
+            if owner is None:
+                owner = next((key for prefix, key in prefixes if name.startswith(prefix)), name)
+            owners[name] = owner
+        return owners
@@ -0,0 +1,43 @@
+"""Pydantic Models.
+
+Imported on first use by the "model" result backend and the schema metadata export, so reading
+"slots" results does not load pydantic.
+"""
+
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
+
+from pydantic import BaseModel, create_model, Field, PrivateAttr
+
+
+class FrozenModel(BaseModel):
+    """Frozen Model."""
+
+    _provenance: Mapping[str, str] = PrivateAttr(default_factory=dict)
+
+    @classmethod
+    def with_fields(cls, model_name, **field_definitions):
+        """Create FrozenModel with dynamic fields."""
+        return create_model(model_name, __base__=cls, **field_definitions)
+
+    def provenance(self) -> Mapping[str, str]:
+        """Read only mapping of the source name per env var name.
+
+        Empty unless read from Sources.
+        """
+        return MappingProxyType(self._provenance)
+
+    class Config:
+        """Config."""
+
+        allow_mutation = False
+        arbitrary_types_allowed = True
+        allow_population_by_field_name = True
+
+
+def metadata_field(metadata: Dict[str, Any]):
+    """Pydantic Field documenting a validator metadata, see EnValidator.metadata."""
+    metadata = {key: value for key, value in metadata.items() if value is not None}
+    default = metadata.pop("default", ...)
+    description = metadata.pop("desc", None)
+    return Field(default, description=description, **metadata)
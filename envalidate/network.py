@@ -0,0 +1,177 @@
+"""IP Networks.
+
+The ipaddress module is imported on first parse, so importing validators stays cheap.
+"""
+
+from functools import lru_cache
+from typing import Dict, Iterable, NamedTuple, Tuple, TYPE_CHECKING, Union
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ipaddress import IPv4Address, IPv4Network, IPv6Address, IPv6Network
+
+Address = Union["IPv4Address", "IPv6Address"]
+Network = Union["IPv4Network", "IPv6Network"]
+_BITS = {4: 32, 6: 128}
+ADDRESS_CACHE_SIZE = 4096
+
+
+class Endpoint(NamedTuple):
+    """Ip address and port."""
+
+    address: Address
+    port: int
+
+    def __str__(self):
+        """Address and port, ipv6 addresses in brackets."""
+        if self.address.version == 6:
+            return f"[{self.address}]:{self.port}"
+        return f"{self.address}:{self.port}"
+
+
+class NetworkSet(frozenset):
+    """Frozen set of networks (or single addresses), matching the addresses they contain.
+
+    Networks are compiled into a prefix table per ip version: one hash set of network prefixes
+    per distinct prefix length, from the broadest. An address lookup costs at most one hash
+    lookup per prefix length (O(prefix length)) whatever the number of networks, instead of a
+    scan. Compile a NetworkSet once and pass it as choices to share it between validators.
+    """
+
+    __slots__ = ("__tables__", "__endpoints__")
+
+    def __new__(cls, networks: Iterable = ()):
+        """Compile networks.
+
+        :param networks: networks and addresses, as strings (eg. "10.0.0.0/8", "::1") or
+        ipaddress objects. Networks with host bits set are rejected. Addresses with a port
+        (eg. "10.0.0.1:8000", "[::1]:8000") only match that exact endpoint.
+        """
+        from ipaddress import ip_network  # pylint: disable=import-outside-toplevel
+
+        self = super().__new__(cls, (str(network) for network in networks))
+        levels: Dict[int, Dict[int, set]] = {4: {}, 6: {}}
+        endpoints = set()
+        for entry in self:
+            try:
+                network = ip_network(entry)
+            except ValueError:
+                endpoint = _endpoint(entry)
+                if endpoint is None:
+                    raise
+                endpoints.add(endpoint)
+                continue
+            shift = network.max_prefixlen - network.prefixlen
+            by_length = levels[network.version].setdefault(network.prefixlen, set())
+            by_length.add(int(network.network_address) >> shift)
+        self.__tables__ = {
+            version: tuple(
+                (length, _BITS[version] - length, frozenset(prefixes))
+                for length, prefixes in sorted(by_length.items())
+            )
+            for version, by_length in levels.items()
+        }
+        self.__endpoints__ = frozenset(endpoints)
+        return self
+
+    def __contains__(self, value) -> bool:
+        """Whether value (an address, endpoint or network, or their string) is in a network."""
+        if isinstance(value, str):
+            if frozenset.__contains__(self, value):
+                return True
+            value = _parse(value) or _endpoint(value)
+            if value is None:
+                return False
+        if isinstance(value, Endpoint):
+            if value in self.__endpoints__:
+                return True
+            value = value.address
+        network_address = getattr(value, "network_address", None)
+        if network_address is not None:
+            length, integer = value.prefixlen, int(network_address)
+        elif hasattr(value, "max_prefixlen"):
+            length, integer = value.max_prefixlen, int(value)
+        else:
+            return False
+        return self.match(value.version, integer, length)
+
+    def match(self, version: int, integer: int, length: int) -> bool:
+        """Whether the prefix of length bits of integer is in a network.
+
+        :param version: ip version, 4 or 6.
+        :param integer: address as an integer.
+        :param length: prefix length, the address length for single addresses.
+        """
+        for prefix_length, shift, prefixes in self.__tables__[version]:
+            if prefix_length > length:
+                return False
+            if integer >> shift in prefixes:
+                return True
+        return False
+
+    def __reduce__(self):
+        """Pickle as the networks, compiled again when loading."""
+        return self.__class__, (tuple(self),)
+
+    def __repr__(self):
+        """Repr, summarized for large sets."""
+        if len(self) > 8:
+            return f"{self.__class__.__name__}({len(self)} networks)"
+        return f"{self.__class__.__name__}({sorted(self)!r})"
+
+
+@lru_cache(maxsize=ADDRESS_CACHE_SIZE)
+def parse_address(value: str) -> Address:
+    """Parse an ip address, memoized per string as ipaddress parsing is costly.
+
+    :param value: eg. "10.0.0.1" or "::1".
+    """
+    from ipaddress import ip_address  # pylint: disable=import-outside-toplevel
+
+    return ip_address(value)
+
+
+@lru_cache(maxsize=ADDRESS_CACHE_SIZE)
+def parse_network(value: str) -> Network:
+    """Parse a network (without host bits), memoized per string.
+
+    :param value: eg. "10.0.0.0/8".
+    """
+    from ipaddress import ip_network  # pylint: disable=import-outside-toplevel
+
+    return ip_network(value)
+
+
+def _parse(value: str) -> Union[Address, Network, None]:
+    """Parse an address or a network, None when invalid."""
+    try:
+        return parse_network(value) if "/" in value else parse_address(value)
+    except ValueError:
+        return None
+
+
+def _endpoint(value: str) -> Union[Endpoint, None]:
+    """Parse an address with a port, None when value has no port or is invalid."""
+    try:
+        host, port = parse_endpoint(value)
+        if port is None or "/" in host:
+            return None
+        return Endpoint(parse_address(host), int(port))
+    except ValueError:
+        return None
+
+
+def parse_endpoint(value: str) -> Tuple[str, Union[str, None]]:
+    """Split value into host and port strings, ipv6 addresses with a port being in brackets.
+
+    :param value: eg. "10.0.0.1", "10.0.0.1:8000", "::1" or "[::1]:8000".
+    :return: host and port, None when value has no port.
+    """
+    if value.startswith("["):
+        host, bracket, rest = value[1:].partition("]")
+        if not bracket or rest and rest[0] != ":":
+            raise ValueError("expected [address]:port")
+        return host, rest[1:] if rest else None
+    if value.count(":") == 1:
+        host, _, port = value.partition(":")
+        return host, port
+    return value, None
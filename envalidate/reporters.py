@@ -2,7 +2,8 @@
 
 from abc import ABC, abstractmethod
 import logging
-from typing import Callable, Dict, List
+import sys
+from typing import Any, Callable, Dict, Iterable, List
 
 from .exceptions import EnvError, EnvMissingError
 
@@ -36,6 +37,16 @@ class Reporter(ABC):
         :param errors:
         """
 
+    def fail(self, errors: Dict[str, EnvError]):
+        """Call on_error, or raise TypeError when not set.
+
+        :param errors:
+        """
+        if self.__on_error__:
+            self.__on_error__(errors)
+        else:
+            raise TypeError("Environment validation failed")
+
 
 class DefaultReporter(Reporter):
     """Default Reporter.
@@ -70,8 +81,113 @@ class DefaultReporter(Reporter):
         output = "\n".join([rule, "\n".join(invalid_vars), "\n".join(missing_vars), rule])
 
         self.__logger__.error(output)
+        self.fail(errors)
 
-        if self.__on_error__:
-            self.__on_error__(errors)
-        else:
-            raise TypeError("Environment validation failed")
+
+class JsonReporter(Reporter):
+    """Logs one JSON record per error, for machines parsing the output.
+
+    {"key": "PORT", "error": "invalid", "validator": "port", "message": "Invalid port input: x"}
+    """
+
+    def __init__(self, logger=None, on_error: Callable[[Dict[str, EnvError]], None] = None):
+        """Init JsonReporter."""
+        super().__init__(logger=logger, on_error=on_error)
+
+    @staticmethod
+    def record(key: str, error: EnvError) -> Dict[str, Any]:
+        """Structured record of an error."""
+        validator = error.validator
+        return {
+            "key": key,
+            "error": "missing" if isinstance(error, EnvMissingError) else "invalid",
+            "validator": getattr(validator, "name", None),
+            "message": error.message,
+        }
+
+    def report(self, errors: Dict[str, EnvError]):
+        """Create report, a log record per error.
+
+        :param errors:
+        """
+        if not errors:
+            return
+        import json  # pylint: disable=import-outside-toplevel
+
+        logger = self.__logger__
+        for key, error in errors.items():
+            record = self.record(key, error)
+            logger.error(json.dumps(record), extra={"envalidate": record})
+        self.fail(errors)
+
+
+class QueueReporter(Reporter):
+    """Wraps a reporter, handing its log records to a background thread.
+
+    A copy of the wrapped reporter logs through a QueueHandler, a QueueListener writes the
+    records to handlers, so the caller never blocks on slow log sinks. Records are flushed
+    before the wrapped reporter raises TypeError.
+    """
+
+    def __init__(self, reporter: Reporter, handlers: Iterable[logging.Handler] = None):
+        """Init QueueReporter.
+
+        :param reporter: wrapped reporter, left unchanged (eg. DEFAULT_REPORTER keeps logging
+        synchronously for other callers).
+        :param handlers: handlers writing the records, the handlers of the wrapped reporter
+        logger (or of the root logger) by default, or stderr.
+        """
+        # pylint: disable=import-outside-toplevel
+        import copy
+        from logging.handlers import QueueHandler, QueueListener
+        import queue
+
+        if handlers is None:
+            handlers = _effective_handlers(reporter.__logger__) or [
+                logging.StreamHandler(sys.stderr)
+            ]
+        self.__queue__ = queue.Queue()
+        queue_logger = logging.Logger(reporter.__logger__.name)
+        queue_logger.addHandler(QueueHandler(self.__queue__))
+        super().__init__(logger=queue_logger)
+        self.__reporter__ = reporter
+        self.__queued__ = copy.copy(reporter)
+        self.__queued__.__logger__ = queue_logger
+        self.__listener__ = QueueListener(self.__queue__, *handlers, respect_handler_level=True)
+        self.__listener__.start()
+
+    @property
+    def reporter(self) -> Reporter:
+        """Wrapped reporter."""
+        return self.__reporter__
+
+    def report(self, errors: Dict[str, EnvError]):
+        """Create report through the wrapped reporter, flushing before raising.
+
+        :param errors:
+        """
+        try:
+            self.__queued__.report(errors)
+        except TypeError:
+            self.flush()
+            raise
+
+    def flush(self):
+        """Wait until queued records are handled."""
+        self.__queue__.join()
+
+    def close(self):
+        """Flush, and stop the background thread."""
+        self.__listener__.stop()
+
+
+def _effective_handlers(logger: logging.Logger) -> List[logging.Handler]:
+    """Handlers a logger record would reach, following propagation."""
+    handlers: List[logging.Handler] = []
+    current = logger
+    while current:
+        handlers.extend(current.handlers)
+        if not current.propagate:
+            break
+        current = current.parent
+    return handlers
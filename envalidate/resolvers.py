@@ -0,0 +1,326 @@
+"""Secret Resolvers.
+
+Env vars holding references like "vault://path#key" are resolved before validation. References
+are collected across the schema, grouped per backend, fetched in batches, and cached with a TTL.
+"""
+
+from abc import ABC, abstractmethod
+from collections import defaultdict, namedtuple
+import http.client
+import json
+import os
+import queue
+import re
+import threading
+import time
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+
+from .dotenv import load_dotenv
+from .exceptions import EnvError
+
+SecretReference = namedtuple("SecretReference", ["scheme", "path", "key", "raw"])
+SecretReference.__doc__ = """Parsed "<scheme>://<path>[#<key>]" reference."""
+
+_REFERENCE_RE = re.compile(r"^([a-zA-Z][a-zA-Z0-9+.-]*)://([^#]*)(?:#(.*))?$")
+
+
+def parse_reference(value: str) -> Optional[SecretReference]:
+    """Parse a secret reference, None if value is not a reference."""
+    match = _REFERENCE_RE.match(value)
+    if not match:
+        return None
+    scheme, path, key = match.groups()
+    return SecretReference(scheme, path, key, value)
+
+
+def hide_secrets(errors: Dict[str, EnvError], references: Mapping[str, str]):
+    """Replace the errors of resolved keys, so messages show the reference, not the secret.
+
+    :param errors: validation errors, keyed by env var name, replaced in place.
+    :param references: raw references of the resolved keys, keyed by env var name.
+    """
+    for key, error in errors.items():
+        reference = references.get(key)
+        if reference is not None:
+            errors[key] = EnvError(
+                key=key,
+                validator=error.validator,
+                value=reference,
+                reason=f"secret {reference} (value hidden)",
+                source=error.source,
+            )
+
+
+class SecretBackend(ABC):
+    """Secrets backend, fetching references of a single scheme in batches."""
+
+    def __init__(self, scheme: str):
+        """Init SecretBackend.
+
+        :param scheme: references scheme handled by the backend, eg. "vault".
+        """
+        self.scheme = scheme
+
+    @abstractmethod
+    def fetch(self, references: List[SecretReference]) -> Dict[str, str]:
+        """Fetch a batch of references.
+
+        :param references: references of this backend scheme.
+        :return: resolved values keyed by raw reference, missing references are omitted.
+        """
+
+    def close(self):  # noqa: B027
+        """Release backend resources, a no-op for backends holding none."""
+
+
+class FileBackend(SecretBackend):
+    """Resolves "secretfile://<path>[#<key>]" from local files.
+
+    Json objects and dotenv files are looked up by key, the whole (stripped) content is used
+    when no key is given. Each file is read once per batch. The scheme is not "file", so
+    plain file:// urls are left to the validators.
+    """
+
+    def __init__(self, scheme: str = "secretfile", root: str = None):
+        """Init FileBackend.
+
+        :param scheme: references scheme.
+        :param root: directory relative paths are resolved against.
+        """
+        super().__init__(scheme)
+        self.root = root
+
+    def _load(self, path: str):
+        """Load file content, as dict when it holds keys."""
+        if self.root and not os.path.isabs(path):
+            path = os.path.join(self.root, path)
+        if path.endswith(".json"):
+            with open(path, encoding="utf-8") as file:
+                return json.load(file)
+        if path.endswith(".env"):
+            return load_dotenv(path)
+        with open(path, encoding="utf-8") as file:
+            return file.read().strip()
+
+    def fetch(self, references: List[SecretReference]) -> Dict[str, str]:
+        """Fetch references, reading each file once."""
+        by_path: Dict[str, List[SecretReference]] = defaultdict(list)
+        for reference in references:
+            by_path[reference.path].append(reference)
+        values = {}
+        for path, path_references in by_path.items():
+            try:
+                content = self._load(path)
+            except (OSError, ValueError):
+                continue
+            for reference in path_references:
+                if reference.key is None:
+                    values[reference.raw] = content if isinstance(content, str) else None
+                elif isinstance(content, dict) and reference.key in content:
+                    values[reference.raw] = str(content[reference.key])
+        return {raw: value for raw, value in values.items() if value is not None}
+
+
+class HttpBackend(SecretBackend):
+    """Resolves references through a HTTP endpoint, over a pool of keep alive connections.
+
+    Batches are POSTed to "<url>" as {"references": ["path#key", ...]}, and the endpoint answers
+    {"values": {"path#key": "value", ...}}.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        scheme: str = "vault",
+        pool_size: int = 4,
+        batch_size: int = 100,
+        timeout: float = 5.0,
+    ):
+        """Init HttpBackend.
+
+        :param url: batch resolve endpoint, eg. "http://127.0.0.1:8200/resolve".
+        :param scheme: references scheme.
+        :param pool_size: max idle connections kept open.
+        :param batch_size: max references per request.
+        :param timeout: request timeout, in seconds.
+        """
+        super().__init__(scheme)
+        parts = urlsplit(url)
+        self.__connection_class__ = (
+            http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        )
+        self.__netloc__ = parts.netloc
+        self.__path__ = parts.path or "/"
+        self.__pool__: "queue.LifoQueue" = queue.LifoQueue(maxsize=pool_size)
+        self.batch_size = batch_size
+        self.timeout = timeout
+
+    def _connection(self) -> http.client.HTTPConnection:
+        """Take an idle connection from the pool, or open a new one."""
+        try:
+            return self.__pool__.get_nowait()
+        except queue.Empty:
+            return self.__connection_class__(self.__netloc__, timeout=self.timeout)
+
+    def _release(self, connection: http.client.HTTPConnection):
+        """Return a connection to the pool, closing it when the pool is full."""
+        try:
+            self.__pool__.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+    def _post(self, body: bytes) -> dict:
+        """POST body, retrying once on a stale pooled connection."""
+        for attempt in range(2):
+            connection = self._connection()
+            try:
+                connection.request(
+                    "POST", self.__path__, body, {"Content-Type": "application/json"}
+                )
+                response = connection.getresponse()
+                payload = response.read()
+            except (http.client.HTTPException, OSError):
+                connection.close()
+                if attempt:
+                    raise
+                continue
+            self._release(connection)
+            if response.status != 200:
+                raise OSError(f"secrets endpoint answered {response.status}")
+            return json.loads(payload)
+        return {}  # pragma: no cover
+
+    def fetch(self, references: List[SecretReference]) -> Dict[str, str]:
+        """Fetch references in batches of batch_size."""
+        values = {}
+        for start in range(0, len(references), self.batch_size):
+            batch = references[start : start + self.batch_size]
+            names = {f"{ref.path}#{ref.key}" if ref.key else ref.path: ref for ref in batch}
+            response = self._post(json.dumps({"references": list(names)}).encode("utf-8"))
+            for name, value in response.get("values", {}).items():
+                if name in names and value is not None:
+                    values[names[name].raw] = str(value)
+        return values
+
+    def close(self):
+        """Close pooled connections."""
+        while True:
+            try:
+                self.__pool__.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+class SecretResolver:
+    """Resolves secret references across a schema, before validation.
+
+    Values are cached for ttl seconds. Entries accessed after refresh_after (a fraction of the
+    ttl) are served from cache while a background thread refreshes them.
+    """
+
+    def __init__(
+        self, backends: Iterable[SecretBackend], ttl: float = 300.0, refresh_after: float = 0.8
+    ):
+        """Init SecretResolver.
+
+        :param backends: backends, one per references scheme.
+        :param ttl: cache time to live, in seconds.
+        :param refresh_after: fraction of the ttl after which entries are refreshed in background.
+        """
+        self.__backends__: Dict[str, SecretBackend] = {
+            backend.scheme: backend for backend in backends
+        }
+        self.ttl = ttl
+        self.refresh_after = refresh_after
+        self.__cache__: Dict[str, Tuple[str, float]] = {}
+        self.__lock__ = threading.Lock()
+        self.__refreshing__: Optional[threading.Thread] = None
+
+    def _fetch(self, references: Iterable[SecretReference]) -> Dict[str, str]:
+        """Fetch references grouped per backend, and cache them."""
+        by_scheme: Dict[str, List[SecretReference]] = defaultdict(list)
+        for reference in references:
+            by_scheme[reference.scheme].append(reference)
+        values: Dict[str, str] = {}
+        for scheme, scheme_references in by_scheme.items():
+            try:
+                values.update(self.__backends__[scheme].fetch(scheme_references))
+            except (OSError, ValueError):
+                continue
+        now = time.monotonic()
+        with self.__lock__:
+            for raw, value in values.items():
+                self.__cache__[raw] = (value, now)
+        return values
+
+    def _refresh_in_background(self, references: List[SecretReference]):
+        """Refresh stale references in a daemon thread, one refresh at a time."""
+        with self.__lock__:
+            if self.__refreshing__ is not None and self.__refreshing__.is_alive():
+                return
+            self.__refreshing__ = threading.Thread(
+                target=self._fetch,
+                args=(references,),
+                name="envalidate-secrets-refresh",
+                daemon=True,
+            )
+            self.__refreshing__.start()
+
+    def references(self, environment: Mapping[str, str], keys: Iterable[str]):
+        """Return secret references of keys, keyed by env var name."""
+        references = {}
+        for key in keys:
+            value = environment.get(key)
+            if isinstance(value, str) and "://" in value:
+                reference = parse_reference(value)
+                if reference is not None and reference.scheme in self.__backends__:
+                    references[key] = reference
+        return references
+
+    def resolve(
+        self, environment: Mapping[str, str], keys: Iterable[str]
+    ) -> Tuple[Dict[str, str], Dict[str, EnvError]]:
+        """Resolve secret references of keys.
+
+        :param environment: An object containing your env vars (eg. os.environ)
+        :param keys: env var names to resolve.
+        :return: resolved values and resolution errors, both keyed by env var name.
+        """
+        references = self.references(environment, keys)
+        now = time.monotonic()
+        cached: Dict[str, str] = {}
+        stale: List[SecretReference] = []
+        missing: Dict[str, SecretReference] = {}
+        with self.__lock__:
+            for reference in references.values():
+                entry = self.__cache__.get(reference.raw)
+                if entry is None or now - entry[1] >= self.ttl:
+                    missing[reference.raw] = reference
+                    continue
+                cached[reference.raw] = entry[0]
+                if now - entry[1] >= self.ttl * self.refresh_after:
+                    stale.append(reference)
+        if missing:
+            cached.update(self._fetch(missing.values()))
+        if stale:
+            self._refresh_in_background(stale)
+        resolved, errors = {}, {}
+        for key, reference in references.items():
+            if reference.raw in cached:
+                resolved[key] = cached[reference.raw]
+            else:
+                errors[key] = EnvError(
+                    f"Unresolved secret reference: {reference.raw}", key=key, value=reference.raw
+                )
+        return resolved, errors
+
+    def clear(self):
+        """Clear cached values."""
+        with self.__lock__:
+            self.__cache__.clear()
+
+    def close(self):
+        """Release backends resources."""
+        for backend in self.__backends__.values():
+            backend.close()
@@ -0,0 +1,226 @@
+"""Results."""
+
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Mapping
+
+from .utils import hashable
+
+
+class FrozenEnv:
+    """Immutable environment result, built without pydantic.
+
+    Values are held in a single slot and exposed as attributes, and as a read only
+    mapping view through as_mapping().
+    """
+
+    __slots__ = ("__values__", "__hash_value__", "__provenance__")
+
+    def __init__(self, values: Dict[str, Any], provenance: Mapping[str, str] = None):
+        """Init FrozenEnv.
+
+        :param values: cleaned values, owned by the result from now on (not copied).
+        :param provenance: source name per env var name, when read from Sources.
+        """
+        object.__setattr__(self, "__values__", values)
+        object.__setattr__(self, "__hash_value__", None)
+        object.__setattr__(self, "__provenance__", provenance or {})
+
+    def __getattr__(self, name):
+        """Get env value."""
+        if name.startswith("__"):
+            raise AttributeError(name)
+        try:
+            return self.__values__[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name, value):
+        """Frozen."""
+        raise TypeError(f'"{self.__class__.__name__}" is immutable and does not support assignment')
+
+    def __delattr__(self, name):
+        """Frozen."""
+        raise TypeError(f'"{self.__class__.__name__}" is immutable and does not support deletion')
+
+    def __eq__(self, other):
+        """Equal when both hold the same values, of the same types (1 and True differ) like hash."""
+        if not isinstance(other, FrozenEnv):
+            return NotImplemented
+        if self is other:
+            return True
+        values, other_values = self.__values__, other.__values__
+        return values == other_values and hashable(values) == hashable(other_values)
+
+    def __hash__(self):
+        """Hash of the values, computed once."""
+        if self.__hash_value__ is None:
+            object.__setattr__(self, "__hash_value__", hash(hashable(self.__values__)))
+        return self.__hash_value__
+
+    def __iter__(self):
+        """Iterate (key, value) pairs, like a pydantic model."""
+        return iter(self.__values__.items())
+
+    def __contains__(self, key):
+        """Key in env."""
+        return key in self.__values__
+
+    def __dir__(self):
+        """Dir including env keys."""
+        return [*super().__dir__(), *self.__values__]
+
+    def __repr__(self):
+        """Repr."""
+        fields = ", ".join(f"{key}={value!r}" for key, value in self.__values__.items())
+        return f"CleanEnv({fields})"
+
+    def __reduce__(self):
+        """Pickle support."""
+        return self.__class__, (self.__values__, self.__provenance__)
+
+    def as_mapping(self) -> Mapping[str, Any]:
+        """Read only mapping view of the values, without copying."""
+        return MappingProxyType(self.__values__)
+
+    def provenance(self) -> Mapping[str, str]:
+        """Read only mapping of the source name per env var name.
+
+        Empty unless read from Sources.
+        """
+        return MappingProxyType(self.__provenance__)
+
+    def dict(self) -> Dict[str, Any]:
+        """Copy of the values as dict, like a pydantic model."""
+        return dict(self.__values__)
+
+
+class LazyEnv:
+    """Immutable environment result, validating each value on first access.
+
+    Values are memoized once validated, errors are reported through the reporter on access.
+    """
+
+    __slots__ = (
+        "__schema__",
+        "__raw__",
+        "__values__",
+        "__errors__",
+        "__reporter__",
+        "__provenance__",
+        "__references__",
+    )
+
+    def __init__(
+        self,
+        schema,
+        raw: Dict[str, str],
+        reporter,
+        eager: Iterable[str] = (),
+        provenance: Mapping[str, str] = None,
+        references: Mapping[str, str] = None,
+    ):
+        """Init LazyEnv.
+
+        :param schema: compiled EnvSchema.
+        :param raw: raw values of the schema keys present in the environment.
+        :param reporter: Reporter handling errors, see reporters.py.
+        :param eager: keys validated immediately.
+        :param provenance: source name per env var name, added to errors, when read from Sources.
+        :param references: secret references of the resolved keys, shown in their errors instead
+        of the secrets.
+        """
+        object.__setattr__(self, "__schema__", schema)
+        object.__setattr__(self, "__raw__", raw)
+        object.__setattr__(self, "__values__", {})
+        object.__setattr__(self, "__errors__", {})
+        object.__setattr__(self, "__reporter__", reporter)
+        object.__setattr__(self, "__provenance__", provenance or {})
+        object.__setattr__(self, "__references__", references or {})
+        if eager:
+            self.__validate__(eager)
+
+    def __validate__(self, keys: Iterable[str]):
+        """Validate keys not validated yet, and report their errors together."""
+        keys = [key for key in keys if key not in self.__values__ and key not in self.__errors__]
+        if not keys:
+            return
+        cleaned, errors = self.__schema__.validate(self.__raw__, keys)
+        if self.__schema__.nested:
+            cleaned = self.__schema__.nest(cleaned, "slots")
+        if self.__references__ and errors:
+            from .resolvers import hide_secrets  # pylint: disable=import-outside-toplevel
+
+            hide_secrets(errors, self.__references__)
+        self.__values__.update(cleaned)
+        self.__errors__.update(errors)
+        if self.__provenance__:
+            attach_sources(errors, self.__provenance__)
+        self.__reporter__.report(errors)
+
+    def __getattr__(self, name):
+        """Get env value, validating it on first access."""
+        if name.startswith("__"):
+            raise AttributeError(name)
+        try:
+            return self.__values__[name]
+        except KeyError:
+            pass
+        if name in self.__schema__.validators:
+            self.__validate__((name,))
+            if name in self.__values__:
+                return self.__values__[name]
+        raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        """Frozen."""
+        raise TypeError(f'"{self.__class__.__name__}" is immutable and does not support assignment')
+
+    def __delattr__(self, name):
+        """Frozen."""
+        raise TypeError(f'"{self.__class__.__name__}" is immutable and does not support deletion')
+
+    def __dir__(self):
+        """Dir including env keys."""
+        return [*super().__dir__(), *self.__schema__.validators]
+
+    def __repr__(self):
+        """Repr, without validating."""
+        fields = ", ".join(
+            f"{key}={self.__values__[key]!r}" if key in self.__values__ else f"{key}=<lazy>"
+            for key in self.__schema__.validators
+        )
+        return f"CleanEnv({fields})"
+
+    def validate_all(self) -> "LazyEnv":
+        """Validate all keys not validated yet, reporting their errors together."""
+        self.__validate__(self.__schema__.validators)
+        return self
+
+    def as_mapping(self) -> Mapping[str, Any]:
+        """Read only mapping view of the values, validating all keys first."""
+        self.validate_all()
+        return MappingProxyType(self.__values__)
+
+    def dict(self) -> Dict[str, Any]:
+        """Copy of the values as dict, validating all keys first."""
+        self.validate_all()
+        return dict(self.__values__)
+
+    def provenance(self) -> Mapping[str, str]:
+        """Read only mapping of the source name per env var name.
+
+        Empty unless read from Sources.
+        """
+        return MappingProxyType(self.__provenance__)
+
+
+def attach_sources(errors: Mapping[str, Any], provenance: Mapping[str, str]):
+    """Set the source of errors whose env var name is in provenance.
+
+    :param errors: EnvErrors, keyed by env var name.
+    :param provenance: source name per env var name.
+    """
+    for key, error in errors.items():
+        source = provenance.get(key)
+        if source is not None:
+            error.source = source
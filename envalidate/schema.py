@@ -0,0 +1,760 @@
+"""Compiled Schema."""
+
+from collections import ChainMap, defaultdict, OrderedDict
+import threading
+import time
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TYPE_CHECKING,
+)
+
+from .exceptions import EnvError, EnvMissingError
+from .instrumentation import Instrumentation, KeyEvent, OUTCOMES, ReadStats
+from .reporters import DefaultReporter, Reporter
+from .results import attach_sources, FrozenEnv, LazyEnv
+from .sources import Sources
+from .utils import hashable
+from .validators import as_validator, EnValidator
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pydantic import BaseModel
+
+    from .models import FrozenModel
+
+DEFAULT_REPORTER = DefaultReporter()
+SCHEMA_CACHE_SIZE = 256
+RESULT_BACKENDS = ("model", "slots")
+_MISSING = object()
+
+
+class _KeyTimer:
+    """Times key validations for an Instrumentation, counting the outcomes of a read."""
+
+    __slots__ = ("instrumentation", "prefix", "counts")
+
+    def __init__(self, instrumentation: Instrumentation, prefix: str = "", counts=None):
+        """Init _KeyTimer.
+
+        :param instrumentation: Instrumentation receiving the key events.
+        :param prefix: prefix of the reported env var names, eg. a group prefix.
+        :param counts: outcome counts and total size, shared with the prefixed timers.
+        """
+        self.instrumentation = instrumentation
+        self.prefix = prefix
+        self.counts = counts if counts is not None else dict.fromkeys((*OUTCOMES, "size"), 0)
+
+    def prefixed(self, prefix: str) -> "_KeyTimer":
+        """Timer of the keys of a group, sharing the counts."""
+        return _KeyTimer(self.instrumentation, self.prefix + prefix, self.counts)
+
+    def run(self, key: str, validator: str, envalidate, value, default=None) -> Any:
+        """Validate value (_MISSING when not set), between key_started and key_finished events.
+
+        :param key: env var name, without prefix.
+        :param validator: validator class name.
+        :param envalidate: validator callable.
+        :param value: raw value.
+        :param default: default of missing values.
+        """
+        missing = value is _MISSING
+        if missing:
+            value = default
+        size = len(value) if isinstance(value, str) else None
+        name = self.prefix + key
+        self.instrumentation.key_started(name, validator)
+        outcome = "invalid"
+        start = time.perf_counter()
+        try:
+            if missing and not default:
+                outcome = "missing"
+                raise EnvMissingError(key)
+            value = envalidate(value)
+            outcome = "valid"
+            return value
+        finally:
+            duration = time.perf_counter() - start
+            self.counts[outcome] += 1
+            self.counts["size"] += size or 0
+            self.instrumentation.key_finished(KeyEvent(name, validator, duration, outcome, size))
+
+    def stats(self, duration: float) -> ReadStats:
+        """Stats of the read."""
+        counts = dict(self.counts)
+        size = counts.pop("size")
+        return ReadStats(sum(counts.values()), duration=duration, size=size, **counts)
+
+
+def schema_fingerprint(validators: Mapping[str, EnValidator]) -> Hashable:
+    """Hashable identity of a validators dict, equal for identically configured schemas."""
+    return tuple((key, validator.fingerprint) for key, validator in validators.items())
+
+
+def _as_validators(validators: Mapping[str, Any]) -> Mapping[str, EnValidator]:
+    """Validators dict, with plain callables wrapped into FunctionValidators."""
+    if all(isinstance(value, (EnValidator, Group, Pattern)) for value in validators.values()):
+        return validators
+    return {
+        key: value if isinstance(value, (Group, Pattern)) else as_validator(value)
+        for key, value in validators.items()
+    }
+
+
+class Group:
+    """Validators of the env vars sharing a prefix, nested in a schema.
+
+    {"DB": Group({"HOST": Str(), "PORT": Port()}, prefix="DB_")} validates DB_HOST and DB_PORT
+    into env.DB.HOST and env.DB.PORT. Groups nest, and the same validators reused under
+    different prefixes are compiled once.
+    """
+
+    def __init__(self, validators, prefix: str):
+        """Init Group.
+
+        :param validators: validators of the group keys (without prefix), or an EnvSchema.
+        :param prefix: env var names prefix, eg. "DB_".
+        """
+        if not prefix:
+            raise ValueError("Group prefix must not be empty")
+        self.__schema__: "EnvSchema" = compile_schema(validators)
+        self.__prefix__ = prefix
+
+    @property
+    def schema(self) -> "EnvSchema":
+        """Compiled schema of the group keys."""
+        return self.__schema__
+
+    @property
+    def prefix(self) -> str:
+        """Env var names prefix."""
+        return self.__prefix__
+
+    @property
+    def validators(self) -> Mapping[str, EnValidator]:
+        """Validators."""
+        return self.__schema__.validators
+
+    @property
+    def fingerprint(self) -> Hashable:
+        """Hashable identity of the group."""
+        return hashable(Group), self.__prefix__, self.__schema__.fingerprint
+
+    def with_prefix(self, prefix: str) -> "Group":
+        """Same validators, under another prefix."""
+        return Group(self.__schema__, prefix)
+
+    def __repr__(self):
+        """Repr."""
+        return f"Group({list(self.__schema__.keys)}, prefix={self.__prefix__!r})"
+
+
+class Pattern:
+    """Validator of every env var whose name matches a pattern, nested in a schema.
+
+    {"FEATURES": Pattern("FEATURE_*", Bool())} validates FEATURE_X, FEATURE_Y... into the
+    env.FEATURES read only mapping, keyed by env var name. Exact schema keys take precedence over
+    patterns, and an env var matching several patterns belongs to the first declared one.
+    """
+
+    def __init__(self, pattern, validator: EnValidator, regex: bool = False):
+        """Init Pattern.
+
+        :param pattern: glob (eg. "FEATURE_*", "*_URL"), regex when regex is set,
+        or a compiled regex.
+        :param validator: validator of the matching env vars, or a plain callable.
+        :param regex: pattern is a regex, matched against the whole name.
+        """
+        if not isinstance(pattern, str):
+            pattern, regex = pattern.pattern, True
+        self.__pattern__ = pattern
+        self.__regex__ = regex
+        self.__validator__ = as_validator(validator)
+
+    @property
+    def pattern(self) -> str:
+        """Pattern."""
+        return self.__pattern__
+
+    @property
+    def regex(self) -> str:
+        """Regex source matching the whole env var name."""
+        if self.__regex__:
+            return self.__pattern__
+        import fnmatch  # pylint: disable=import-outside-toplevel
+
+        return fnmatch.translate(self.__pattern__)
+
+    @property
+    def validator(self) -> EnValidator:
+        """Validator of the matching env vars."""
+        return self.__validator__
+
+    @property
+    def fingerprint(self) -> Hashable:
+        """Hashable identity of the pattern."""
+        return hashable(Pattern), self.__pattern__, self.__regex__, self.__validator__.fingerprint
+
+    def __repr__(self):
+        """Repr."""
+        return f"Pattern({self.__pattern__!r}, {self.__validator__!r}, regex={self.__regex__})"
+
+
+class EnvSchema:
+    """Validators dict compiled once, and read many times.
+
+    Holds the ordered keys, the bound validator callables and a pre-built CleanEnv model class.
+    """
+
+    def __init__(self, validators: Mapping[str, EnValidator]):
+        """Init EnvSchema.
+
+        :param validators: An object that specifies the format of required vars, plain callables
+        are wrapped into FunctionValidators.
+        """
+        self.__validators__: Dict[str, EnValidator] = dict(_as_validators(validators))
+        self.__fingerprint__ = schema_fingerprint(self.__validators__)
+        self.__readers__: Tuple = tuple(
+            (key, validator.envalidate, validator.default)
+            for key, validator in self.__validators__.items()
+            if not isinstance(validator, (Group, Pattern))
+        )
+        self.__readers_by_key__ = {reader[0]: reader for reader in self.__readers__}
+        self.__groups__: Tuple = tuple(
+            (key, group.prefix, group.schema)
+            for key, group in self.__validators__.items()
+            if isinstance(group, Group)
+        )
+        prefixes: Dict[int, Dict[str, List[str]]] = defaultdict(lambda: defaultdict(list))
+        for key, prefix, _ in self.__groups__:
+            prefixes[len(prefix)][prefix].append(key)
+        self.__prefixes__: Tuple = tuple(
+            (length, {prefix: tuple(keys) for prefix, keys in by_prefix.items()})
+            for length, by_prefix in sorted(prefixes.items())
+        )
+        self.__patterns__: Tuple = tuple(
+            (key, pattern.validator.envalidate)
+            for key, pattern in self.__validators__.items()
+            if isinstance(pattern, Pattern)
+        )
+        self.__matcher__ = _compile_matcher(
+            [self.__validators__[key].regex for key, _ in self.__patterns__]
+        )
+        self.__costs__ = {key: self.__validators__[key].__cost__ for key, *_ in self.__readers__}
+        self.__cheapest__: Tuple = tuple(
+            sorted(self.__readers__, key=lambda reader: self.__costs__[reader[0]])
+        )
+        self.__digest__: str = None
+        self.__frozen_model__: Optional[Type["FrozenModel"]] = None
+
+    @property
+    def validators(self) -> Mapping[str, EnValidator]:
+        """Validators."""
+        return self.__validators__
+
+    @property
+    def keys(self) -> Tuple[str, ...]:
+        """Ordered schema keys."""
+        return tuple(self.__validators__)
+
+    @property
+    def groups(self) -> Tuple[str, ...]:
+        """Keys of the nested groups."""
+        return tuple(key for key, *_ in self.__groups__)
+
+    @property
+    def patterns(self) -> Tuple[str, ...]:
+        """Keys of the patterns."""
+        return tuple(key for key, _ in self.__patterns__)
+
+    @property
+    def nested(self) -> Tuple[str, ...]:
+        """Keys of the groups and patterns, whose values are read from many env vars."""
+        return self.groups + self.patterns
+
+    @property
+    def fingerprint(self) -> Hashable:
+        """Fingerprint."""
+        return self.__fingerprint__
+
+    @property
+    def __model__(self) -> Type["FrozenModel"]:
+        """Model class of the results, a FrozenModel created on first use (importing pydantic)."""
+        if self.__frozen_model__ is None:
+            from .models import FrozenModel  # pylint: disable=import-outside-toplevel
+
+            self.__frozen_model__ = FrozenModel.with_fields(
+                "CleanEnv", **{key: (Any, ...) for key in self.__validators__}
+            )
+        return self.__frozen_model__
+
+    @property
+    def digest(self) -> str:
+        """Hex digest of the fingerprint, stable across processes."""
+        if self.__digest__ is None:
+            import hashlib  # pylint: disable=import-outside-toplevel
+
+            self.__digest__ = hashlib.sha256(repr(self.__fingerprint__).encode("utf-8")).hexdigest()
+        return self.__digest__
+
+    def metadata_model(self, name: str = "CleanEnv") -> Type["BaseModel"]:
+        """Pydantic model documenting the env vars, built on demand from the validators metadata.
+
+        :param name: model name.
+        """
+        # pylint: disable=import-outside-toplevel
+        from pydantic import create_model, Field
+
+        from .models import metadata_field
+
+        fields: Dict[str, Any] = {}
+        for key, validator in self.__validators__.items():
+            if isinstance(validator, Group):
+                description = f"env vars prefixed with {validator.prefix}"
+                model = validator.schema.metadata_model(key)
+                fields[key] = (model, Field(..., description=description))
+            elif isinstance(validator, Pattern):
+                metadata = {**validator.validator.metadata(), "default": {}}
+                metadata["pattern"] = validator.pattern
+                fields[key] = (Dict[str, Any], metadata_field(metadata))
+            else:
+                fields[key] = (Any, metadata_field(validator.metadata()))
+        return create_model(name, **fields)
+
+    def export(self) -> Dict[str, Any]:
+        """JSON Schema of the env vars, documenting the validators metadata."""
+        return self.metadata_model().schema()
+
+    def index(self, environment) -> Dict[str, Dict[str, str]]:
+        """Classify env vars into groups and patterns, in a single pass over the environment.
+
+        :param environment: An object containing your env vars (eg. os.environ)
+        :return: sub environment per group key (prefix stripped) and per pattern key.
+        """
+        index: Dict[str, Dict[str, str]] = {key: {} for key in self.nested}
+        if not index:
+            return index
+        prefixes = self.__prefixes__
+        matcher = self.__matcher__
+        exact = self.__validators__
+        patterns = self.__patterns__
+        for name, value in environment.items():
+            for length, by_prefix in prefixes:
+                keys = by_prefix.get(name[:length])
+                if keys is not None:
+                    for key in keys:
+                        index[key][name[length:]] = value
+            if matcher is not None and name not in exact:
+                position = matcher(name)
+                if position is not None:
+                    index[patterns[position][0]][name] = value
+        return index
+
+    def raw(self, environment) -> Dict[str, Any]:
+        """Raw values of the schema keys present in environment.
+
+        Groups and patterns values are their sub environments.
+
+        :param environment: An object containing your env vars (eg. os.environ)
+        """
+        raw: Dict[str, Any] = {
+            key: environment[key] for key, *_ in self.__readers__ if key in environment
+        }
+        raw.update(self.index(environment))
+        return raw
+
+    def flat_raw(self, environment) -> Dict[str, str]:
+        """Raw values of the env vars the schema reads, keyed by env var name.
+
+        :param environment: An object containing your env vars (eg. os.environ)
+        """
+        raw = self.raw(environment)
+        for key, prefix, _ in self.__groups__:
+            raw.update((prefix + name, value) for name, value in raw.pop(key).items())
+        for key, _ in self.__patterns__:
+            raw.update(raw.pop(key))
+        return raw
+
+    def provenance(self, environment) -> Optional[Dict[str, str]]:
+        """Source name of the env vars the schema reads, None unless environment is Sources.
+
+        :param environment: An object containing your env vars (eg. os.environ)
+        """
+        if not isinstance(environment, Sources):
+            return None
+        keys = self.flat_raw(environment) if self.nested else self.__validators__
+        return environment.provenance(keys)
+
+    def validate(
+        self,
+        environment,
+        keys: Iterable[str] = None,
+        instrumentation: Instrumentation = None,
+        fail_fast: bool = False,
+        cheapest_first: bool = False,
+    ) -> Tuple[Dict[str, Any], Dict[str, EnvError]]:
+        """Validate environment, without reporting.
+
+        :param environment: An object containing your env vars (eg. os.environ)
+        :param keys: validate only these schema keys, all keys by default.
+        :param instrumentation: Instrumentation receiving per key events, see instrumentation.py.
+        Group and pattern keys are reported by env var name.
+        :param fail_fast: stop at the first error.
+        :param cheapest_first: validate keys by ascending validator __cost__.
+        :return: cleaned values and errors, both keyed by env var name, in schema order.
+        """
+        if instrumentation is None:
+            return self._validate(environment, keys, fail_fast, cheapest_first)
+        readers, groups, patterns = self._select(keys, cheapest_first)
+        index = self.index(environment) if groups or patterns else None
+        instrumentation.read_started(len(readers) + self._nested_count(index, groups, patterns))
+        timer = _KeyTimer(instrumentation)
+        start = time.perf_counter()
+        cleaned_env, errors = self._validate(
+            environment, keys, fail_fast, cheapest_first, timer, index
+        )
+        instrumentation.read_finished(timer.stats(time.perf_counter() - start))
+        return cleaned_env, errors
+
+    def _select(self, keys: Optional[Iterable[str]], cheapest_first: bool) -> Tuple:
+        """Readers, groups and patterns of keys, all of them by default."""
+        readers = self.__cheapest__ if cheapest_first else self.__readers__
+        groups, patterns = self.__groups__, self.__patterns__
+        if keys is None:
+            return readers, groups, patterns
+        by_key = self.__readers_by_key__
+        readers = tuple(by_key[key] for key in keys if key in by_key)
+        if cheapest_first:
+            readers = tuple(sorted(readers, key=lambda reader: self.__costs__[reader[0]]))
+        keys = set(keys)
+        groups = tuple(group for group in groups if group[0] in keys)
+        patterns = tuple(pattern for pattern in patterns if pattern[0] in keys)
+        return readers, groups, patterns
+
+    @staticmethod
+    def _nested_count(index: Optional[Dict], groups: Tuple, patterns: Tuple) -> int:
+        """Number of env vars read by groups and patterns."""
+        count = sum(len(index[key]) for key, _ in patterns)
+        for key, _, schema in groups:
+            count += len(schema.__readers__)
+            if schema.nested:
+                count += schema._nested_count(
+                    schema.index(index[key]), schema.__groups__, schema.__patterns__
+                )
+        return count
+
+    def _validate(
+        self,
+        environment,
+        keys: Optional[Iterable[str]],
+        fail_fast: bool,
+        cheapest_first: bool,
+        timer: "_KeyTimer" = None,
+        index: Dict[str, Dict[str, str]] = None,
+    ) -> Tuple[Dict[str, Any], Dict[str, EnvError]]:
+        """Validate environment, timing each key with timer when set."""
+        readers, groups, patterns = self._select(keys, cheapest_first)
+        if timer is not None:
+            cleaned_env, errors = self._validate_instrumented(
+                environment, readers, timer, fail_fast
+            )
+        else:
+            cleaned_env, errors = self._validate_readers(environment, readers, fail_fast)
+        if (groups or patterns) and not (fail_fast and errors):
+            if index is None:
+                index = self.index(environment)
+            self._validate_nested(
+                index, groups, patterns, cleaned_env, errors, fail_fast, cheapest_first, timer
+            )
+        if cheapest_first or groups or patterns:
+            order = self.__validators__
+            cleaned_env = {key: cleaned_env[key] for key in order if key in cleaned_env}
+        if cheapest_first:
+            ordered = {key: errors[key] for key in self.__validators__ if key in errors}
+            ordered.update(errors)
+            errors = ordered
+        return cleaned_env, errors
+
+    @staticmethod
+    def _validate_readers(
+        environment, readers: Tuple, fail_fast: bool
+    ) -> Tuple[Dict[str, Any], Dict[str, EnvError]]:
+        """Validate readers."""
+        cleaned_env: Dict[str, Any] = {}
+        errors: Dict[str, EnvError] = {}
+        get = environment.get
+        for key, envalidate, default in readers:
+            try:
+                value = get(key, _MISSING)
+                if value is _MISSING:
+                    if not default:
+                        raise EnvMissingError(key)
+                    value = default
+                cleaned_env[key] = envalidate(value)
+            except EnvError as ex:
+                ex.key = key
+                errors[key] = ex
+                if fail_fast:
+                    break
+        return cleaned_env, errors
+
+    def _validate_nested(
+        self,
+        index: Dict[str, Dict[str, str]],
+        groups: Tuple,
+        patterns: Tuple,
+        cleaned_env: Dict[str, Any],
+        errors: Dict[str, EnvError],
+        fail_fast: bool,
+        cheapest_first: bool,
+        timer: "_KeyTimer" = None,
+    ):
+        """Validate groups and patterns over a single index, errors are keyed by env var name."""
+        for key, prefix, schema in groups:
+            values, group_errors = schema._validate(
+                index[key], None, fail_fast, cheapest_first, timer and timer.prefixed(prefix)
+            )
+            cleaned_env[key] = values
+            for name, error in group_errors.items():
+                error.key = prefix + name
+                errors[error.key] = error
+            if fail_fast and errors:
+                return
+        for key, envalidate in patterns:
+            validator = type(self.__validators__[key].validator).__name__
+            values = cleaned_env[key] = {}
+            for name, value in index[key].items():
+                try:
+                    if timer is None:
+                        values[name] = envalidate(value)
+                    else:
+                        values[name] = timer.run(name, validator, envalidate, value)
+                except EnvError as ex:
+                    ex.key = name
+                    errors[name] = ex
+                    if fail_fast:
+                        return
+
+    def _validate_instrumented(
+        self, environment, readers: Tuple, timer: "_KeyTimer", fail_fast: bool
+    ) -> Tuple[Dict[str, Any], Dict[str, EnvError]]:
+        """Validate readers, timing each key."""
+        cleaned_env: Dict[str, Any] = {}
+        errors: Dict[str, EnvError] = {}
+        validators = self.__validators__
+        get = environment.get
+        for key, envalidate, default in readers:
+            try:
+                validator = type(validators[key]).__name__
+                cleaned_env[key] = timer.run(
+                    key, validator, envalidate, get(key, _MISSING), default
+                )
+            except EnvError as ex:
+                ex.key = key
+                errors[key] = ex
+                if fail_fast:
+                    break
+        return cleaned_env, errors
+
+    def build(
+        self, values: Dict[str, Any], result: str = "model", provenance: Mapping[str, str] = None
+    ):
+        """Create frozen CleanEnv from cleaned values.
+
+        :param values: cleaned values.
+        :param result: result backend, "model" for a pydantic FrozenModel,
+        "slots" for a lightweight FrozenEnv.
+        :param provenance: source name per env var name, exposed by the result provenance().
+        """
+        if self.__groups__ or self.__patterns__:
+            values = self.nest(values, result)
+        if result == "slots":
+            return FrozenEnv(values, provenance)
+        if result != "model":
+            raise ValueError(f"Unknown result backend: {result}, expected one of {RESULT_BACKENDS}")
+        if len(values) == len(self.__validators__):
+            model = self.__model__(**values)
+        else:
+            from .models import FrozenModel  # pylint: disable=import-outside-toplevel
+
+            fields = {k: (type(v), ...) for k, v in values.items()}
+            model = FrozenModel.with_fields("CleanEnv", **fields)(**values)
+        if provenance:
+            model._provenance = provenance  # pylint: disable=protected-access
+        return model
+
+    def nest(self, values: Dict[str, Any], result: str = "model") -> Dict[str, Any]:
+        """Copy of values, with nested results for groups.
+
+        Pattern values are wrapped into read only mappings.
+
+        :param values: cleaned values.
+        :param result: result backend, see build.
+        """
+        values = dict(values)
+        for key, _, schema in self.__groups__:
+            if isinstance(values.get(key), dict):
+                values[key] = schema.build(values[key], result)
+        for key, _ in self.__patterns__:
+            if isinstance(values.get(key), dict):
+                values[key] = MappingProxyType(values[key])
+        return values
+
+    def _resolve(self, environment, resolver) -> Tuple[Any, Dict[str, EnvError], Dict[str, str]]:
+        """Resolve secret references, when resolver is given.
+
+        :return: environment with the resolved values, resolution errors, and the references of
+        the resolved keys.
+        """
+        if resolver is None:
+            return environment, {}, {}
+        keys = self.flat_raw(environment) if self.nested else self.__validators__
+        resolved, resolve_errors = resolver.resolve(environment, keys)
+        references = {key: environment[key] for key in resolved}
+        return ChainMap(resolved, environment), resolve_errors, references
+
+    def read(
+        self,
+        environment,
+        reporter: Reporter = DEFAULT_REPORTER,
+        result: str = "model",
+        lazy: bool = False,
+        eager: Iterable[str] = (),
+        resolver=None,
+        instrumentation: Instrumentation = None,
+        fail_fast: bool = False,
+        cheapest_first: bool = False,
+        snapshot=None,
+    ):
+        """Returns a sanitized, immutable environment object.
+
+        :param environment: An object containing your env vars (eg. os.environ)
+        :param reporter: Reporter handling errors, see reporters.py.
+        :param result: result backend, see build.
+        :param lazy: return a LazyEnv, validating each key on first access.
+        :param eager: keys validated immediately in lazy mode.
+        :param resolver: SecretResolver resolving secret references before validation.
+        :param instrumentation: Instrumentation receiving per key events.
+        :param fail_fast: stop validating, and report, at the first error.
+        :param cheapest_first: validate keys by ascending validator cost.
+        :param snapshot: SnapshotCache loading and storing cleaned values of valid environments,
+        not used with lazy or resolver.
+        """
+        provenance = self.provenance(environment)
+        snapshot = snapshot if not lazy and resolver is None else None
+        if snapshot is not None:
+            values = snapshot.load(self, environment)
+            if values is not None:
+                return self.build(values, result, provenance)
+        environment, resolve_errors, references = self._resolve(environment, resolver)
+        if lazy:
+            if resolve_errors:
+                attach_sources(resolve_errors, provenance or {})
+                reporter.report(resolve_errors)
+            raw = self.flat_raw(environment)
+            return LazyEnv(self, raw, reporter, eager, provenance, references)
+        cleaned_env, errors = self.validate(
+            environment,
+            instrumentation=instrumentation,
+            fail_fast=fail_fast,
+            cheapest_first=cheapest_first,
+        )
+        if references and errors:
+            from .resolvers import hide_secrets  # pylint: disable=import-outside-toplevel
+
+            hide_secrets(errors, references)
+        for key, error in resolve_errors.items():
+            cleaned_env.pop(key, None)
+            errors[key] = error
+        if provenance and errors:
+            attach_sources(errors, provenance)
+        reporter.report(errors)
+        if snapshot is not None and not errors:
+            snapshot.store(self, environment, cleaned_env)
+        return self.build(cleaned_env, result, provenance)
+
+
+def _compile_matcher(regexes: List[str]) -> Optional[Callable[[str], Optional[int]]]:
+    """Matcher of env var names, returning the position of the first fully matching pattern.
+
+    Patterns without groups nor global inline flags are compiled into a single alternation,
+    others are matched one by one, so their flags, group names and backreferences keep working.
+    """
+    if not regexes:
+        return None
+    import re  # pylint: disable=import-outside-toplevel
+
+    compiled = [re.compile(regex) for regex in regexes]
+    plain = re.compile("").flags
+    if all(pattern.groups == 0 and pattern.flags == plain for pattern in compiled):
+        alternation = re.compile("|".join(f"({regex})" for regex in regexes)).fullmatch
+
+        def match_any(name: str) -> Optional[int]:
+            match = alternation(name)
+            return None if match is None else match.lastindex - 1
+
+        return match_any
+    fullmatches = tuple(enumerate(pattern.fullmatch for pattern in compiled))
+
+    def match_first(name: str) -> Optional[int]:
+        for position, fullmatch in fullmatches:
+            if fullmatch(name) is not None:
+                return position
+        return None
+
+    return match_first
+
+
+def __getattr__(name):
+    """FrozenModel, imported on first access."""
+    if name != "FrozenModel":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from .models import FrozenModel  # pylint: disable=import-outside-toplevel
+
+    return FrozenModel
+
+
+_SCHEMA_CACHE: "OrderedDict[Hashable, EnvSchema]" = OrderedDict()
+_SCHEMA_CACHE_LOCK = threading.Lock()
+
+
+def compile_schema(validators) -> EnvSchema:
+    """Return compiled EnvSchema for validators, reusing a cached one when possible.
+
+    The process-wide registry is keyed on the validators fingerprint and keeps at most
+    SCHEMA_CACHE_SIZE schemas, evicting the least recently used.
+
+    :param validators: validators dict, or an already compiled EnvSchema.
+    """
+    if isinstance(validators, EnvSchema):
+        return validators
+    try:
+        fingerprint = schema_fingerprint(validators)
+    except AttributeError:
+        validators = _as_validators(validators)
+        fingerprint = schema_fingerprint(validators)
+    with _SCHEMA_CACHE_LOCK:
+        schema = _SCHEMA_CACHE.get(fingerprint)
+        if schema is not None:
+            _SCHEMA_CACHE.move_to_end(fingerprint)
+            return schema
+    schema = EnvSchema(validators)
+    with _SCHEMA_CACHE_LOCK:
+        _SCHEMA_CACHE[fingerprint] = schema
+        while len(_SCHEMA_CACHE) > SCHEMA_CACHE_SIZE:
+            _SCHEMA_CACHE.popitem(last=False)
+    return schema
+
+
+def clear_schema_cache():
+    """Clear compiled schemas registry."""
+    with _SCHEMA_CACHE_LOCK:
+        _SCHEMA_CACHE.clear()
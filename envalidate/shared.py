@@ -0,0 +1,277 @@
+"""Shared Memory Results.
+
+A validated environment is published once (eg. by a prefork master) into a
+multiprocessing.shared_memory block, and workers attach a read only SharedEnv view of it.
+Values are decoded from the shared block on first access, so workers only materialize the keys
+they use, and never revalidate.
+
+Layout, little endian:
+    header: magic "ENVS", format version (u16), entries count (u32)
+    entries: key offset, key length, value offset, value length (u32 each), type tag (u8)
+    data: utf-8 keys and values, floats as f64, parsed json values re-encoded as json, and
+    nested group results in the same layout
+"""
+
+import json
+import os
+import struct
+import sys
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Tuple
+
+from .results import FrozenEnv
+from .utils import freeze
+
+FORMAT_VERSION = 1
+_MAGIC = b"ENVS"
+_HEADER = struct.Struct("<4sHI")
+_ENTRY = struct.Struct("<IIIIB3x")
+_FLOAT = struct.Struct("<d")
+
+_SHM_DIR = "/dev/shm"
+
+_NONE, _STR, _BOOL, _INT, _FLOAT_TAG, _JSON, _GROUP = range(7)
+
+
+def _encode(value: Any) -> Tuple[int, bytes]:
+    """Encode a value into (tag, bytes)."""
+    if value is None:
+        return _NONE, b""
+    if isinstance(value, str):
+        return _STR, value.encode("utf-8", "surrogatepass")
+    if isinstance(value, bool):
+        return _BOOL, b"\x01" if value else b"\x00"
+    if isinstance(value, int):
+        return _INT, str(value).encode("ascii")
+    if isinstance(value, float):
+        return _FLOAT_TAG, _FLOAT.pack(value)
+    if _is_result(value):
+        return _GROUP, encode_env(value)
+    try:
+        return _JSON, json.dumps(value, separators=(",", ":"), default=_json_default).encode()
+    except (TypeError, ValueError) as ex:
+        raise TypeError(f"{type(value).__name__} value can not be shared") from ex
+
+
+def _is_result(value: Any) -> bool:
+    """Whether value is a nested read_env result.
+
+    FrozenModel results only exist once envalidate.models (and pydantic) is loaded, so it is not
+    imported here.
+    """
+    if isinstance(value, FrozenEnv):
+        return True
+    models = sys.modules.get(f"{__package__}.models")
+    return models is not None and isinstance(value, models.FrozenModel)
+
+
+def _json_default(value: Any) -> Any:
+    """Encode frozen json values (see utils.freeze)."""
+    if isinstance(value, MappingProxyType):
+        return dict(value)
+    if isinstance(value, frozenset):
+        return list(value)
+    raise TypeError(type(value).__name__)
+
+
+def _decode(tag: int, data: memoryview) -> Any:
+    """Decode a value, json values are deeply frozen, groups are decoded into FrozenEnv."""
+    if tag == _STR:
+        return str(data, "utf-8", "surrogatepass")
+    if tag == _BOOL:
+        return data[0] == 1
+    if tag == _INT:
+        return int(str(data, "ascii"))
+    if tag == _FLOAT_TAG:
+        return _FLOAT.unpack(data)[0]
+    if tag == _JSON:
+        return freeze(json.loads(str(data, "utf-8")))
+    if tag == _GROUP:
+        return FrozenEnv(
+            {key: _decode(tag, data[start:end]) for key, tag, start, end in _entries(data)}
+        )
+    return None
+
+
+def _entries(buffer: memoryview) -> Iterator[Tuple[str, int, int, int]]:
+    """Yield (key, tag, value start, value end) of an encoded environment."""
+    magic, version, count = _HEADER.unpack_from(buffer)
+    if magic != _MAGIC or version != FORMAT_VERSION:
+        raise ValueError(f"not a shared environment of format {FORMAT_VERSION}")
+    for position in range(count):
+        key_at, key_length, value_at, value_length, tag = _ENTRY.unpack_from(
+            buffer, _HEADER.size + position * _ENTRY.size
+        )
+        key = str(buffer[key_at : key_at + key_length], "utf-8")
+        yield key, tag, value_at, value_at + value_length
+
+
+def _env_values(env) -> Mapping[str, Any]:
+    """Cleaned values of a read_env result, or a mapping."""
+    if hasattr(env, "as_mapping"):
+        return env.as_mapping()
+    if isinstance(env, Mapping):
+        return env
+    return dict(env)
+
+
+def encode_env(env) -> bytes:
+    """Encode a read_env result (any result backend) or a mapping into the shared layout."""
+    values = _env_values(env)
+    entries: List[Tuple[bytes, int, bytes]] = []
+    for key, value in values.items():
+        tag, data = _encode(value)
+        entries.append((key.encode("utf-8"), tag, data))
+    offset = _HEADER.size + _ENTRY.size * len(entries)
+    table, chunks = [], []
+    for key, tag, data in entries:
+        table.append(_ENTRY.pack(offset, len(key), offset + len(key), len(data), tag))
+        chunks.append(key)
+        chunks.append(data)
+        offset += len(key) + len(data)
+    return b"".join([_HEADER.pack(_MAGIC, FORMAT_VERSION, len(entries)), *table, *chunks])
+
+
+def publish_env(env, name: str = None):
+    """Publish a validated environment into a new shared memory block.
+
+    The publisher owns the block: keep it referenced while workers run, then close() and
+    unlink() it.
+
+    :param env: read_env result (any result backend), or a mapping of cleaned values.
+    :param name: block name, a random one by default.
+    :return: multiprocessing.shared_memory.SharedMemory, workers attach it by its name.
+    """
+    from multiprocessing import shared_memory  # pylint: disable=import-outside-toplevel
+
+    payload = encode_env(env)
+    block = shared_memory.SharedMemory(name=name, create=True, size=max(len(payload), 1))
+    block.buf[: len(payload)] = payload
+    return block
+
+
+def attach_env(name: str) -> "SharedEnv":
+    """Attach a read only view of a published environment.
+
+    :param name: shared memory block name, see publish_env.
+    """
+    from multiprocessing import shared_memory  # pylint: disable=import-outside-toplevel
+
+    if sys.version_info >= (3, 13):
+        return SharedEnv(shared_memory.SharedMemory(name=name, track=False))
+    path = os.path.join(_SHM_DIR, name.lstrip("/"))
+    if os.path.isdir(_SHM_DIR):
+        return SharedEnv(_ReadOnlyBlock(path, name))
+    return SharedEnv(shared_memory.SharedMemory(name=name))  # pragma: no cover
+
+
+class _ReadOnlyBlock:
+    """Read only mapping of a POSIX shared memory block, through its /dev/shm file.
+
+    Unlike attaching a multiprocessing SharedMemory, it is not registered with the resource
+    tracker (which would unlink the block when a worker exits, python < 3.13), and the mapping
+    itself is read only.
+    """
+
+    def __init__(self, path: str, name: str):
+        """Init _ReadOnlyBlock.
+
+        :param path: block file path.
+        :param name: block name.
+        """
+        import mmap  # pylint: disable=import-outside-toplevel
+
+        self.name = name
+        descriptor = os.open(path, os.O_RDONLY)
+        try:
+            size = os.fstat(descriptor).st_size
+            self.__mmap__ = mmap.mmap(descriptor, size, prot=mmap.PROT_READ)
+        finally:
+            os.close(descriptor)
+        self.buf = memoryview(self.__mmap__)
+
+    def close(self):
+        """Unmap the block."""
+        self.buf.release()
+        self.__mmap__.close()
+
+
+class SharedEnv:
+    """Read only environment view over a shared memory block.
+
+    Offers the attribute access of the read_env results, values are decoded on first access
+    and memoized, json values are deeply frozen.
+    """
+
+    __slots__ = ("__block__", "__buffer__", "__index__", "__values__")
+
+    def __init__(self, block):
+        """Init SharedEnv.
+
+        :param block: SharedMemory block holding an encoded environment, see encode_env.
+        """
+        buffer = block.buf.toreadonly()
+        try:
+            index = {key: (tag, start, end) for key, tag, start, end in _entries(buffer)}
+        except ValueError as ex:
+            buffer.release()
+            raise ValueError(f"{block.name} is {ex}") from None
+        object.__setattr__(self, "__block__", block)
+        object.__setattr__(self, "__buffer__", buffer)
+        object.__setattr__(self, "__index__", index)
+        object.__setattr__(self, "__values__", {})
+
+    def __value__(self, key: str) -> Any:
+        """Decode and memoize a value."""
+        values = self.__values__
+        if key not in values:
+            tag, start, end = self.__index__[key]
+            values[key] = _decode(tag, self.__buffer__[start:end])
+        return values[key]
+
+    def __getattr__(self, name):
+        """Get env value."""
+        if name.startswith("__"):
+            raise AttributeError(name)
+        try:
+            return self.__value__(name)
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name, value):
+        """Frozen."""
+        raise TypeError(f'"{self.__class__.__name__}" is immutable and does not support assignment')
+
+    def __delattr__(self, name):
+        """Frozen."""
+        raise TypeError(f'"{self.__class__.__name__}" is immutable and does not support deletion')
+
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
+        """Iterate (key, value) pairs, like a pydantic model."""
+        return ((key, self.__value__(key)) for key in self.__index__)
+
+    def __contains__(self, key):
+        """Key in env."""
+        return key in self.__index__
+
+    def __dir__(self):
+        """Dir including env keys."""
+        return [*super().__dir__(), *self.__index__]
+
+    def __repr__(self):
+        """Repr."""
+        fields = ", ".join(f"{key}={value!r}" for key, value in self)
+        return f"CleanEnv({fields})"
+
+    def as_mapping(self) -> Mapping[str, Any]:
+        """Read only mapping of the values, decoding all of them."""
+        return MappingProxyType(dict(self))
+
+    def dict(self) -> Dict[str, Any]:
+        """Copy of the values as dict, like a pydantic model."""
+        return dict(self)
+
+    def close(self):
+        """Detach from the shared memory block, the view is unusable afterwards."""
+        self.__buffer__.release()
+        self.__block__.close()
@@ -0,0 +1,202 @@
+"""Snapshot Cache.
+
+Validated environments are stored on disk, keyed by a hash of the schema digest, the envalidate
+version, the source files of the validators and the raw values of the schema keys, so processes
+started with an identical environment load the cleaned values instead of revalidating them.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from typing import Any, Dict, Hashable, Mapping, Optional, Set
+
+from .version import VERSION
+
+FORMAT_VERSION = 1
+DEFAULT_DIRECTORY = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "envalidate",
+    "snapshots",
+)
+
+
+def _flatten(raw: Dict[str, Any]) -> Dict[str, str]:
+    """Raw values, with group sub environments serialized in a stable order."""
+    return {
+        key: json.dumps(sorted(value.items())) if isinstance(value, dict) else value
+        for key, value in raw.items()
+    }
+
+
+def _named(fingerprint: Hashable, named: Set[str]):
+    """Collect the classes and functions names (see utils.hashable) of a schema fingerprint."""
+    if isinstance(fingerprint, tuple):
+        if (
+            len(fingerprint) == 2
+            and fingerprint[0] in ("type", "function")
+            and isinstance(fingerprint[1], str)
+        ):
+            named.add(fingerprint[1])
+            return
+        for item in fingerprint:
+            _named(item, named)
+
+
+def _resolve(name: str) -> Any:
+    """Class or function of a "<module>.<qualname>" name, None when not loaded."""
+    parts = name.split(".")
+    for index in range(len(parts) - 1, 0, -1):
+        module = sys.modules.get(".".join(parts[:index]))
+        if module is not None:
+            value = module
+            for part in parts[index:]:
+                value = getattr(value, part, None)
+            return value
+    return None
+
+
+def code_digest(schema) -> str:
+    """Hex digest of the source files defining the schema validators.
+
+    Validators are fingerprinted by their options and qualified names, which stay the same when
+    their code is edited. Source files of the validator classes (and their bases) and functions
+    are hashed, so editing them invalidates snapshots. Code without a source file (eg. defined in
+    an interactive session) is not covered.
+
+    :param schema: compiled EnvSchema.
+    """
+    named: Set[str] = set()
+    _named(schema.fingerprint, named)
+    modules = set()
+    for name in named:
+        value = _resolve(name)
+        for owner in value.__mro__ if isinstance(value, type) else (value,):
+            modules.add(getattr(owner, "__module__", None))
+    digest = hashlib.sha256()
+    for module in sorted(filter(None, modules)):
+        path = getattr(sys.modules.get(module), "__file__", None)
+        if path is None:
+            continue
+        try:
+            with open(path, "rb") as file:
+                digest.update(f"{module}\0".encode("utf-8") + file.read() + b"\0")
+        except OSError:
+            continue
+    return digest.hexdigest()
+
+
+class SnapshotCache:
+    """On disk cache of validated environments.
+
+    Only fully valid environments whose cleaned values are JSON types are stored. Files are
+    written atomically, readable by their owner only, as they hold validated (possibly secret)
+    values. A schema, validators source or envalidate version change changes the key, stale
+    files are ignored and removed by clear().
+    """
+
+    def __init__(self, directory: str = DEFAULT_DIRECTORY):
+        """Init SnapshotCache.
+
+        :param directory: snapshots directory, created on first store.
+        """
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self.__sources__: Dict[str, str] = {}
+
+    def key(self, schema, environment: Mapping[str, str]) -> str:
+        """Snapshot key of environment, for schema.
+
+        :param schema: compiled EnvSchema.
+        :param environment: An object containing your env vars (eg. os.environ)
+        """
+        if schema.nested:
+            environment = _flatten(schema.raw(environment))
+        get = environment.get
+        raw = "\0".join("!" if value is None else f"={value}" for value in map(get, schema.keys))
+        code = self.__sources__.get(schema.digest)
+        if code is None:
+            code = self.__sources__[schema.digest] = code_digest(schema)
+        header = f"{FORMAT_VERSION}\0{VERSION}\0{schema.digest}\0{code}\0"
+        return hashlib.sha256((header + raw).encode("utf-8", "surrogateescape")).hexdigest()
+
+    def path(self, key: str) -> str:
+        """Snapshot file path."""
+        return os.path.join(self.directory, f"{key}.json")
+
+    def load(self, schema, environment: Mapping[str, str]) -> Optional[Dict[str, Any]]:
+        """Load cleaned values of environment, None on miss.
+
+        :param schema: compiled EnvSchema.
+        :param environment: An object containing your env vars (eg. os.environ)
+        """
+        try:
+            with open(self.path(self.key(schema, environment)), encoding="utf-8") as file:
+                snapshot = json.load(file)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        if (
+            not isinstance(snapshot, dict)
+            or snapshot.get("format") != FORMAT_VERSION
+            or snapshot.get("version") != VERSION
+            or snapshot.get("schema") != schema.digest
+            or list(snapshot.get("values", ())) != list(schema.keys)
+        ):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return snapshot["values"]
+
+    def store(self, schema, environment: Mapping[str, str], values: Dict[str, Any]) -> bool:
+        """Store cleaned values of environment, atomically.
+
+        :param schema: compiled EnvSchema.
+        :param environment: An object containing your env vars (eg. os.environ)
+        :param values: cleaned values of every schema key.
+        :return: whether the snapshot was written, values not round tripping through JSON
+        (eg. custom objects, tuples) are not stored.
+        """
+        snapshot = {
+            "format": FORMAT_VERSION,
+            "version": VERSION,
+            "schema": schema.digest,
+            "values": values,
+        }
+        try:
+            payload = json.dumps(snapshot, allow_nan=False, separators=(",", ":"))
+        except (TypeError, ValueError):
+            return False
+        if json.loads(payload)["values"] != values:
+            return False
+        try:
+            os.makedirs(self.directory, mode=0o700, exist_ok=True)
+            descriptor, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except OSError:
+            return False
+        try:
+            with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+                file.write(payload)
+            os.replace(temporary, self.path(self.key(schema, environment)))
+        except OSError:
+            try:
+                os.unlink(temporary)
+            except OSError:
+                pass
+            return False
+        return True
+
+    def clear(self):
+        """Remove all snapshots."""
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+        for name in names:
+            if name.endswith((".json", ".tmp")):
+                try:
+                    os.unlink(os.path.join(self.directory, name))
+                except OSError:
+                    pass
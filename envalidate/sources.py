@@ -0,0 +1,218 @@
+"""Configuration Sources.
+
+Sources layers several mappings (process env, dotenv, JSON and TOML files, explicit overrides)
+into a single read only mapping. An index maps every key to the source supplying it, so a key
+is resolved with one index lookup and one lookup in its source, the source mappings are not
+copied, and the source of each value (its provenance) is known.
+"""
+
+import os
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Union
+
+_MISSING = object()
+
+
+def _stringify(values: Mapping[str, Any]) -> Dict[str, str]:
+    """Env like values, so they can be validated like env vars.
+
+    Strings are kept, nulls dropped, other values JSON encoded (eg. 8080, true, [1, 2]).
+    """
+    import json  # pylint: disable=import-outside-toplevel
+
+    return {
+        str(key): value if isinstance(value, str) else json.dumps(value)
+        for key, value in values.items()
+        if value is not None
+    }
+
+
+def _toml_loads():
+    """tomllib.loads (python 3.11+), or tomli.loads when installed."""
+    try:
+        import tomllib  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        try:
+            import tomli as tomllib  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            raise ImportError("Reading TOML files requires python 3.11+ or tomli") from None
+    return tomllib.loads
+
+
+class Source:
+    """Named mapping of env vars, one layer of Sources."""
+
+    __slots__ = ("name", "mapping")
+
+    def __init__(self, mapping: Mapping[str, str], name: str = None):
+        """Init Source.
+
+        :param mapping: env vars, used as is (not copied).
+        :param name: source name, shown in provenance and error messages.
+        """
+        self.mapping = mapping
+        self.name = name
+
+    @classmethod
+    def environ(cls) -> "Source":
+        """Process environment (os.environ), read live."""
+        return cls(os.environ, "environ")
+
+    @classmethod
+    def dotenv(cls, path: str) -> "Source":
+        """Dotenv file, parsed once.
+
+        :param path: dotenv file path.
+        """
+        from .dotenv import load_dotenv  # pylint: disable=import-outside-toplevel
+
+        return cls(load_dotenv(path), path)
+
+    @classmethod
+    def json(cls, path: str) -> "Source":
+        """JSON file holding an object, parsed once. Non string values are JSON encoded.
+
+        :param path: JSON file path.
+        """
+        import json  # pylint: disable=import-outside-toplevel
+
+        with open(path, encoding="utf-8") as file:
+            values = json.load(file)
+        if not isinstance(values, dict):
+            raise ValueError(f"{path}: expected a JSON object")
+        return cls(_stringify(values), path)
+
+    @classmethod
+    def toml(cls, path: str) -> "Source":
+        """TOML file, parsed once. Non string values (including tables) are JSON encoded.
+
+        :param path: TOML file path.
+        """
+        loads = _toml_loads()
+        with open(path, encoding="utf-8") as file:
+            values = loads(file.read())
+        return cls(_stringify(values), path)
+
+    @classmethod
+    def overrides(cls, values: Mapping[str, str], name: str = "overrides") -> "Source":
+        """Explicit values, eg. from command line arguments.
+
+        :param values: env vars, used as is (not copied).
+        :param name: source name.
+        """
+        return cls(values, name)
+
+    def __repr__(self):
+        """Repr."""
+        return f"Source({self.name!r})"
+
+
+class Sources(Mapping):
+    """Read only mapping layering sources, the first source supplying a key wins.
+
+    The key index is built when constructed, and again by refresh() and on iteration: keys added
+    to a source afterwards are not seen until then. Values of indexed keys are read live, and a
+    key removed from its source is looked up again in every source.
+    """
+
+    __slots__ = ("__sources__", "__index__")
+
+    def __init__(self, sources: Iterable[Union[Source, Mapping[str, str]]]):
+        """Init Sources.
+
+        :param sources: Sources, or plain mappings, by precedence (highest first). Unnamed
+        mappings are named "environ" (os.environ) or "sources[<position>]".
+        """
+        self.__sources__ = tuple(
+            _as_source(source, position) for position, source in enumerate(sources)
+        )
+        self.__index__: Dict[str, Source] = {}
+        self.refresh()
+
+    def refresh(self) -> "Sources":
+        """Index the keys of every source again."""
+        index: Dict[str, Source] = {}
+        for source in reversed(self.__sources__):
+            index.update(dict.fromkeys(source.mapping, source))
+        self.__index__ = index
+        return self
+
+    @property
+    def sources(self) -> tuple:
+        """Sources, by precedence."""
+        return self.__sources__
+
+    def __getitem__(self, key: str) -> str:
+        """Value of key, from the first source supplying it."""
+        source = self.__index__[key]
+        try:
+            return source.mapping[key]
+        except KeyError:
+            value = self._lookup(key)
+            if value is _MISSING:
+                raise
+            return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Value of key, default when no source supplies it (single index lookup)."""
+        source = self.__index__.get(key)
+        if source is None:
+            return default
+        try:
+            return source.mapping[key]
+        except KeyError:
+            value = self._lookup(key)
+            return default if value is _MISSING else value
+
+    def _lookup(self, key: str) -> Any:
+        """Value of a key removed from its indexed source, indexed again, _MISSING if unsupplied."""
+        for source in self.__sources__:
+            value = source.mapping.get(key, _MISSING)
+            if value is not _MISSING:
+                self.__index__[key] = source
+                return value
+        self.__index__.pop(key, None)
+        return _MISSING
+
+    def __contains__(self, key) -> bool:
+        """Whether a source supplies key."""
+        source = self.__index__.get(key)
+        if source is None:
+            return False
+        return key in source.mapping or self._lookup(key) is not _MISSING
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate keys, indexed again."""
+        return iter(self.refresh().__index__)
+
+    def __len__(self) -> int:
+        """Number of keys, indexed again."""
+        return len(self.refresh().__index__)
+
+    def source(self, key: str) -> Optional[str]:
+        """Name of the source supplying key, None when missing.
+
+        :param key: env var name.
+        """
+        return self.__index__[key].name if key in self else None
+
+    def provenance(self, keys: Iterable[str]) -> Dict[str, str]:
+        """Source name of each key supplied by a source.
+
+        :param keys: env var names.
+        """
+        index = self.__index__
+        return {key: index[key].name for key in keys if key in self}
+
+    def __repr__(self):
+        """Repr, without values."""
+        names = ", ".join(repr(source.name) for source in self.__sources__)
+        return f"Sources([{names}])"
+
+
+def _as_source(source: Union[Source, Mapping[str, str]], position: int) -> Source:
+    """Source of source, naming plain mappings."""
+    if isinstance(source, Source):
+        if source.name is None:
+            return Source(source.mapping, f"sources[{position}]")
+        return source
+    return Source(source, "environ" if source is os.environ else f"sources[{position}]")
@@ -0,0 +1,156 @@
+"""Parsed URLs."""
+
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Tuple
+
+URL_CACHE_SIZE = 1024
+_UNSET = object()
+
+
+class URL:
+    """Immutable url, keeping the raw string and parsing its components on first access.
+
+    Compares and hashes like its raw string, so it works in choices and as a dict key, and its
+    password is masked in repr. Use parse_url to share one URL (and its parsed components) per
+    raw string.
+    """
+
+    __slots__ = ("__raw__", "__split__", "__host__", "__port__")
+
+    def __init__(self, raw: str):
+        """Init URL.
+
+        :param raw: url string, it is not parsed until a component is accessed.
+        """
+        object.__setattr__(self, "__raw__", raw)
+        object.__setattr__(self, "__split__", None)
+        object.__setattr__(self, "__host__", _UNSET)
+        object.__setattr__(self, "__port__", _UNSET)
+
+    def __components__(self):
+        """Split components, memoized."""
+        split = self.__split__
+        if split is None:
+            from urllib.parse import urlsplit  # pylint: disable=import-outside-toplevel
+
+            split = urlsplit(self.__raw__)
+            object.__setattr__(self, "__split__", split)
+        return split
+
+    @property
+    def raw(self) -> str:
+        """Raw url string."""
+        return self.__raw__
+
+    @property
+    def scheme(self) -> str:
+        """Scheme, lower cased."""
+        return self.__components__().scheme
+
+    @property
+    def netloc(self) -> str:
+        """Network location, with credentials and port."""
+        return self.__components__().netloc
+
+    @property
+    def username(self) -> Optional[str]:
+        """User name."""
+        return self.__components__().username
+
+    @property
+    def password(self) -> Optional[str]:
+        """Password."""
+        return self.__components__().password
+
+    @property
+    def host(self) -> Optional[str]:
+        """Host name, lower cased, without brackets for ipv6 addresses."""
+        host = self.__host__
+        if host is _UNSET:
+            host = self.__components__().hostname
+            object.__setattr__(self, "__host__", host)
+        return host
+
+    @property
+    def port(self) -> Optional[int]:
+        """Port, None when not given, raises ValueError when invalid."""
+        port = self.__port__
+        if port is _UNSET:
+            port = self.__components__().port
+            object.__setattr__(self, "__port__", port)
+        return port
+
+    @property
+    def path(self) -> str:
+        """Path."""
+        return self.__components__().path
+
+    @property
+    def query(self) -> str:
+        """Query string."""
+        return self.__components__().query
+
+    @property
+    def query_params(self) -> Mapping[str, Tuple[str, ...]]:
+        """Read only mapping of the query parameters values."""
+        from urllib.parse import parse_qs  # pylint: disable=import-outside-toplevel
+
+        params = parse_qs(self.query, keep_blank_values=True)
+        return MappingProxyType({key: tuple(values) for key, values in params.items()})
+
+    @property
+    def fragment(self) -> str:
+        """Fragment."""
+        return self.__components__().fragment
+
+    @property
+    def masked(self) -> str:
+        """Url string, with the password masked."""
+        if self.password is None:
+            return self.__raw__
+        netloc = self.netloc
+        credentials, _, location = netloc.rpartition("@")
+        masked = f"{credentials.partition(':')[0]}:***@{location}"
+        return self.__raw__.replace(netloc, masked, 1)
+
+    def __setattr__(self, name, value):
+        """Frozen."""
+        raise TypeError(f'"{self.__class__.__name__}" is immutable and does not support assignment')
+
+    def __delattr__(self, name):
+        """Frozen."""
+        raise TypeError(f'"{self.__class__.__name__}" is immutable and does not support deletion')
+
+    def __reduce__(self):
+        """Pickle as the raw string."""
+        return self.__class__, (self.__raw__,)
+
+    def __eq__(self, other: Any) -> bool:
+        """Equal to URLs and strings with the same raw string."""
+        if isinstance(other, URL):
+            return self.__raw__ == other.__raw__
+        if isinstance(other, str):
+            return self.__raw__ == other
+        return NotImplemented
+
+    def __hash__(self):
+        """Hash of the raw string."""
+        return hash(self.__raw__)
+
+    def __str__(self):
+        """Raw string."""
+        return self.__raw__
+
+    def __repr__(self):
+        """Repr, with the password masked."""
+        return f"URL({self.masked!r})"
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def parse_url(raw: str) -> URL:
+    """Return the URL of raw, memoized per raw string.
+
+    :param raw: url string.
+    """
+    return URL(raw)
@@ -0,0 +1,52 @@
+"""Utils."""
+
+from types import BuiltinFunctionType, FunctionType, MappingProxyType
+from typing import Any, Hashable, Mapping
+
+_SCALARS = (str, bytes, bool, int, float, complex, type(None))
+
+
+def hashable(value: Any) -> Hashable:
+    """Return a deterministic, hashable representation of a value.
+
+    Scalars are tagged with their type so that ``1``, ``1.0`` and ``True`` stay distinct,
+    unordered containers are sorted so the result does not depend on insertion order.
+    Module level functions are identified by their qualified name, lambdas and closures by identity.
+
+    :param value: any value, eg. a validator field.
+    """
+    if isinstance(value, _SCALARS):
+        return (type(value).__name__, value)
+    if isinstance(value, type):
+        return ("type", f"{value.__module__}.{value.__qualname__}")
+    if isinstance(value, (FunctionType, BuiltinFunctionType)):
+        name = f"{value.__module__}.{value.__qualname__}"
+        return ("function", name if "<" not in name else value)
+    if isinstance(value, Mapping):
+        items = ((hashable(k), hashable(v)) for k, v in value.items())
+        return ("mapping", tuple(sorted(items, key=repr)))
+    if isinstance(value, (set, frozenset)):
+        return ("set", tuple(sorted((hashable(v) for v in value), key=repr)))
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(hashable(v) for v in value))
+    try:
+        hash(value)
+        return (type(value).__qualname__, value)
+    except TypeError:
+        return (type(value).__qualname__, repr(value))
+
+
+def freeze(value: Any) -> Any:
+    """Return a deeply immutable copy of a value (eg. parsed json).
+
+    dicts become read only mappings, lists become tuples and sets become frozensets.
+
+    :param value: any value.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(freeze(item) for item in value)
+    return value
@@ -1,63 +1,273 @@
 """Validators."""
 
 from abc import ABC, abstractmethod
-import json
-import re
-from typing import Any, Set
-from urllib.parse import urlparse
-
-from pydantic import BaseModel, Field
+from functools import lru_cache
+from types import MemberDescriptorType
+from typing import Any, Callable, Dict, Hashable, Mapping, Pattern, Tuple
 
+from . import cache as results_cache
 from .exceptions import EnvError
+from .network import Endpoint, NetworkSet, parse_address, parse_endpoint, parse_network
+from .url import parse_url
+from .utils import freeze, hashable
 
+MATCH_MODES = ("search", "match", "fullmatch")
+GUARDED_MAX_LENGTH = 4096
+NOT_IN_CHOICES = "not in choices"
 
-class EnValidator(BaseModel, ABC):
-    """Validator."""
 
-    name: str = Field(description="validator name.", required=True)
-    default: Any = Field(
-        description="A fallback value, which will be present in the output if the env var wasn't"
-        "specified. Providing a default effectively makes the env var optional."
-        "Note that default values are not passed through validation logic",
-        required=False,
-        default=None,
-    )
-    choices: Set = Field(
-        description="An Array that lists the admissible parsed values for the env var.",
-        required=False,
-        default=None,
-    )
-    desc: str = Field(
-        description="A string that describes the env var",
-        required=False,
-        default=None,
-    )
-    example: str = Field(
-        description="An example value for the env var.",
-        required=False,
-        default=None,
-    )
-    docs: str = Field(
-        description="A url that leads to more detailed documentation about the env var.",
-        required=False,
-        default=None,
+@lru_cache(maxsize=512)
+def compile_pattern(pattern: str, guarded: bool = False) -> Pattern:
+    """Compile a pattern once, and share it between validators.
+
+    :param pattern: regex pattern.
+    :param guarded: compile with the regex package, which supports matching timeout.
+    """
+    if guarded:
+        try:
+            import regex  # pylint: disable=import-outside-toplevel
+        except ImportError as ex:
+            raise ImportError(
+                "regex package is required for guarded patterns with timeout, "
+                "install envalidate[regex]"
+            ) from ex
+        return regex.compile(pattern)
+    import re  # pylint: disable=import-outside-toplevel
+
+    return re.compile(pattern)
+
+
+def _option_default(value: Any) -> Any:
+    """Default of an option declared on a subclass, pydantic Field declarations included."""
+    if type(value).__name__ == "FieldInfo":
+        default = getattr(value, "default", None)
+        return None if default is Ellipsis or type(default).__name__ == "UndefinedType" else default
+    return value
+
+
+class _CacheIdentity:
+    """Cache of a validator fingerprint, equal by identity, with a repr stable across processes."""
+
+    __slots__ = ("cache",)
+
+    def __init__(self, cache):
+        """Init _CacheIdentity.
+
+        :param cache: LRU, or None.
+        """
+        self.cache = cache
+
+    def __eq__(self, other):
+        """Same cache."""
+        return isinstance(other, _CacheIdentity) and self.cache is other.cache
+
+    def __hash__(self):
+        """Cache identity."""
+        return id(self.cache)
+
+    def __repr__(self):
+        """Cache type, so schema digests do not depend on the cache address."""
+        return f"cache={type(self.cache).__name__}"
+
+
+class EnValidator(ABC):
+    """Validator.
+
+    A slim __slots__ object, its options (name, default, choices, desc, example, docs, cache,
+    and the ones declared by subclasses) are set once at construction and frozen.
+    Subclasses declare extra options as annotated class attributes, the value being the default.
+    __cost__ ranks validators from cheap to expensive, for cheapest first validation.
+
+    :param name: validator name.
+    :param default: A fallback value, which will be present in the output if the env var wasn't
+    specified. Providing a default effectively makes the env var optional.
+    Note that default values are passed through validation, like raw values.
+    :param choices: admissible parsed values for the env var, frozen into a frozenset.
+    :param desc: A string that describes the env var.
+    :param example: An example value for the env var.
+    :param docs: A url that leads to more detailed documentation about the env var.
+    :param cache: An LRU caching results per raw value, the default cache (see
+    cache.set_default_cache) is used when not specified.
+    """
+
+    __options__: Tuple[str, ...] = (
+        "name",
+        "default",
+        "choices",
+        "desc",
+        "example",
+        "docs",
+        "cache",
     )
+    __slots__ = (*__options__, "__fingerprint__", "__result_key__")
+    __cost__ = 5
+    __option_defaults__: Dict[str, Any] = dict.fromkeys(__options__)
+
+    def __init_subclass__(cls, **kwargs):
+        """Collect the options declared by the subclass annotations."""
+        super().__init_subclass__(**kwargs)
+        options = list(cls.__options__)
+        defaults = {
+            **dict.fromkeys(options),
+            **super(cls, cls).__option_defaults__,
+            **cls.__dict__.get("__option_defaults__", {}),
+        }
+        for name in cls.__dict__.get("__annotations__", {}):
+            if name.startswith("_"):
+                continue
+            if name not in options:
+                options.append(name)
+            if name in cls.__dict__ and not isinstance(cls.__dict__[name], MemberDescriptorType):
+                defaults[name] = _option_default(cls.__dict__[name])
+        cls.__options__ = tuple(options)
+        cls.__option_defaults__ = {option: defaults.get(option) for option in options}
+
+    def __init__(self, **options):
+        """Init EnValidator, see the class docstring for options."""
+        cls = self.__class__
+        values = {**cls.__option_defaults__, **options}
+        if len(values) != len(cls.__options__):
+            unexpected = ", ".join(option for option in options if option not in cls.__options__)
+            raise TypeError(f"{cls.__name__} got unexpected options: {unexpected}")
+        setattr_ = object.__setattr__
+        for option, value in values.items():
+            setattr_(self, option, value)
+        if self.name is None:
+            raise TypeError(f"{cls.__name__} requires a name")
+        if self.choices is not None:
+            setattr_(self, "choices", frozenset(self.choices))
+        setattr_(self, "__fingerprint__", None)
+        setattr_(self, "__result_key__", None)
+
+    def __setattr__(self, name, value):
+        """Frozen."""
+        raise TypeError(f'"{self.__class__.__name__}" is immutable and does not support assignment')
+
+    def __delattr__(self, name):
+        """Frozen."""
+        raise TypeError(f'"{self.__class__.__name__}" is immutable and does not support deletion')
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Options, for pickle and copy."""
+        return self.options()
+
+    def __setstate__(self, state: Dict[str, Any]):
+        """Restore options, bypassing the frozen __setattr__."""
+        for option, value in state.items():
+            object.__setattr__(self, option, value)
+        object.__setattr__(self, "__fingerprint__", None)
+        object.__setattr__(self, "__result_key__", None)
+
+    def __eq__(self, other):
+        """Identically configured validators are equal."""
+        if not isinstance(other, EnValidator):
+            return NotImplemented
+        return self.fingerprint == other.fingerprint
+
+    def __hash__(self):
+        """Hash of the fingerprint."""
+        return hash(self.fingerprint)
+
+    def __repr__(self):
+        """Repr, showing options set to non default values."""
+        defaults = self.__option_defaults__
+        options = ", ".join(
+            f"{option}={value!r}"
+            for option, value in self.options().items()
+            if value is not defaults.get(option) and value != defaults.get(option)
+        )
+        return f"{self.__class__.__name__}({options})"
+
+    def options(self) -> Dict[str, Any]:
+        """Options, by name."""
+        return {option: getattr(self, option) for option in self.__options__}
+
+    def metadata(self) -> Dict[str, Any]:
+        """Documentation metadata of the validator, see EnvSchema.export."""
+        return {
+            "validator": self.name,
+            "default": self.default,
+            "choices": None if self.choices is None else sorted(self.choices, key=repr),
+            "desc": self.desc,
+            "example": self.example,
+            "docs": self.docs,
+        }
+
+    @property
+    def fingerprint(self) -> Hashable:
+        """Hashable identity of the validator, compiled schemas are looked up by it.
+
+        Equal for identically configured validators sharing the same cache.
+        """
+        fingerprint = self.__fingerprint__
+        if fingerprint is None:
+            fingerprint = (self.result_key, _CacheIdentity(self.cache))
+            object.__setattr__(self, "__fingerprint__", fingerprint)
+        return fingerprint
+
+    @property
+    def result_key(self) -> Hashable:
+        """Identity of the validator results, keying its cache entries.
+
+        The fingerprint without the cache, so identical validators share LRU entries.
+        """
+        result_key = self.__result_key__
+        if result_key is None:
+            options = tuple(
+                (option, hashable(getattr(self, option)))
+                for option in self.__options__
+                if option != "cache"
+            )
+            result_key = (hashable(self.__class__), options)
+            object.__setattr__(self, "__result_key__", result_key)
+        return result_key
 
     def envalidate(self, value: str) -> Any:
         """Valid key and raise error if invalid or return value if valid."""
+        cache = self.cache if self.cache is not None else results_cache.get_default_cache()
+        if cache is None or value.__class__ is not str:
+            return self.__envalidate__(value)
+        key = (self.result_key, value)
+        cached = cache.get(key)
+        if cached is not None:
+            is_error, result = cached
+            if is_error:
+                raise result
+            return result
+        try:
+            valid_value = self.__envalidate__(value)
+        except EnvError as ex:
+            cache.put(key, ex, is_error=True)
+            raise
+        return cache.put(key, valid_value)
+
+    def __envalidate__(self, value) -> Any:
+        """Validate value, and check choices."""
         valid_value = self.__validate__value__(value)
         if self.choices and valid_value not in self.choices:
-            raise EnvError(
-                self.format_validator_desc(
-                    f"Invalid {self.name} input: {value}, not in [{self.choices}]"
-                )
-            )
+            raise self.error(value, NOT_IN_CHOICES)
         return valid_value
 
     @abstractmethod
     def __validate__value__(self, value) -> Any:
         """Validate Value."""
 
+    def error(self, value, reason: str = None) -> EnvError:
+        """Create EnvError for value, its message is formatted on first access.
+
+        :param value: raw value.
+        :param reason: why the value is invalid, the value itself when not given.
+        """
+        return EnvError(validator=self, value=value, reason=reason)
+
+    def format_error(self, value, reason: str = None) -> str:
+        """Format error message."""
+        if reason is None:
+            reason = value
+        elif reason == NOT_IN_CHOICES:
+            reason = f"{value}, not in [{self.choices}]"
+        return self.format_validator_desc(f"Invalid {self.name} input: {reason}")
+
     def format_validator_desc(self, message) -> str:
         """Format validator description."""
         example = f"eg. {self.example}" if self.example else ""
@@ -73,6 +283,9 @@ class Str(EnValidator):
     Note that an empty string is considered a valid value
     """
 
+    __slots__ = ()
+    __cost__ = 1
+
     def __init__(self, **kwargs):
         """Init Str Validator."""
         super().__init__(name="str", **kwargs)
@@ -85,6 +298,9 @@ class Str(EnValidator):
 class Bool(EnValidator):
     """Parses env var strings "1", "0", "True", "False" into booleans."""
 
+    __slots__ = ()
+    __cost__ = 2
+
     def __init__(self, **kwargs):
         """Init Bool Validator."""
         super().__init__(name="bool", **kwargs)
@@ -95,12 +311,15 @@ class Bool(EnValidator):
             return False
         if value == "1" or value.lower() == "true":
             return True
-        raise EnvError(self.format_validator_desc(f"Invalid {self.name} input: {value}"))
+        raise self.error(value)
 
 
 class Number(EnValidator):
     """Parses an env var (eg. "42", "0.23", "1e5") into a Number."""
 
+    __slots__ = ()
+    __cost__ = 2
+
     def __init__(self, **kwargs):
         """Init Number Validator."""
         super().__init__(name="number", **kwargs)
@@ -111,49 +330,184 @@ class Number(EnValidator):
             value = float(value)
             return int(value) if float.is_integer(value) else value
         except ValueError as ex:
-            raise EnvError(
-                self.format_validator_desc(f"Invalid {self.name} input: {value}")
-            ) from ex
+            raise self.error(value) from ex
 
 
 class RegexEnValidator(EnValidator):
-    """Ensures an env var match regex pattern."""
+    """Ensures an env var match regex pattern.
+
+    The pattern is compiled once, and shared between validators with the same pattern.
+    match_mode is one of "search", "match" or "fullmatch".
+    guarded mode rejects values longer than max_length (GUARDED_MAX_LENGTH by default) before
+    matching, and bounds the matching time with timeout, which requires the regex package
+    (envalidate[regex]). Guarded validators without timeout only bound the length, and warn.
+    """
 
-    pattern: str = Field(required=True)
+    __slots__ = ("pattern", "match_mode", "guarded", "max_length", "timeout", "__matcher__")
+    __cost__ = 4
+    __option_defaults__ = {"match_mode": "search", "guarded": False}
+    pattern: str
+    match_mode: str
+    guarded: bool
+    max_length: int
+    timeout: float
 
     def __init__(self, name, **kwargs):
-        """Init Regex Validator."""
+        """Init Regex Validator.
+
+        :param pattern: regex pattern.
+        :param match_mode: search, match or fullmatch.
+        :param guarded: bound input length and matching time.
+        :param max_length: max value length, in characters.
+        :param timeout: max matching time, in seconds.
+        """
         super().__init__(name=name, **kwargs)
+        if self.pattern is None:
+            raise TypeError(f"{self.__class__.__name__} requires a pattern")
+        if self.guarded and self.timeout is None:
+            import warnings  # pylint: disable=import-outside-toplevel
+
+            warnings.warn(
+                f"guarded pattern {self.pattern!r} has no timeout, only the value length is "
+                "bounded: pass timeout (requires envalidate[regex]) to bound the matching time",
+                stacklevel=2,
+            )
+        self._compile()
+
+    def __setstate__(self, state):
+        """Restore options, and recompile the pattern."""
+        super().__setstate__(state)
+        self._compile()
+
+    def _compile(self):
+        """Bind the matcher of the shared compiled pattern."""
+        if self.match_mode not in MATCH_MODES:
+            raise ValueError(
+                f"Invalid match_mode: {self.match_mode}, expected one of {MATCH_MODES}"
+            )
+        guarded = self.guarded and self.timeout is not None
+        matcher = getattr(compile_pattern(self.pattern, guarded=guarded), self.match_mode)
+        object.__setattr__(self, "__matcher__", matcher)
 
     def __validate__value__(self, value) -> Any:
         """Validate regex value."""
-        match = re.search(re.compile(self.pattern), value)
+        if self.guarded and len(value) > (self.max_length or GUARDED_MAX_LENGTH):
+            raise self.error(value, "value is too long")
+        try:
+            match = (
+                self.__matcher__(value, timeout=self.timeout)
+                if self.guarded and self.timeout is not None
+                else self.__matcher__(value)
+            )
+        except TimeoutError as ex:
+            raise self.error(value, "matching timed out") from ex
         if match:
             return value
-        raise EnvError(self.format_validator_desc(f"Invalid {self.name} input: {value}"))
+        raise self.error(value)
 
 
 class Email(RegexEnValidator):
     """Ensures an env var is an email address."""
 
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         """Init Email Validator."""
         email_regex = r"\"?([-a-zA-Z0-9.`?{}]+@\w+\.\w+)\"?"
         super().__init__(name="e-mail", pattern=email_regex, **kwargs)
 
 
-class IPAddress(RegexEnValidator):
-    """Ensures an env var is an ip address with or without port."""
+class IPAddress(EnValidator):
+    """Ensures an env var is an ip address (v4 or v6), with or without port.
+
+    "10.0.0.1", "10.0.0.1:8000", "::1" or "[::1]:8000" are parsed with the ipaddress module,
+    and "10.0.0.0/8" networks are accepted with network=True. choices is an allowlist of
+    networks and addresses, compiled once into a network.NetworkSet prefix table, addresses
+    with a port (eg. "10.0.0.1:8000") only allow that exact endpoint.
+    parsed returns ipaddress objects (an network.Endpoint when there is a port) instead of the
+    raw string.
+    """
+
+    __slots__ = ("version", "port", "network", "parsed")
+    __cost__ = 4
+    __option_defaults__ = {"network": False, "parsed": False}
+    version: int
+    port: bool
+    network: bool
+    parsed: bool
 
     def __init__(self, **kwargs):
-        """Init IP Validator."""
-        ipv4_regex = r"[0-9]+(?:\.[0-9]+){3}(:[0-9]+)?"
-        super().__init__(name="ip address", pattern=ipv4_regex, **kwargs)
+        """Init IP Validator.
+
+        :param version: 4 or 6, both by default.
+        :param port: True requires a port, False rejects it, optional by default.
+        :param network: accept networks in CIDR notation (without host bits).
+        :param parsed: return ipaddress objects.
+        :param choices: networks and addresses allowlist, or a compiled network.NetworkSet.
+        """
+        choices = kwargs.pop("choices", None)
+        super().__init__(name="ip address", **kwargs)
+        if self.version not in (None, 4, 6):
+            raise ValueError(f"Invalid version: {self.version}, expected 4 or 6")
+        if choices is not None:
+            if not isinstance(choices, NetworkSet):
+                choices = NetworkSet(choices)
+            object.__setattr__(self, "choices", choices)
+
+    def __envalidate__(self, value) -> Any:
+        """Validate value, and check it is in the choices networks."""
+        address, port = self.__parse__(value)
+        member = address if port is None else Endpoint(address, port)
+        if self.choices and member not in self.choices:
+            raise self.error(value, NOT_IN_CHOICES)
+        return self.__result__(value, address, port)
+
+    def __validate__value__(self, value) -> Any:
+        """Validate ip address value."""
+        return self.__result__(value, *self.__parse__(value))
+
+    def __result__(self, value, address, port) -> Any:
+        """Raw value, or parsed address and port."""
+        if not self.parsed:
+            return value
+        return address if port is None else Endpoint(address, port)
+
+    def __parse__(self, value):
+        """Parse value into an address (or network) and a port."""
+        try:
+            host, port = parse_endpoint(value)
+            port = self.__port__(port)
+            if "/" not in host:
+                address = parse_address(host)
+            elif self.network and port is None:
+                address = parse_network(host)
+            else:
+                raise ValueError("networks are not allowed")
+        except ValueError as ex:
+            raise self.error(value, f"{value}, {ex}") from ex
+        if self.version is not None and address.version != self.version:
+            raise self.error(value, f"{value}, not an ipv{self.version} address")
+        return address, port
+
+    def __port__(self, port: str) -> int:
+        """Check the port presence and range."""
+        if port is None:
+            if self.port:
+                raise ValueError("port is required")
+            return None
+        if self.port is False:
+            raise ValueError("port is not allowed")
+        if not (port.isascii() and port.isdigit() and 1 <= int(port) <= 65535):
+            raise ValueError("invalid port")
+        return int(port)
 
 
 class Port(EnValidator):
     """Ensures an env var is a TCP port (1-65535)."""
 
+    __slots__ = ()
+    __cost__ = 2
+
     def __init__(self, **kwargs):
         """Init Port Validator."""
         super().__init__(name="port", **kwargs)
@@ -161,43 +515,248 @@ class Port(EnValidator):
     def __validate__value__(self, value) -> Any:
         """Validate port value."""
         try:
-            value = float(value)
-            if float.is_integer(value) and 1 <= value <= 65535:
-                return int(value)
+            number = float(value)
+            if float.is_integer(number) and 1 <= number <= 65535:
+                return int(number)
         except ValueError:
             ...
 
-        raise EnvError(self.format_validator_desc(f"Invalid {self.name} input: {value}"))
+        raise self.error(value)
 
 
 class Url(EnValidator):
-    """Ensures an env var is a url with a protocol and hostname."""
+    """Ensures an env var is a url with a protocol and hostname.
+
+    schemes and hosts are allow-lists (hosts entries starting with "*." match subdomains) and
+    port_range bounds explicit ports, all checked on the url parsed once and memoized per raw
+    value (see url.parse_url). parsed returns an immutable url.URL instead of the raw string.
+    """
+
+    __slots__ = ("schemes", "hosts", "port_range", "parsed", "__host_suffixes__")
+    __cost__ = 6
+    __option_defaults__ = {"parsed": False}
+    schemes: frozenset
+    hosts: frozenset
+    port_range: tuple
+    parsed: bool
 
     def __init__(self, **kwargs):
-        """Init Url Validator."""
+        """Init Url Validator.
+
+        :param schemes: allowed schemes, eg. {"https"}.
+        :param hosts: allowed host names, eg. {"api.example.com", "*.internal"}.
+        :param port_range: (min, max) allowed explicit ports.
+        :param parsed: return an immutable url.URL.
+        """
         super().__init__(name="url", **kwargs)
+        if self.schemes is not None:
+            object.__setattr__(self, "schemes", frozenset(map(str.lower, self.schemes)))
+        if self.hosts is not None:
+            object.__setattr__(self, "hosts", frozenset(map(str.lower, self.hosts)))
+        if self.port_range is not None:
+            low, high = self.port_range
+            object.__setattr__(self, "port_range", (low, high))
+        self._compile()
+
+    def __setstate__(self, state):
+        """Restore options, and the hosts suffixes."""
+        super().__setstate__(state)
+        self._compile()
+
+    def _compile(self):
+        """Collect the hosts suffixes, matched with a single endswith."""
+        suffixes = tuple(host[1:] for host in self.hosts or () if host.startswith("*."))
+        object.__setattr__(self, "__host_suffixes__", suffixes)
 
     def __validate__value__(self, value) -> Any:
         """Validate url value."""
-        result = urlparse(value)
-        if result.scheme and result.netloc:
-            return value
-        raise EnvError(self.format_validator_desc(f"Invalid {self.name} input: {value}"))
+        url = parse_url(value)
+        if not (url.scheme and url.netloc):
+            raise self.error(value, url.masked)
+        if self.schemes is not None and url.scheme not in self.schemes:
+            raise self.error(value, f"{url.masked}, scheme {url.scheme} is not allowed")
+        if self.hosts is not None:
+            host = url.host or ""
+            if host not in self.hosts and not (
+                self.__host_suffixes__ and host.endswith(self.__host_suffixes__)
+            ):
+                raise self.error(value, f"{url.masked}, host {host} is not allowed")
+        try:
+            port = url.port
+        except ValueError as ex:
+            raise self.error(value, f"{url.masked}, invalid port") from ex
+        if self.port_range is not None and port is not None:
+            low, high = self.port_range
+            if not low <= port <= high:
+                raise self.error(value, f"{url.masked}, port {port} not in {low}-{high}")
+        return url if self.parsed else value
+
+
+@lru_cache(maxsize=None)
+def json_decoder() -> Callable[[str], Any]:
+    """Default Json decoder, orjson.loads when installed, json.loads otherwise.
+
+    Values orjson rejects but json.loads accepts (eg. NaN, integers over 64 bits) are decoded by
+    json.loads, so both parse the same documents.
+    """
+    import json  # pylint: disable=import-outside-toplevel
+
+    try:
+        import orjson  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return json.loads
+
+    def loads(value: str) -> Any:
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            return json.loads(value)
+
+    return loads
 
 
 class Json(EnValidator):
-    """Parses an env var with JSON.parse."""
+    """Parses an env var with JSON.parse.
+
+    max_bytes rejects larger values before parsing, schema is a JSON Schema (subset, see
+    json_schema) compiled once and checked against the parsed value, and frozen returns deeply
+    immutable values (see utils.freeze), safe to cache and share.
+    """
+
+    __slots__ = ("decoder", "max_bytes", "schema", "frozen", "__checker__")
+    __cost__ = 8
+    __option_defaults__ = {"frozen": False}
+    decoder: Callable
+    max_bytes: int
+    schema: Mapping
+    frozen: bool
 
     def __init__(self, **kwargs):
-        """Init Json Validator."""
+        """Init Json Validator.
+
+        :param decoder: callable parsing a json string, see json_decoder by default.
+        :param max_bytes: max utf-8 encoded value size.
+        :param schema: JSON Schema of the parsed value, copied at construction.
+        :param frozen: return deeply immutable values.
+        """
         super().__init__(name="json", **kwargs)
+        if self.schema is not None:
+            import copy  # pylint: disable=import-outside-toplevel
+
+            object.__setattr__(self, "schema", copy.deepcopy(self.schema))
+        self._compile()
+
+    def __setstate__(self, state):
+        """Restore options, and recompile the schema."""
+        super().__setstate__(state)
+        self._compile()
+
+    def _compile(self):
+        """Compile the JSON Schema once."""
+        checker = None
+        if self.schema is not None:
+            from .json_schema import compile_json_schema  # pylint: disable=import-outside-toplevel
+
+            checker = compile_json_schema(self.schema)
+        object.__setattr__(self, "__checker__", checker)
+
+    def metadata(self) -> Dict[str, Any]:
+        """Documentation metadata, with the JSON Schema of the value."""
+        return {**super().metadata(), "json_schema": self.schema}
 
     def __validate__value__(self, value) -> Any:
         """Validate json value."""
+        max_bytes = self.max_bytes
+        if max_bytes is not None and (
+            len(value) > max_bytes
+            or not value.isascii()
+            and len(value.encode("utf-8", "surrogatepass")) > max_bytes
+        ):
+            raise self.error(value, f"value is larger than {max_bytes} bytes")
         try:
-            value = json.loads(value)
-            return value
-        except json.decoder.JSONDecodeError as ex:
-            raise EnvError(
-                self.format_validator_desc(f"Invalid {self.name} input: {value}")
-            ) from ex
+            parsed = (self.decoder or json_decoder())(value)
+        except ValueError as ex:
+            raise self.error(value) from ex
+        if self.__checker__ is not None:
+            try:
+                self.__checker__(parsed)
+            except ValueError as ex:
+                raise self.error(value, str(ex)) from ex
+        return freeze(parsed) if self.frozen else parsed
+
+
+class FunctionValidator(EnValidator):
+    """Validates with a plain callable, returning the parsed value.
+
+    The callable rejects a value by raising ValueError or TypeError (their message is the error
+    reason), or an EnvError. Callables given in place of validators in read_env are wrapped
+    into a FunctionValidator, see also the validator decorator.
+    """
+
+    __slots__ = ("function",)
+    function: Callable
+
+    def __init__(self, function: Callable = None, **kwargs):
+        """Init Function Validator.
+
+        :param function: callable parsing a raw value, the decorated function by default.
+        :param kwargs: validator options, name defaults to the function name.
+        """
+        function = function or getattr(self.__class__, "__function__", None)
+        if not callable(function):
+            raise TypeError(f"{self.__class__.__name__} requires a callable")
+        if isinstance(function, type) and issubclass(function, EnValidator):
+            raise TypeError(f"{function.__name__} is a validator class, instantiate it")
+        if self.__option_defaults__.get("name") is None:
+            kwargs.setdefault("name", getattr(function, "__name__", function.__class__.__name__))
+        super().__init__(function=function, **kwargs)
+
+    def __validate__value__(self, value) -> Any:
+        """Validate value with the function."""
+        try:
+            return self.function(value)
+        except (ValueError, TypeError) as ex:
+            raise self.error(value, f"{value}, {ex}" if str(ex) else None) from ex
+
+
+def validator(function: Callable = None, **options):
+    """Decorate a function into a validator class, eg.
+
+    @validator
+    def even(value):
+        if int(value) % 2:
+            raise ValueError("odd number")
+        return int(value)
+
+    read_env(os.environ, {"WORKERS": even(default=2)})
+
+    :param function: function parsing a raw value, see FunctionValidator.
+    :param options: default validator options (eg. name, desc) of the class.
+    """
+
+    def decorate(function: Callable):
+        namespace = {
+            "__slots__": (),
+            "__module__": function.__module__,
+            "__qualname__": function.__qualname__,
+            "__doc__": function.__doc__,
+            "__function__": staticmethod(function),
+            "__option_defaults__": {"name": function.__name__, **options},
+        }
+        return type(function.__name__, (FunctionValidator,), namespace)
+
+    return decorate if function is None else decorate(function)
+
+
+def as_validator(value: Any) -> EnValidator:
+    """Return value as a validator, wrapping plain callables into a FunctionValidator.
+
+    :param value: EnValidator or callable.
+    """
+    if isinstance(value, EnValidator):
+        return value
+    if isinstance(value, type) and issubclass(value, EnValidator):
+        raise TypeError(f"{value.__name__} is a validator class, instantiate it")
+    if callable(value):
+        return FunctionValidator(value)
+    raise TypeError(f"{type(value).__name__} is not a validator")
@@ -26,10 +26,11 @@ setup(
     license=license_txt,
     packages=find_packages(exclude=('docs', 'tests')),
     install_requires=required,
+    entry_points={'console_scripts': ['envalidate=envalidate.cli:main']},
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    python_requires='>=3.6',
+    python_requires='>=3.7',
 )
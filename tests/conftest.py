@@ -1,4 +1,5 @@
 """Fixtures."""
+
 from typing import Callable, Dict, Set
 from unittest.mock import Mock
 
@@ -0,0 +1 @@
+"""Fixtures modules."""
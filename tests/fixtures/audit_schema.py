@@ -0,0 +1,5 @@
+"""Audit schema."""
+
+from envalidate import Bool, Port, Str
+
+VALIDATORS = {"HOST": Str(), "PORT": Port(), "DEBUG": Bool(default="false")}
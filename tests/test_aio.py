@@ -0,0 +1,117 @@
+"""Test Asyncio Support."""
+
+import asyncio
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+from envalidate import Group, Pattern, Port, Str
+from envalidate.aio import aread_env, AsyncEnValidator
+from envalidate.exceptions import EnvError
+from envalidate.reporters import DefaultReporter
+
+
+class SleepyUpper(AsyncEnValidator):
+    """Async validator, sleeping for delay seconds."""
+
+    delay: float = 0.05
+
+    def __init__(self, **kwargs):
+        """Init SleepyUpper Validator."""
+        super().__init__(name="sleepy upper", **kwargs)
+
+    async def __validate__value__(self, value) -> Any:
+        """Validate value."""
+        await asyncio.sleep(self.delay)
+        if not value:
+            raise EnvError(f"{value} is empty.")
+        return value.upper()
+
+
+def test_aread_env_concurrent():
+    """Test async validators run concurrently, sync ones inline."""
+    validators = {f"KEY_{i}": SleepyUpper() for i in range(10)}
+    validators["PORT"] = Port()
+    environment = {**{f"KEY_{i}": f"v{i}" for i in range(10)}, "PORT": "80"}
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        env = await aread_env(environment, validators, result="slots")
+        return env, loop.time() - start
+
+    env, elapsed = asyncio.run(main())
+    assert env.KEY_3 == "V3" and env.PORT == 80
+    assert list(env.as_mapping()) == list(validators)
+    assert elapsed < 0.4
+
+
+def test_aread_env_errors_and_timeouts():
+    """Test errors, per validator timeouts and overall deadline are reported together."""
+    on_error_mock = Mock()
+    validators = {
+        "HOST": Str(),
+        "EMPTY": SleepyUpper(delay=0),
+        "SLOW": SleepyUpper(delay=1, timeout=0.01),
+        "DEADLINE": SleepyUpper(delay=1),
+        "MISSING": SleepyUpper(),
+    }
+    environment = {"HOST": "a", "EMPTY": "", "SLOW": "x", "DEADLINE": "x"}
+    coroutine = aread_env(environment, validators, DefaultReporter(on_error_mock), timeout=0.1)
+    env = asyncio.run(coroutine)
+    assert env.HOST == "a"
+    assert set(on_error_mock.call_args[0][0]) == {"EMPTY", "SLOW", "DEADLINE", "MISSING"}
+
+
+class Unreachable(AsyncEnValidator):
+    """Async validator failing with a non EnvError exception."""
+
+    def __init__(self, **kwargs):
+        """Init Unreachable Validator."""
+        super().__init__(name="unreachable", **kwargs)
+
+    async def __validate__value__(self, value) -> Any:
+        """Validate value."""
+        raise OSError("host unreachable")
+
+
+def test_aread_env_unexpected_exceptions():
+    """Test exceptions other than EnvError are reported as errors of their key."""
+    on_error_mock = Mock()
+    validators = {"A": Unreachable(), "B": Str(), "C": SleepyUpper(delay=1)}
+    coroutine = aread_env(
+        {"A": "x", "B": "y", "C": "z"}, validators, DefaultReporter(on_error_mock), timeout=0.05
+    )
+    env = asyncio.run(coroutine)
+    assert env.B == "y"
+    errors = on_error_mock.call_args[0][0]
+    assert list(errors) == ["A", "C"]
+    assert str(errors["A"]).startswith("Invalid unreachable input: host unreachable")
+    assert [error.key for error in errors.values()] == ["A", "C"]
+
+
+def test_aread_env_nested_async_validators():
+    """Test async validators of groups and patterns are awaited, in the running loop."""
+    on_error_mock = Mock()
+    validators = {
+        "PORT": Port(),
+        "DB": Group({"HOST": SleepyUpper(), "PORT": Port(), "NAME": SleepyUpper()}, "DB_"),
+        "TAGS": Pattern("TAG_*", SleepyUpper(delay=0)),
+    }
+    environment = {"PORT": "80", "DB_HOST": "h", "DB_PORT": "x", "TAG_A": "a", "TAG_B": ""}
+    coroutine = aread_env(environment, validators, DefaultReporter(on_error_mock), result="slots")
+    env = asyncio.run(coroutine)
+    assert env.PORT == 80
+    assert dict(env.DB) == {"HOST": "H"}
+    assert dict(env.TAGS) == {"TAG_A": "A"}
+    errors = on_error_mock.call_args[0][0]
+    assert set(errors) == {"DB_PORT", "DB_NAME", "TAG_B"}
+    assert [errors[key].key for key in errors] == list(errors)
+
+
+def test_async_validator_sync_use():
+    """Test async validator outside an event loop."""
+    assert SleepyUpper(delay=0).envalidate("a") == "A"
+    with pytest.raises(EnvError):
+        SleepyUpper(delay=0, choices={"B"}).envalidate("a")
@@ -0,0 +1,103 @@
+"""Test Batch Validation."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from envalidate import Bool, Group, Json, Number, Port, read_env, Str
+from envalidate.batch import read_env_many
+from envalidate.reporters import DefaultReporter
+
+
+@pytest.fixture(scope="session")
+def batch_validators():
+    """Batch validators."""
+    return {
+        "HOST": Str(),
+        "PORT": Port(default=8000),
+        "IS_TEST": Bool(),
+        "AGENTS": Number(choices={1, 2, 3.5}),
+        "RATIO": Number(),
+        "CONFIG": Json(default="{}"),
+    }
+
+
+@pytest.fixture(scope="session")
+def batch_environments():
+    """Valid and invalid environments."""
+    return [
+        {"HOST": "a", "PORT": "80", "IS_TEST": "true", "AGENTS": "1", "RATIO": "0.5"},
+        {"HOST": "b", "IS_TEST": "0", "AGENTS": "3.5", "RATIO": "1e5", "CONFIG": '{"x": 1}'},
+        {"HOST": "c", "PORT": "80", "IS_TEST": "FALSE", "AGENTS": "2", "RATIO": "-3"},
+        {"PORT": "65536", "IS_TEST": "t", "AGENTS": "4", "RATIO": "abc", "CONFIG": "{"},
+        {"HOST": "d", "PORT": "80.5", "IS_TEST": "1", "AGENTS": "1", "CONFIG": '{"x": 1}'},
+    ]
+
+
+def test_read_env_many_matches_read_env(batch_environments, batch_validators):
+    """Test batch results and errors match scalar read_env."""
+    results, errors = read_env_many(batch_environments, batch_validators, result="slots")
+    for environment, env, env_errors in zip(batch_environments, results, errors):
+        on_error_mock = Mock()
+        expected = read_env(
+            environment, batch_validators, DefaultReporter(on_error_mock), result="slots"
+        )
+        assert env == expected
+        expected_errors = on_error_mock.call_args[0][0] if on_error_mock.called else {}
+        assert {key: type(ex) for key, ex in env_errors.items()} == {
+            key: type(ex) for key, ex in expected_errors.items()
+        }
+        assert {key: ex.message for key, ex in env_errors.items()} == {
+            key: ex.message for key, ex in expected_errors.items()
+        }
+
+
+def test_read_env_many_does_not_share_mutable_values(batch_environments, batch_validators):
+    """Test identical Json values are not shared between environments."""
+    results, _ = read_env_many(batch_environments, batch_validators, result="slots")
+    assert results[1].CONFIG == results[4].CONFIG
+    assert results[1].CONFIG is not results[4].CONFIG
+
+
+def test_read_env_many_groups():
+    """Test groups are validated per environment, with errors keyed by env var name."""
+    validators = {"HOST": Str(), "DB": Group({"PORT": Port()}, prefix="DB_")}
+    results, errors = read_env_many(
+        [{"HOST": "a", "DB_PORT": "1"}, {"HOST": "b", "DB_PORT": "x"}], validators, "slots"
+    )
+    assert results[0].DB.PORT == 1
+    assert list(results[0].as_mapping()) == ["HOST", "DB"]
+    assert list(errors[1]) == ["DB_PORT"]
+
+
+def test_read_env_many_errors_keys(batch_environments, batch_validators):
+    """Test batch errors carry their env var name."""
+    _, errors = read_env_many(batch_environments, batch_validators, result="slots")
+    assert {key: error.key for key, error in errors[3].items()} == {
+        "HOST": "HOST",
+        "PORT": "PORT",
+        "IS_TEST": "IS_TEST",
+        "AGENTS": "AGENTS",
+        "RATIO": "RATIO",
+        "CONFIG": "CONFIG",
+    }
+
+
+def test_read_env_many_defaults():
+    """Test missing values take the validator default, once per column."""
+    validators = {"PORT": Port(default=8000), "CONFIG": Json(default="{}")}
+    results, errors = read_env_many([{}, {"PORT": "80"}, {}], validators, result="slots")
+    assert [env.PORT for env in results] == [8000, 80, 8000]
+    assert results[0].CONFIG == results[2].CONFIG == {}
+    assert results[0].CONFIG is not results[2].CONFIG
+    assert errors == [{}, {}, {}]
+
+
+def test_read_env_many_unhashable_values():
+    """Test unhashable raw values are validated one by one, like read_env does."""
+    environments = [{"A": "x", "P": "80"}, {"A": ["a"], "P": "x"}, {"A": "x"}]
+    values, errors = read_env_many(environments, {"A": Str(), "P": Port()}, result="slots")
+    assert [value.A for value in values[:2]] == ["x", ["a"]]
+    assert values[0].P == 80
+    assert [set(error) for error in errors] == [set(), {"P"}, {"P"}]
+    assert errors[1]["P"].key == "P"
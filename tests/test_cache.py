@@ -0,0 +1,90 @@
+"""Test Validator Results Cache."""
+
+from types import MappingProxyType
+
+import pytest
+
+from envalidate import Json, Number, Port, read_env, Url
+from envalidate.cache import get_default_cache, LRU, set_default_cache
+from envalidate.exceptions import EnvError
+
+
+def test_cache_hits_and_misses():
+    """Test identical validators share cached results."""
+    cache = LRU(maxsize=10)
+    assert Number(cache=cache).envalidate("42") == 42
+    assert Number(cache=cache).envalidate("42") == 42
+    assert Number(cache=cache, choices={1, 42}).envalidate("42") == 42
+    info = cache.info()
+    assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+
+def test_cache_errors():
+    """Test invalid values are cached as errors."""
+    cache = LRU()
+    validator = Url(cache=cache)
+    for _ in range(2):
+        with pytest.raises(EnvError):
+            validator.envalidate("www.test.com")
+    assert cache.info().hits == 1
+
+
+def test_cache_mutable_results_copied():
+    """Test mutable results are not shared with the cache."""
+    validator = Json(cache=LRU())
+    first = validator.envalidate('{"x": [1]}')
+    first["x"].append(2)
+    second = validator.envalidate('{"x": [1]}')
+    assert second == {"x": [1]}
+    second["y"] = 1
+    assert validator.envalidate('{"x": [1]}') == {"x": [1]}
+
+
+def test_cache_frozen_results():
+    """Test frozen results are deeply immutable and shared."""
+    validator = Json(cache=LRU(frozen=True))
+    first = validator.envalidate('{"x": [1]}')
+    assert isinstance(first, MappingProxyType)
+    assert first["x"] == (1,)
+    assert validator.envalidate('{"x": [1]}') is first
+
+
+def test_cache_eviction():
+    """Test size and byte based eviction."""
+    cache = LRU(maxsize=2)
+    validator = Number(cache=cache)
+    for value in ("1", "2", "3"):
+        validator.envalidate(value)
+    assert len(cache) == 2
+    bytes_cache = LRU(maxsize=None, maxbytes=200)
+    validator = Number(cache=bytes_cache)
+    for value in range(20):
+        validator.envalidate(str(value))
+    assert 0 < bytes_cache.info().bytes <= 200
+
+
+def test_default_cache():
+    """Test default cache is used by validators without their own cache."""
+    cache = LRU()
+    set_default_cache(cache)
+    try:
+        assert get_default_cache() is cache
+        Number().envalidate("1")
+        assert len(cache) == 1
+    finally:
+        set_default_cache(None)
+
+
+def test_schema_with_and_without_cache():
+    """Test validators differing only in cache do not share a compiled schema."""
+    environment = {"PORT": "8000", "CONFIG": '{"x": 1}'}
+    read_env(environment, {"PORT": Port(), "CONFIG": Json()}, result="slots")
+    cache = LRU()
+    read_env(environment, {"PORT": Port(cache=cache)}, result="slots")
+    assert cache.info().misses == 1
+    frozen = read_env(environment, {"CONFIG": Json(cache=LRU(frozen=True))}, result="slots")
+    assert isinstance(frozen.CONFIG, MappingProxyType)
+    read_env(environment, {"PORT": Port()}, result="slots")
+    assert cache.info().misses == 1
+    assert Port(cache=cache) != Port()
+    assert Port(cache=cache).result_key == Port().result_key
@@ -0,0 +1,46 @@
+"""Test CLI."""
+
+import json
+
+import pytest
+
+from envalidate.cli import audit, main
+
+SCHEMA = "tests.fixtures.audit_schema"
+
+
+@pytest.fixture()
+def env_files(tmp_path):
+    """Valid, invalid and broken dotenv files."""
+    (tmp_path / "a").mkdir()
+    (tmp_path / "a" / "valid.env").write_text("HOST=google\nexport PORT=8000\n")
+    (tmp_path / "a" / "invalid.env").write_text("# comment\nPORT='99999'\n")
+    (tmp_path / "broken.env").write_text("HOST\n")
+    (tmp_path / "ignored.txt").write_text("HOST=google\n")
+    yield tmp_path
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_audit(env_files, workers):
+    """Test audit records."""
+    records = {
+        record["path"]: record
+        for record in audit(SCHEMA, [str(env_files)], workers=workers, chunksize=1)
+    }
+    assert len(records) == 3
+    assert records[str(env_files / "a" / "valid.env")] == {
+        "path": str(env_files / "a" / "valid.env"),
+        "valid": True,
+        "errors": {},
+    }
+    assert set(records[str(env_files / "a" / "invalid.env")]["errors"]) == {"HOST", "PORT"}
+    assert not records[str(env_files / "broken.env")]["valid"]
+    assert "error" in records[str(env_files / "broken.env")]
+
+
+def test_audit_command(env_files, capsys):
+    """Test audit command output and exit code."""
+    assert main(["audit", "-w", "1", SCHEMA, str(env_files / "a" / "valid.env")]) == 0
+    assert main(["audit", "-w", "1", f"{SCHEMA}:VALIDATORS", str(env_files)]) == 1
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line)["valid"] for line in lines] == [True, False, False, True]
@@ -0,0 +1,92 @@
+"""Test Dotenv Files."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from envalidate import Json, Port, read_env_file, Str
+from envalidate.dotenv import load_dotenv, parse_dotenv
+from envalidate.exceptions import EnvError
+from envalidate.reporters import DefaultReporter
+
+DOTENV = b"""# comment
+HOST=google # inline comment
+TAB=a#b	# tab comment
+
+export PORT = 8000
+  SINGLE='literal \\n $HOME'
+DOUBLE="tab\\tquote\\" end"
+CONFIG='{
+  "x": 1
+}'
+AFTER=value
+EMPTY=
+"""
+
+
+def test_parse_dotenv():
+    """Test parsing values and line numbers."""
+    entries = {key: (value, line) for key, value, line in parse_dotenv(DOTENV)}
+    assert entries == {
+        "HOST": ("google", 2),
+        "TAB": ("a#b", 3),
+        "PORT": ("8000", 5),
+        "SINGLE": ("literal \\n $HOME", 6),
+        "DOUBLE": ('tab\tquote" end', 7),
+        "CONFIG": ('{\n  "x": 1\n}', 8),
+        "AFTER": ("value", 11),
+        "EMPTY": ("", 12),
+    }
+
+
+def test_parse_dotenv_only_requested_keys():
+    """Test only requested keys are materialized."""
+    entries = list(parse_dotenv(DOTENV, keys={"AFTER"}))
+    assert entries == [("AFTER", "value", 11)]
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        pytest.param(b"HOST\n", id="missing ="),
+        pytest.param(b"=value\n", id="missing key"),
+        pytest.param(b'HOST="google\n', id="unterminated quote"),
+    ],
+)
+def test_parse_dotenv_invalid(content):
+    """Test invalid dotenv lines."""
+    with pytest.raises(EnvError):
+        list(parse_dotenv(content))
+
+
+def test_read_env_file(tmp_path):
+    """Test read env file, with errors line numbers."""
+    path = tmp_path / ".env"
+    path.write_bytes(DOTENV)
+    env = read_env_file(str(path), {"HOST": Str(), "PORT": Port(), "CONFIG": Json()})
+    assert (env.HOST, env.PORT, env.CONFIG) == ("google", 8000, {"x": 1})
+
+    on_error_mock = Mock()
+    read_env_file(str(path), {"HOST": Port(), "MISSING": Str()}, DefaultReporter(on_error_mock))
+    errors = on_error_mock.call_args[0][0]
+    assert errors["HOST"].source == f"{path}:2"
+    assert errors["HOST"].message.endswith(f"(from {path}:2)")
+    assert errors["MISSING"].message == "missing environment key"
+
+
+def test_read_env_file_malformed(tmp_path):
+    """Test a malformed dotenv file is reported through the reporter."""
+    path = tmp_path / ".env"
+    path.write_bytes(b"HOST=google\nBROKEN\n")
+    on_error_mock = Mock()
+    read_env_file(str(path), {"HOST": Str()}, DefaultReporter(on_error_mock), result="slots")
+    errors = on_error_mock.call_args[0][0]
+    assert list(errors) == [str(path)]
+    assert str(errors[str(path)]) == "Invalid dotenv line 2: missing key or '='"
+
+
+def test_load_empty_dotenv(tmp_path):
+    """Test empty dotenv file."""
+    path = tmp_path / ".env"
+    path.write_bytes(b"")
+    assert load_dotenv(str(path)) == {}
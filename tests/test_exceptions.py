@@ -1,5 +1,12 @@
 """Test Exceptions."""
 
+import copy
+import pickle
+from unittest.mock import Mock
+
+import pytest
+
+from envalidate import Port
 from envalidate.exceptions import EnvError, EnvMissingError
 
 
@@ -15,3 +22,53 @@ def test_env_missing_env_name():
     expected = "key"
     ex = EnvMissingError(env_name=expected)
     assert ex.env_name == expected
+
+
+def test_env_error_lazy_message():
+    """Test EnvError message is rendered from structured fields on access."""
+    validator = Mock()
+    validator.format_error.return_value = "Invalid port input: abc"
+    ex = EnvError(key="PORT", validator=validator, value="abc", reason="not a number")
+    validator.format_error.assert_not_called()
+    assert str(ex) == ex.message == "Invalid port input: abc"
+    assert ex.message == "Invalid port input: abc"
+    validator.format_error.assert_called_once_with("abc", "not a number")
+    assert (ex.key, ex.value, ex.reason) == ("PORT", "abc", "not a number")
+
+
+def test_env_error_without_validator():
+    """Test EnvError message without validator."""
+    assert EnvError(value="abc").message == "Invalid input: abc"
+    assert EnvError(value="abc", reason="too long").message == "Invalid input: too long"
+    assert repr(EnvError(value="abc")) == "EnvError('Invalid input: abc')"
+
+
+def test_env_error_source():
+    """Test the source is added to rendered and given messages."""
+    error = EnvError(key="HOST", value="x", source="overrides")
+    assert error.message == "Invalid input: x (from overrides)"
+    error.source = ".env"
+    assert error.message == "Invalid input: x (from .env)"
+    assert EnvError("given").message == "given"
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        pytest.param(EnvError(key="PORT", validator=Port(), value="x", source=".env"), id="env"),
+        pytest.param(EnvError("given"), id="message"),
+        pytest.param(EnvMissingError("HOST"), id="missing"),
+    ],
+)
+def test_env_error_pickle_and_copy(error):
+    """Test errors keep their structured fields when pickled and copied."""
+    for clone in (pickle.loads(pickle.dumps(error)), copy.copy(error)):
+        assert type(clone) is type(error)
+        assert (clone.key, clone.value, clone.reason, clone.source) == (
+            error.key,
+            error.value,
+            error.reason,
+            error.source,
+        )
+        assert clone.validator == error.validator
+        assert clone.message == error.message
@@ -0,0 +1,82 @@
+"""Test Import Time."""
+
+import subprocess
+import sys
+
+IMPORT_BUDGET_US = 50_000
+
+
+def run_python(code: str) -> subprocess.CompletedProcess:
+    """Run python code in a fresh interpreter."""
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_import_is_lazy():
+    """Test importing read_env does not load pydantic, json, re, logging.handlers or mmap.
+
+    typing and logging load re themselves, so only the modules loaded by envalidate count.
+    """
+    code = (
+        "import sys, logging, threading, typing; loaded = set(sys.modules);"
+        "from envalidate import read_env, Str;"
+        "lazy = {'pydantic', 'json', 're', 'logging.handlers', 'mmap', 'urllib.parse'};"
+        "print(sorted(lazy & (set(sys.modules) - loaded)))"
+    )
+    assert run_python(code).stdout.strip() == "[]"
+
+
+def test_import_time_budget():
+    """Test importing read_env and a validator takes less than the budget."""
+    code = (
+        "import time; start = time.perf_counter();"
+        "from envalidate import read_env, Str;"
+        "print(int((time.perf_counter() - start) * 1e6))"
+    )
+    assert int(run_python(code).stdout) < IMPORT_BUDGET_US
+
+
+def test_validators_without_pydantic():
+    """Test validators are built and run without loading pydantic."""
+    code = (
+        "import sys; from envalidate import Port, Str;"
+        "Port(choices=[8000]).envalidate('8000'); Str(desc='host').envalidate('a');"
+        "print('pydantic' in sys.modules)"
+    )
+    assert run_python(code).stdout.strip() == "False"
+
+
+def test_read_env_slots_without_pydantic():
+    """Test reading slots results, groups and patterns included, does not load pydantic."""
+    code = (
+        "import sys; from envalidate import Group, Pattern, Port, read_env, Str;"
+        "env = read_env({'PORT': '80', 'DB_HOST': 'h', 'TAG_A': 'a'}, {'PORT': Port(),"
+        " 'DB': Group({'HOST': Str()}, 'DB_'), 'TAGS': Pattern('TAG_*', Str())}, result='slots');"
+        "print(env.PORT, env.DB.HOST, 'pydantic' in sys.modules)"
+    )
+    assert run_python(code).stdout.strip() == "80 h False"
+
+
+def test_frozen_model_lazy_export():
+    """Test FrozenModel is still importable from the schema and envalidate modules."""
+    code = (
+        "from envalidate.envalidate import FrozenModel;"
+        "from envalidate.schema import FrozenModel as SchemaFrozenModel;"
+        "print(FrozenModel is SchemaFrozenModel)"
+    )
+    assert run_python(code).stdout.strip() == "True"
+
+
+def test_shared_without_pydantic():
+    """Test publishing slots results through shared memory does not load pydantic."""
+    code = (
+        "import sys; from envalidate import Group, read_env, Str;"
+        "from envalidate.shared import encode_env;"
+        "env = read_env({'DB_HOST': 'h'}, {'DB': Group({'HOST': Str()}, 'DB_')}, result='slots');"
+        "encode_env(env); print('pydantic' in sys.modules)"
+    )
+    assert run_python(code).stdout.strip() == "False"
@@ -0,0 +1,118 @@
+"""Test Instrumentation."""
+
+from unittest.mock import Mock
+
+from envalidate import Bool, Group, Number, Pattern, Port, read_env, Str
+from envalidate.instrumentation import (
+    Instrumentation,
+    KeyEvent,
+    ProfileInstrumentation,
+    SpanInstrumentation,
+)
+from envalidate.reporters import DefaultReporter
+
+VALIDATORS = {"HOST": Str(), "PORT": Port(), "AGENTS": Number(), "WORKERS": Number()}
+ENVIRONMENT = {"HOST": "google", "PORT": "80000", "AGENTS": "20"}
+
+
+def _read(instrumentation):
+    """Read ENVIRONMENT without raising."""
+    return read_env(
+        ENVIRONMENT,
+        VALIDATORS,
+        DefaultReporter(on_error=Mock()),
+        result="slots",
+        instrumentation=instrumentation,
+    )
+
+
+def test_instrumentation_events():
+    """Test key events and aggregate counters."""
+    instrumentation = Mock(spec=Instrumentation)
+    env = _read(instrumentation)
+    assert dict(env) == {"HOST": "google", "AGENTS": 20}
+    instrumentation.read_started.assert_called_once_with(4)
+    assert [call.args for call in instrumentation.key_started.call_args_list] == [
+        ("HOST", "Str"),
+        ("PORT", "Port"),
+        ("AGENTS", "Number"),
+        ("WORKERS", "Number"),
+    ]
+    events = [call.args[0] for call in instrumentation.key_finished.call_args_list]
+    assert [(e.key, e.validator, e.outcome, e.size) for e in events] == [
+        ("HOST", "Str", "valid", 6),
+        ("PORT", "Port", "invalid", 5),
+        ("AGENTS", "Number", "valid", 2),
+        ("WORKERS", "Number", "missing", None),
+    ]
+    assert all(event.duration >= 0 for event in events)
+    stats = instrumentation.read_finished.call_args.args[0]
+    assert (stats.keys, stats.valid, stats.invalid, stats.missing, stats.size) == (4, 2, 1, 1, 13)
+
+
+def test_instrumentation_nested_events():
+    """Test group and pattern keys are timed and counted, by env var name."""
+    instrumentation = Mock(spec=Instrumentation)
+    validators = {
+        "HOST": Str(),
+        "DB": Group({"HOST": Str(), "PORT": Port()}, "DB_"),
+        "FEATURES": Pattern("FEATURE_*", Bool()),
+    }
+    environment = {"HOST": "h", "DB_HOST": "db", "DB_PORT": "x", "FEATURE_A": "true"}
+    read_env(
+        environment,
+        validators,
+        DefaultReporter(on_error=Mock()),
+        instrumentation=instrumentation,
+    )
+    instrumentation.read_started.assert_called_once_with(4)
+    events = [call.args[0] for call in instrumentation.key_finished.call_args_list]
+    assert [(e.key, e.validator, e.outcome) for e in events] == [
+        ("HOST", "Str", "valid"),
+        ("DB_HOST", "Str", "valid"),
+        ("DB_PORT", "Port", "invalid"),
+        ("FEATURE_A", "Bool", "valid"),
+    ]
+    stats = instrumentation.read_finished.call_args.args[0]
+    assert (stats.keys, stats.valid, stats.invalid, stats.missing, stats.size) == (4, 3, 1, 0, 8)
+
+
+def test_profile_instrumentation():
+    """Test text profile lists the slowest keys first."""
+    profile = ProfileInstrumentation()
+    _read(profile)
+    assert len(profile.events) == 4
+    profile.events[2] = KeyEvent("AGENTS", "Number", 1.0, "valid", 2)
+    report = profile.report(limit=2)
+    lines = report.splitlines()
+    assert lines[0].startswith("key")
+    assert lines[1].startswith("AGENTS")
+    assert len(lines) == 4
+    assert lines[-1].startswith("4 keys, 2 valid, 1 invalid, 1 missing")
+    profile.clear()
+    assert not profile.events and not profile.stats
+
+
+def test_span_instrumentation():
+    """Test a read span, with a child span per key."""
+    tracer = Mock()
+    spans = []
+
+    def start_span(name, context=None):
+        span = Mock()
+        span.name = name
+        spans.append(span)
+        return span
+
+    tracer.start_span.side_effect = start_span
+    _read(SpanInstrumentation(tracer))
+    assert [span.name for span in spans] == [
+        "envalidate.read_env",
+        "envalidate.validate HOST",
+        "envalidate.validate PORT",
+        "envalidate.validate AGENTS",
+        "envalidate.validate WORKERS",
+    ]
+    assert all(span.end.call_count == 1 for span in spans)
+    spans[2].set_attribute.assert_any_call("envalidate.outcome", "invalid")
+    spans[0].set_attribute.assert_any_call("envalidate.missing", 1)
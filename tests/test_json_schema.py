@@ -0,0 +1,103 @@
+"""Test JSON Schema."""
+
+import copy
+import pickle
+import sys
+
+import pytest
+
+from envalidate.json_schema import compile_json_schema, JsonSchemaError
+
+
+@pytest.mark.parametrize(
+    "schema, value, error",
+    [
+        pytest.param({"type": "integer"}, 1.0, None, id="type - integral float"),
+        pytest.param({"type": "integer"}, True, "$: expected integer", id="type - bool"),
+        pytest.param({"type": ["string", "null"]}, None, None, id="type - list"),
+        pytest.param({"enum": ["a", "b"]}, "c", "$: 'c' not in ['a', 'b']", id="enum"),
+        pytest.param({"const": 1}, 1, None, id="const"),
+        pytest.param(
+            {"properties": {"a": {"minimum": 0}}, "additionalProperties": False},
+            {"a": -1},
+            "$.a: -1 is less than 0",
+            id="properties",
+        ),
+        pytest.param(
+            {"additionalProperties": False}, {"a": 1}, "$.a: no value is allowed", id="additional"
+        ),
+        pytest.param({"required": ["a"]}, {}, "$: missing required property 'a'", id="required"),
+        pytest.param({"maxItems": 1}, [1, 2], "$: expected at most 1 items", id="maxItems"),
+        pytest.param({"minLength": 2}, "a", "$: expected at least 2 characters", id="minLength"),
+        pytest.param({"minLength": 2}, 1, None, id="minLength - not a string"),
+        pytest.param({"pattern": "^a"}, "ba", "$: does not match ^a", id="pattern"),
+        pytest.param({"exclusiveMaximum": 1}, 1, "$: 1 is greater than or equal to 1", id="max"),
+        pytest.param({"anyOf": [{"type": "string"}, {"type": "null"}]}, None, None, id="anyOf"),
+        pytest.param(
+            {"oneOf": [{"type": "number"}, {"type": "integer"}]},
+            1,
+            "$: 2 of 2 schemas match, expected one",
+            id="oneOf",
+        ),
+        pytest.param({"not": {"type": "null"}}, None, "$: matches a schema", id="not"),
+        pytest.param({"enum": [1, "a"]}, True, "$: True not in [1, 'a']", id="enum - bool"),
+        pytest.param({"const": False}, 0, "$: 0 not in [False]", id="const - number"),
+        pytest.param({"const": [1.0]}, [1], None, id="const - integral float"),
+        pytest.param(
+            {"enum": [{"a": [True]}]}, {"a": [1]}, "$: {'a': [1]} not in", id="enum - nested bool"
+        ),
+        pytest.param({"uniqueItems": True}, [1, True, "1"], None, id="uniqueItems"),
+        pytest.param(
+            {"uniqueItems": True}, [[1], [1.0]], "$[1]: duplicate item", id="uniqueItems - dup"
+        ),
+        pytest.param({"uniqueItems": False}, [1, 1], None, id="uniqueItems - false"),
+        pytest.param({"type": "string", "format": "email"}, "x", None, id="format annotation"),
+        pytest.param(
+            {"title": "hosts", "items": {"type": "string"}},
+            ["a", 1],
+            "$[1]: expected string",
+            id="items",
+        ),
+    ],
+)
+def test_json_schema(schema, value, error):
+    """Test supported keywords."""
+    check = compile_json_schema(schema)
+    if error is None:
+        check(value)
+    else:
+        with pytest.raises(JsonSchemaError) as raised:
+            check(value)
+        assert str(raised.value).startswith(error)
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [{"$ref": "#/definitions/a"}, {"items": [{"type": "string"}]}, {"type": "str"}, "object"],
+    ids=["$ref", "tuple items", "unknown type", "not a schema"],
+)
+def test_json_schema_unsupported(schema, monkeypatch):
+    """Test unsupported schemas are rejected when compiling, without jsonschema."""
+    monkeypatch.setitem(sys.modules, "jsonschema", None)
+    with pytest.raises(ValueError, match=r"envalidate\[jsonschema\]"):
+        compile_json_schema(schema)
+
+
+def test_json_schema_jsonschema_fallback():
+    """Test schemas outside the subset are checked by jsonschema."""
+    pytest.importorskip("jsonschema")
+    schema = {"definitions": {"port": {"type": "integer"}}, "items": {"$ref": "#/definitions/port"}}
+    check = compile_json_schema(schema)
+    check([1, 2])
+    with pytest.raises(JsonSchemaError, match=r"^\$\[1\]: "):
+        check([1, "a"])
+    with pytest.raises(ValueError):
+        compile_json_schema("object")
+
+
+def test_json_schema_error_pickle_and_copy():
+    """Test JsonSchemaError keeps its path and message when pickled or copied."""
+    error = JsonSchemaError("$.a", "expected string")
+    for restored in (pickle.loads(pickle.dumps(error)), copy.copy(error)):
+        assert (restored.path, restored.message) == ("$.a", "expected string")
+        assert str(restored) == "$.a: expected string"
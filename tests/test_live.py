@@ -0,0 +1,96 @@
+"""Test LiveEnv."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from envalidate import Group, Json, Pattern, Port, Str
+from envalidate.live import EnvDiff, LiveEnv
+from envalidate.reporters import DefaultReporter
+
+
+@pytest.fixture()
+def live_validators():
+    """Live validators."""
+    return {"HOST": Str(), "PORT": Port(default=8000), "CONFIG": Json(default="{}")}
+
+
+def test_live_env_refresh(live_validators):
+    """Test refresh revalidates changed keys only, and shares unchanged values."""
+    environment = {"HOST": "google", "CONFIG": '{"x": 1}'}
+    live = LiveEnv(environment, live_validators)
+    first = live.env
+    assert first.HOST == "google" and first.PORT == 8000
+
+    assert live.refresh() == EnvDiff((), (), (), ())
+    assert live.env is first
+
+    environment.update(HOST="yahoo", PORT="80")
+    diff = live.refresh()
+    assert diff == EnvDiff(added=(), changed=("HOST", "PORT"), removed=(), invalid=())
+    assert live.env.HOST == "yahoo" and live.env.PORT == 80
+    assert live.env.CONFIG is first.CONFIG
+
+    del environment["PORT"]
+    assert live.refresh().removed == ("PORT",)
+    assert live.env.PORT == 8000
+
+
+def test_live_env_invalid(live_validators):
+    """Test newly invalid keys are reported and keep their last valid value."""
+    on_error_mock = Mock()
+    live = LiveEnv({"HOST": "google"}, live_validators, DefaultReporter(on_error_mock))
+    diff = live.refresh({"HOST": "google", "PORT": "99999"})
+    assert diff.invalid == ("PORT",)
+    assert set(on_error_mock.call_args[0][0]) == {"PORT"}
+    assert live.env.PORT == 8000
+    assert set(live.errors) == {"PORT"}
+
+    assert live.refresh({"HOST": "google", "PORT": "80"}).changed == ("PORT",)
+    assert not live.errors
+
+
+def test_live_env_raising_reporter(live_validators):
+    """Test refresh with the default reporter raises, and keeps the previous state."""
+    environment = {"HOST": "google"}
+    live = LiveEnv(environment, live_validators)
+    environment["PORT"] = "abc"
+    with pytest.raises(TypeError):
+        live.refresh()
+    assert live.env.PORT == 8000
+
+
+def test_live_env_groups():
+    """Test a group is revalidated when any of its env vars changes."""
+    validators = {"HOST": Str(), "DB": Group({"PORT": Port()}, prefix="DB_")}
+    live = LiveEnv({"HOST": "a", "DB_PORT": "1"}, validators)
+    assert live.refresh({"HOST": "a", "DB_PORT": "1"}) == EnvDiff((), (), (), ())
+    assert live.refresh({"HOST": "a", "DB_PORT": "2"}).changed == ("DB",)
+    assert live.env.DB.PORT == 2
+
+
+def test_live_env_group_errors():
+    """Test group errors are cleared once fixed, and the group keeps its last valid value."""
+    on_error_mock = Mock()
+    validators = {"HOST": Str(), "DB": Group({"HOST": Str(), "PORT": Port()}, prefix="DB_")}
+    environment = {"HOST": "a", "DB_HOST": "db", "DB_PORT": "1"}
+    live = LiveEnv(environment, validators, DefaultReporter(on_error_mock))
+    diff = live.refresh({**environment, "DB_PORT": "x"})
+    assert diff.invalid == ("DB_PORT",) and diff.changed == ()
+    assert (live.env.DB.HOST, live.env.DB.PORT) == ("db", 1)
+    assert set(live.errors) == {"DB_PORT"}
+
+    assert live.refresh({**environment, "DB_PORT": "2"}).changed == ("DB",)
+    assert not live.errors and live.env.DB.PORT == 2
+    assert live.refresh({**environment, "DB_PORT": "y"}).invalid == ("DB_PORT",)
+    assert live.env.DB.PORT == 2
+
+
+def test_live_env_pattern_errors():
+    """Test pattern errors are cleared once fixed, and the mapping keeps its last valid value."""
+    validators = {"LIMITS": Pattern("LIMIT_*", Port())}
+    live = LiveEnv({"LIMIT_A": "1"}, validators, DefaultReporter(Mock()))
+    assert live.refresh({"LIMIT_A": "1", "LIMIT_B": "x"}).invalid == ("LIMIT_B",)
+    assert dict(live.env.LIMITS) == {"LIMIT_A": 1}
+    assert live.refresh({"LIMIT_A": "1"}).changed == ("LIMITS",)
+    assert not live.errors
@@ -0,0 +1,80 @@
+"""Test IP Networks."""
+
+from ipaddress import ip_address, ip_network
+import pickle
+
+import pytest
+
+from envalidate.network import Endpoint, NetworkSet, parse_address, parse_endpoint
+
+NETWORKS = ["10.0.0.0/8", "192.168.1.0/24", "172.16.5.4", "2001:db8::/32", "::1"]
+
+
+@pytest.mark.parametrize(
+    "value, member",
+    [
+        pytest.param("10.200.3.4", True, id="in /8"),
+        pytest.param("192.168.1.255", True, id="in /24"),
+        pytest.param("192.168.2.1", False, id="outside /24"),
+        pytest.param("172.16.5.4", True, id="single address"),
+        pytest.param("172.16.5.5", False, id="next address"),
+        pytest.param("2001:db8:1::1", True, id="ipv6"),
+        pytest.param("::2", False, id="ipv6 outside"),
+        pytest.param("10.1.0.0/16", True, id="subnet"),
+        pytest.param("10.0.0.0/7", False, id="supernet"),
+        pytest.param(ip_address("10.0.0.1"), True, id="address object"),
+        pytest.param(ip_network("192.168.1.128/25"), True, id="network object"),
+        pytest.param(Endpoint(ip_address("::1"), 80), True, id="endpoint"),
+        pytest.param("not an ip", False, id="invalid"),
+        pytest.param(10, False, id="not an address"),
+    ],
+)
+def test_network_set_membership(value, member):
+    """Test addresses and networks membership."""
+    assert (value in NetworkSet(NETWORKS)) is member
+
+
+def test_network_set_is_a_frozenset():
+    """Test NetworkSet compares and pickles like the set of its networks."""
+    networks = NetworkSet(NETWORKS)
+    assert networks == set(NETWORKS) and hash(networks) == hash(frozenset(NETWORKS))
+    loaded = pickle.loads(pickle.dumps(networks))
+    assert isinstance(loaded, NetworkSet) and "10.1.1.1" in loaded
+    assert repr(NetworkSet(["::1"])) == "NetworkSet(['::1'])"
+    with pytest.raises(ValueError):
+        NetworkSet(["10.0.0.1/8"])
+
+
+def test_network_set_endpoints():
+    """Test addresses with a port only match that exact endpoint."""
+    networks = NetworkSet(["10.0.0.1:8000", "[::1]:443", "192.168.0.0/16"])
+    assert "10.0.0.1:8000" in networks
+    assert Endpoint(ip_address("::1"), 443) in networks
+    assert "[0::1]:443" in networks
+    assert "192.168.3.4:80" in networks
+    assert "10.0.0.1:9000" not in networks and "10.0.0.1" not in networks
+    with pytest.raises(ValueError):
+        NetworkSet(["10.0.0.300:8000"])
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        pytest.param("10.0.0.1", ("10.0.0.1", None), id="ipv4"),
+        pytest.param("10.0.0.1:80", ("10.0.0.1", "80"), id="ipv4 port"),
+        pytest.param("::1", ("::1", None), id="ipv6"),
+        pytest.param("[::1]:80", ("::1", "80"), id="ipv6 port"),
+        pytest.param("[::1]", ("::1", None), id="ipv6 brackets"),
+    ],
+)
+def test_parse_endpoint(value, expected):
+    """Test host and port split."""
+    assert parse_endpoint(value) == expected
+
+
+def test_parse_address_memoized():
+    """Test parsed addresses are shared per string."""
+    assert parse_address("10.0.0.1") is parse_address("10.0.0.1")
+    assert str(Endpoint(parse_address("::1"), 80)) == "[::1]:80"
+    with pytest.raises(ValueError):
+        parse_endpoint("[::1]80")
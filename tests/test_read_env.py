@@ -1,10 +1,11 @@
 """Test CleanEnv."""
+
 import os
 from unittest.mock import Mock
 
 import pytest
 
-from envalidate import read_env, Str
+from envalidate import Json, Number, read_env, Str
 from envalidate.reporters import DefaultReporter, Reporter
 
 
@@ -92,3 +93,30 @@ def test_read_env_failed_set_attribute(monkeypatch, environment):
     env = read_env(environment, spec)
     with pytest.raises(TypeError):
         env.HOST = "yahoo"
+
+
+def test_read_env_fail_fast():
+    """Test fail_fast stops at, and reports, the first error only."""
+    on_error_mock = Mock()
+    validators = {"CONFIG": Json(), "AGENTS": Number(), "HOST": Str()}
+    environment = {"CONFIG": "{", "AGENTS": "x"}
+    reporter = DefaultReporter(on_error=on_error_mock)
+    read_env(environment, validators, reporter, fail_fast=True)
+    assert list(on_error_mock.call_args[0][0]) == ["CONFIG"]
+    read_env(environment, validators, reporter, fail_fast=True, cheapest_first=True)
+    errors = on_error_mock.call_args[0][0]
+    assert list(errors) == ["HOST"]
+    assert errors["HOST"].key == "HOST"
+
+
+def test_read_env_cheapest_first_keeps_schema_order():
+    """Test cheapest_first results and errors are in schema order."""
+    on_error_mock = Mock()
+    validators = {"CONFIG": Json(), "AGENTS": Number(), "HOST": Str(), "PORT": Number()}
+    environment = {"CONFIG": "{}", "AGENTS": "1", "HOST": "google", "PORT": "x"}
+    reporter = DefaultReporter(on_error=on_error_mock)
+    env = read_env(environment, validators, reporter, result="slots", cheapest_first=True)
+    assert list(env.as_mapping()) == ["CONFIG", "AGENTS", "HOST"]
+    error = on_error_mock.call_args[0][0]["PORT"]
+    assert (error.key, error.value, error.validator) == ("PORT", "x", validators["PORT"])
+    assert error.message.startswith("Invalid number input: x")
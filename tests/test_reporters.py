@@ -1,11 +1,15 @@
 """Test Reporters."""
 
-from unittest.mock import call
+import json
+import logging
+from unittest.mock import call, Mock
 
 import pytest
 from pytest_lazyfixture import lazy_fixture
 
+from envalidate import Port
 from envalidate.exceptions import EnvError, EnvMissingError
+from envalidate.reporters import DefaultReporter, JsonReporter, QueueReporter
 
 
 @pytest.mark.parametrize(
@@ -36,3 +40,70 @@ def test_errors(reporter, errors):
     reporter.report(errors)
     assert reporter.__on_error__.call_count == 1
     assert reporter.__on_error__.call_args == call(errors)
+
+
+def test_json_reporter():
+    """Test a JSON record per error."""
+    logger = Mock()
+    on_error = Mock()
+    errors = {"HOST": EnvMissingError("HOST"), "PORT": Port().error("x")}
+    JsonReporter(logger=logger, on_error=on_error).report(errors)
+    records = [json.loads(args[0]) for args, _ in logger.error.call_args_list]
+    assert records == [
+        {
+            "key": "HOST",
+            "error": "missing",
+            "validator": None,
+            "message": "missing environment key",
+        },
+        {"key": "PORT", "error": "invalid", "validator": "port", "message": errors["PORT"].message},
+    ]
+    on_error.assert_called_once_with(errors)
+
+
+def test_json_reporter_raises():
+    """Test JsonReporter raises TypeError without on_error."""
+    with pytest.raises(TypeError):
+        JsonReporter(logger=Mock()).report({"HOST": EnvMissingError("HOST")})
+    JsonReporter(logger=Mock()).report({})
+
+
+def test_queue_reporter_flushes_before_raising():
+    """Test records are handled by the listener before TypeError propagates."""
+    handler = Mock(spec=logging.Handler)
+    handler.level = logging.NOTSET
+    reporter = QueueReporter(JsonReporter(), handlers=[handler])
+    errors = {f"KEY_{index}": EnvMissingError(f"KEY_{index}") for index in range(1000)}
+    try:
+        with pytest.raises(TypeError):
+            reporter.report(errors)
+        assert handler.handle.call_count == 1000
+        assert reporter.__logger__.handlers[0].__class__.__name__ == "QueueHandler"
+    finally:
+        reporter.close()
+
+
+def test_queue_reporter_on_error():
+    """Test QueueReporter with on_error does not raise."""
+    handler = Mock(spec=logging.Handler)
+    handler.level = logging.NOTSET
+    on_error = Mock()
+    reporter = QueueReporter(DefaultReporter(on_error=on_error), handlers=[handler])
+    reporter.report({"HOST": EnvMissingError("HOST")})
+    reporter.close()
+    on_error.assert_called_once()
+    assert handler.handle.call_count == 1
+
+
+def test_queue_reporter_leaves_wrapped_reporter():
+    """Test wrapping a shared reporter does not rewire its logging."""
+    wrapped = DefaultReporter(on_error=Mock())
+    logger = wrapped.__logger__
+    handler = Mock(spec=logging.Handler, level=logging.NOTSET)
+    reporter = QueueReporter(wrapped, handlers=[handler])
+    try:
+        assert wrapped.__logger__ is logger
+        assert reporter.reporter is wrapped
+        assert reporter.__logger__ is not logger
+    finally:
+        reporter.close()
@@ -0,0 +1,137 @@
+"""Test Secret Resolvers."""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from envalidate import Json, Port, read_env, Str
+from envalidate.reporters import DefaultReporter
+from envalidate.resolvers import FileBackend, HttpBackend, parse_reference, SecretResolver
+
+SECRETS = {"db#password": "s3cret", "db#port": "5432", "api": "token"}
+
+
+class SecretsHandler(BaseHTTPRequestHandler):
+    """Local secrets endpoint stand-in."""
+
+    protocol_version = "HTTP/1.1"
+    requests = []
+
+    def do_POST(self):  # noqa: N802
+        """Resolve a batch of references."""
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.requests.append((self.client_address, body["references"]))
+        values = {name: SECRETS[name] for name in body["references"] if name in SECRETS}
+        payload = json.dumps({"values": values}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        """Quiet."""
+
+
+@pytest.fixture()
+def secrets_url():
+    """Local secrets endpoint."""
+    SecretsHandler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SecretsHandler)
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/resolve"
+    server.shutdown()
+    server.server_close()
+
+
+def test_parse_reference():
+    """Test parse references."""
+    reference = parse_reference("vault://db#password")
+    assert reference == ("vault", "db", "password", "vault://db#password")
+    assert parse_reference("plain value") is None
+
+
+def test_http_backend_batched_and_cached(secrets_url):
+    """Test references are fetched in one batch over a pooled connection, then cached."""
+    backend = HttpBackend(secrets_url)
+    resolver = SecretResolver([backend], ttl=60)
+    environment = {"PASSWORD": "vault://db#password", "PORT": "vault://db#port", "HOST": "google"}
+    validators = {"PASSWORD": Str(), "PORT": Port(), "HOST": Str()}
+    for _ in range(3):
+        env = read_env(environment, validators, resolver=resolver)
+        assert (env.PASSWORD, env.PORT, env.HOST) == ("s3cret", 5432, "google")
+    assert len(SecretsHandler.requests) == 1
+    assert sorted(SecretsHandler.requests[0][1]) == ["db#password", "db#port"]
+
+    resolver.clear()
+    read_env({"TOKEN": "vault://api"}, {"TOKEN": Str()}, resolver=resolver)
+    assert SecretsHandler.requests[0][0] == SecretsHandler.requests[1][0]
+    resolver.close()
+
+
+def test_unresolved_reference_reported(secrets_url):
+    """Test unresolved references are reported as errors."""
+    on_error_mock = Mock()
+    resolver = SecretResolver([HttpBackend(secrets_url)])
+    read_env(
+        {"PASSWORD": "vault://db#unknown"},
+        {"PASSWORD": Str()},
+        DefaultReporter(on_error_mock),
+        resolver=resolver,
+    )
+    error = on_error_mock.call_args[0][0]["PASSWORD"]
+    assert "vault://db#unknown" in error.message
+    assert (error.key, error.value) == ("PASSWORD", "vault://db#unknown")
+
+
+def test_file_backend(tmp_path):
+    """Test file backend, json, dotenv and plain files."""
+    (tmp_path / "secrets.json").write_text(json.dumps({"config": '{"x": 1}'}))
+    (tmp_path / "secrets.env").write_text("PASSWORD=s3cret\n")
+    (tmp_path / "token").write_text("token\n")
+    resolver = SecretResolver([FileBackend(root=str(tmp_path))])
+    environment = {
+        "CONFIG": "secretfile://secrets.json#config",
+        "PASSWORD": "secretfile://secrets.env#PASSWORD",
+        "TOKEN": f"secretfile://{tmp_path / 'token'}",
+        "DATA": f"file://{tmp_path / 'token'}",
+    }
+    validators = {"CONFIG": Json(), "PASSWORD": Str(), "TOKEN": Str(), "DATA": Str()}
+    env = read_env(environment, validators, resolver=resolver)
+    assert (env.CONFIG, env.PASSWORD, env.TOKEN) == ({"x": 1}, "s3cret", "token")
+    assert env.DATA == environment["DATA"]
+
+
+def test_background_refresh(secrets_url):
+    """Test stale entries are served from cache and refreshed in background."""
+    resolver = SecretResolver([HttpBackend(secrets_url)], ttl=60, refresh_after=0)
+    environment = {"TOKEN": "vault://api"}
+    assert resolver.resolve(environment, ["TOKEN"]) == ({"TOKEN": "token"}, {})
+    assert resolver.resolve(environment, ["TOKEN"]) == ({"TOKEN": "token"}, {})
+    resolver.__refreshing__.join(5)
+    assert len(SecretsHandler.requests) == 2
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_errors_hide_resolved_secrets(tmp_path, lazy):
+    """Test errors of resolved values show the reference, not the secret."""
+    (tmp_path / "secrets.env").write_text("PORT=s3cret\n")
+    resolver = SecretResolver([FileBackend(root=str(tmp_path))])
+    reporter = Mock()
+    env = read_env(
+        {"PORT": "secretfile://secrets.env#PORT"},
+        {"PORT": Port()},
+        reporter=reporter,
+        resolver=resolver,
+        lazy=lazy,
+    )
+    if lazy:
+        assert not hasattr(env, "PORT")
+    error = reporter.report.call_args[0][0]["PORT"]
+    assert error.value == "secretfile://secrets.env#PORT"
+    assert "secretfile://secrets.env#PORT" in error.message
+    assert "s3cret" not in error.message
+    assert error.__cause__ is None
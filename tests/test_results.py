@@ -0,0 +1,99 @@
+"""Test Results."""
+
+import pickle
+from unittest.mock import Mock
+
+import pytest
+
+from envalidate import FrozenEnv, Json, LazyEnv, Number, Port, read_env, Str
+from envalidate.reporters import DefaultReporter
+
+
+@pytest.fixture()
+def slots_env():
+    """Slots backend env."""
+    environment = {"HOST": "google", "PORT": "8000", "CONFIG": '{"concurrency": 20}'}
+    validators = {"HOST": Str(), "PORT": Port(), "CONFIG": Json()}
+    yield read_env(environment, validators, result="slots")
+
+
+def test_slots_attributes(slots_env):
+    """Test slots backend attribute access."""
+    assert isinstance(slots_env, FrozenEnv)
+    assert slots_env.HOST == "google"
+    assert slots_env.PORT == 8000
+    assert slots_env.CONFIG == {"concurrency": 20}
+    with pytest.raises(AttributeError):
+        _ = slots_env.MISSING
+
+
+def test_slots_immutable(slots_env):
+    """Test slots backend is immutable."""
+    with pytest.raises(TypeError):
+        slots_env.HOST = "yahoo"
+    with pytest.raises(TypeError):
+        del slots_env.HOST
+    with pytest.raises(TypeError):
+        slots_env.as_mapping()["HOST"] = "yahoo"
+
+
+def test_slots_mapping_view(slots_env):
+    """Test mapping view is not a copy."""
+    assert dict(slots_env.as_mapping()) == slots_env.dict()
+    assert slots_env.as_mapping()["CONFIG"] is slots_env.CONFIG
+
+
+def test_slots_hash_and_equality(slots_env):
+    """Test slots backend hashing and equality, including unhashable values."""
+    other = FrozenEnv(slots_env.dict())
+    assert other == slots_env
+    assert hash(other) == hash(slots_env)
+    assert other != FrozenEnv({"HOST": "google"})
+    assert pickle.loads(pickle.dumps(slots_env)) == slots_env
+
+
+def test_slots_equality_is_type_aware():
+    """Test equality agrees with the hash, values of different types are not equal."""
+    flags, numbers = FrozenEnv({"DEBUG": True, "RATIO": 1.0}), FrozenEnv({"DEBUG": 1, "RATIO": 1})
+    assert flags != numbers and hash(flags) != hash(numbers)
+    assert flags == FrozenEnv({"DEBUG": True, "RATIO": 1.0})
+
+
+def test_unknown_result_backend():
+    """Test unknown result backend."""
+    with pytest.raises(ValueError):
+        read_env({"HOST": "google"}, {"HOST": Str()}, result="unknown")
+
+
+def test_lazy_env_validates_on_access():
+    """Test lazy mode validates each value once, on first access."""
+    environment = {"HOST": "google", "CONFIG": '{"x": 1}', "PORT": "8000"}
+    env = read_env(environment, {"HOST": Str(), "CONFIG": Json(), "PORT": Port()}, lazy=True)
+    assert isinstance(env, LazyEnv)
+    assert "<lazy>" in repr(env)
+    assert env.CONFIG is env.CONFIG
+    assert env.HOST == "google"
+    assert env.dict() == {"HOST": "google", "CONFIG": {"x": 1}, "PORT": 8000}
+    with pytest.raises(TypeError):
+        env.HOST = "yahoo"
+
+
+def test_lazy_env_reports_on_access():
+    """Test lazy mode reports errors on access, and validate_all reports the rest together."""
+    on_error_mock = Mock()
+    validators = {"HOST": Str(), "PORT": Port(), "AGENTS": Number(), "CONFIG": Json()}
+    environment = {"PORT": "abc", "AGENTS": "x", "CONFIG": "{"}
+    env = read_env(environment, validators, DefaultReporter(on_error_mock), lazy=True)
+    assert on_error_mock.call_count == 0
+    with pytest.raises(AttributeError):
+        _ = env.PORT
+    assert set(on_error_mock.call_args[0][0]) == {"PORT"}
+    env.validate_all()
+    assert set(on_error_mock.call_args[0][0]) == {"HOST", "AGENTS", "CONFIG"}
+    assert on_error_mock.call_count == 2
+
+
+def test_lazy_env_eager_keys():
+    """Test eager keys are validated immediately."""
+    with pytest.raises(TypeError):
+        read_env({"PORT": "abc"}, {"HOST": Str(), "PORT": Port()}, lazy=True, eager=["PORT"])
@@ -0,0 +1,257 @@
+"""Test EnvSchema."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from envalidate import (
+    Bool,
+    compile_schema,
+    EnvSchema,
+    Group,
+    Number,
+    Pattern,
+    Port,
+    read_env,
+    Str,
+    Url,
+)
+from envalidate import schema as schema_module
+from envalidate.reporters import DefaultReporter
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Clear compiled schemas between tests."""
+    schema_module.clear_schema_cache()
+    yield
+    schema_module.clear_schema_cache()
+
+
+def test_schema_read():
+    """Test compiled schema read."""
+    schema = EnvSchema({"HOST": Str(), "PORT": Port(default=8000)})
+    env = schema.read({"HOST": "google"})
+    assert env.HOST == "google"
+    assert env.PORT == 8000
+    assert schema.keys == ("HOST", "PORT")
+
+
+def test_schema_model_class_is_reused():
+    """Test CleanEnv class is built once per schema."""
+    schema = EnvSchema({"HOST": Str()})
+    assert type(schema.read({"HOST": "a"})) is type(schema.read({"HOST": "b"}))
+
+
+def test_compile_schema_registry():
+    """Test identical validators share one compiled schema."""
+    first = compile_schema({"HOST": Str(desc="host"), "AGENTS": Number(choices={1, 2})})
+    second = compile_schema({"HOST": Str(desc="host"), "AGENTS": Number(choices={2, 1})})
+    other = compile_schema({"HOST": Str(desc="other"), "AGENTS": Number(choices={1, 2})})
+    assert first is second
+    assert first is not other
+    assert compile_schema(first) is first
+
+
+def test_compile_schema_registry_bounded(monkeypatch):
+    """Test schemas registry evicts least recently used schemas."""
+    monkeypatch.setattr(schema_module, "SCHEMA_CACHE_SIZE", 2)
+    first = compile_schema({"A": Str()})
+    compile_schema({"B": Str()})
+    compile_schema({"C": Str()})
+    assert len(schema_module._SCHEMA_CACHE) == 2
+    assert compile_schema({"A": Str()}) is not first
+
+
+def test_fingerprint_follows_options():
+    """Test validator fingerprint follows its options, which are frozen."""
+    validator = Str(default="a")
+    with pytest.raises(TypeError):
+        validator.default = "b"
+    assert Str(default="a").fingerprint == validator.fingerprint
+    assert Str(default="b").fingerprint != validator.fingerprint
+    assert Number(default=1).fingerprint != Number(default=1.0).fingerprint
+
+
+def test_read_env_partial_result_with_errors():
+    """Test read env with errors and non raising reporter."""
+    on_error_mock = Mock()
+    env = read_env(
+        {"HOST": "google"}, {"HOST": Str(), "PORT": Port()}, DefaultReporter(on_error_mock)
+    )
+    assert env.HOST == "google"
+    assert not hasattr(env, "PORT")
+    assert on_error_mock.call_count == 1
+
+
+DB = Group({"HOST": Str(), "PORT": Port(default=5432)}, prefix="DB_")
+GROUPED_VALIDATORS = {
+    "NAME": Str(),
+    "DB": DB,
+    "REPLICA": DB.with_prefix("REPLICA_DB_"),
+    "CACHE": Group({"HOST": Str(), "TLS": Group({"ENABLED": Bool()}, prefix="TLS_")}, "CACHE_"),
+}
+GROUPED_ENVIRONMENT = {
+    "NAME": "app",
+    "DB_HOST": "db",
+    "DB_PORT": "6543",
+    "REPLICA_DB_HOST": "replica",
+    "CACHE_HOST": "cache",
+    "CACHE_TLS_ENABLED": "true",
+    "OTHER": "value",
+}
+
+
+@pytest.mark.parametrize("result", ["model", "slots"])
+def test_group_nested_results(result):
+    """Test groups produce nested immutable results."""
+    env = read_env(GROUPED_ENVIRONMENT, GROUPED_VALIDATORS, result=result)
+    assert env.NAME == "app"
+    assert (env.DB.HOST, env.DB.PORT) == ("db", 6543)
+    assert (env.REPLICA.HOST, env.REPLICA.PORT) == ("replica", 5432)
+    assert env.CACHE.HOST == "cache"
+    assert env.CACHE.TLS.ENABLED is True
+    with pytest.raises(TypeError):
+        env.DB.HOST = "other"
+
+
+def test_group_compiled_once():
+    """Test the same validators under different prefixes share one compiled schema."""
+    schema = compile_schema(GROUPED_VALIDATORS)
+    assert DB.schema is schema.validators["REPLICA"].schema
+    assert schema.groups == ("DB", "REPLICA", "CACHE")
+    assert DB.fingerprint != DB.with_prefix("OTHER_").fingerprint
+    with pytest.raises(ValueError):
+        Group({"HOST": Str()}, prefix="")
+
+
+def test_group_errors_keyed_by_env_var():
+    """Test group errors are keyed, and reported, by the full env var name."""
+    on_error_mock = Mock()
+    environment = {**GROUPED_ENVIRONMENT, "DB_PORT": "x", "CACHE_TLS_ENABLED": "maybe"}
+    del environment["REPLICA_DB_HOST"]
+    read_env(environment, GROUPED_VALIDATORS, DefaultReporter(on_error=on_error_mock))
+    errors = on_error_mock.call_args[0][0]
+    assert list(errors) == ["DB_PORT", "REPLICA_DB_HOST", "CACHE_TLS_ENABLED"]
+    assert errors["DB_PORT"].key == "DB_PORT"
+
+
+def test_group_index_single_pass():
+    """Test the prefix index strips prefixes, overlapping prefixes included."""
+    schema = compile_schema(GROUPED_VALIDATORS)
+    index = schema.index(GROUPED_ENVIRONMENT)
+    assert index["DB"] == {"HOST": "db", "PORT": "6543"}
+    assert index["REPLICA"] == {"HOST": "replica"}
+    assert index["CACHE"] == {"HOST": "cache", "TLS_ENABLED": "true"}
+
+
+def test_group_lazy():
+    """Test groups in lazy mode."""
+    env = read_env(GROUPED_ENVIRONMENT, GROUPED_VALIDATORS, lazy=True)
+    assert env.DB.HOST == "db"
+    assert env.CACHE.TLS.ENABLED is True
+
+
+PATTERN_VALIDATORS = {
+    "FEATURE_LEGACY": Str(),
+    "FEATURES": Pattern("FEATURE_*", Bool()),
+    "URLS": Pattern("*_URL", Url()),
+    "LIMITS": Pattern(r"LIMIT_[0-9]+", Port(), regex=True),
+}
+PATTERN_ENVIRONMENT = {
+    "FEATURE_LEGACY": "on",
+    "FEATURE_SEARCH": "true",
+    "FEATURE_CHAT": "0",
+    "FEATURE_URL": "false",
+    "API_URL": "https://api.example.com",
+    "LIMIT_1": "100",
+    "LIMIT_X": "100",
+    "OTHER": "value",
+}
+
+
+@pytest.mark.parametrize("result", ["model", "slots"])
+def test_pattern_results(result):
+    """Test pattern values are read only mappings keyed by env var name, with precedence."""
+    env = read_env(PATTERN_ENVIRONMENT, PATTERN_VALIDATORS, result=result)
+    assert env.FEATURE_LEGACY == "on"
+    assert dict(env.FEATURES) == {
+        "FEATURE_SEARCH": True,
+        "FEATURE_CHAT": False,
+        "FEATURE_URL": False,
+    }
+    assert dict(env.URLS) == {"API_URL": "https://api.example.com"}
+    assert dict(env.LIMITS) == {"LIMIT_1": 100}
+    with pytest.raises(TypeError):
+        env.FEATURES["FEATURE_NEW"] = True
+
+
+def test_pattern_errors_keyed_by_env_var():
+    """Test pattern errors are keyed by env var name, and unmatched patterns are empty."""
+    on_error_mock = Mock()
+    env = read_env(
+        {"FEATURE_A": "maybe", "FEATURE_B": "1"},
+        PATTERN_VALIDATORS,
+        DefaultReporter(on_error=on_error_mock),
+        result="slots",
+    )
+    assert list(on_error_mock.call_args[0][0]) == ["FEATURE_LEGACY", "FEATURE_A"]
+    assert dict(env.FEATURES) == {"FEATURE_B": True}
+    assert dict(env.URLS) == {}
+
+
+def test_pattern_fingerprint():
+    """Test patterns are part of the schema fingerprint."""
+    first = compile_schema({"FEATURES": Pattern("FEATURE_*", Bool())})
+    assert first is compile_schema({"FEATURES": Pattern("FEATURE_*", Bool())})
+    assert first is not compile_schema({"FEATURES": Pattern("FEATURE_*", Str())})
+    assert first is not compile_schema({"FEATURES": Pattern("FLAG_*", Bool())})
+
+
+@pytest.mark.parametrize(
+    "pattern, names, expected",
+    [
+        ("(?i)db_.*", ["DB_HOST", "db_port", "OTHER"], ["DB_HOST", "db_port"]),
+        (r"(?P<kind>[A-Z]+)_(?P=kind)", ["AB_AB", "AB_CD"], ["AB_AB"]),
+        (r"(\w)\1_FLAG", ["XX_FLAG", "XY_FLAG"], ["XX_FLAG"]),
+    ],
+)
+def test_pattern_regex_features(pattern, names, expected):
+    """Test inline flags, named groups and backreferences, next to other patterns."""
+    validators = {
+        "FIRST": Pattern(pattern, Str(), regex=True),
+        "SECOND": Pattern(r"(?P<kind>[A-Z]+)_X", Str(), regex=True),
+        "REST": Pattern("*", Str()),
+    }
+    env = read_env(dict.fromkeys(names, "v"), validators, result="slots")
+    assert list(env.FIRST) == expected
+    assert sorted(env.REST) == sorted(set(names) - set(expected))
+
+
+def test_schema_plain_callables():
+    """Test plain callables are wrapped into validators, and compiled once."""
+    validators = {"WORKERS": int, "RATIO": float, "FLAGS": Pattern("FLAG_*", str.upper)}
+    env = read_env({"WORKERS": "4", "RATIO": "0.5", "FLAG_A": "on"}, validators)
+    assert (env.WORKERS, env.RATIO, dict(env.FLAGS)) == (4, 0.5, {"FLAG_A": "ON"})
+    assert compile_schema(validators) is compile_schema(dict(validators))
+    with pytest.raises(TypeError):
+        compile_schema({"HOST": Str})
+
+
+def test_schema_export():
+    """Test JSON Schema export of the validators metadata."""
+    validators = {
+        "HOST": Str(desc="host name", example="localhost"),
+        "PORT": Port(default=8000, choices=[8000, 8080]),
+        "DB": Group({"URL": Url(docs="https://docs")}, prefix="DB_"),
+        "FEATURES": Pattern("FEATURE_*", Bool()),
+    }
+    exported = compile_schema(validators).export()
+    properties = exported["properties"]
+    assert exported["required"] == ["HOST", "DB"]
+    assert properties["HOST"]["description"] == "host name"
+    assert properties["HOST"]["example"] == "localhost"
+    assert properties["PORT"]["default"] == 8000
+    assert properties["PORT"]["choices"] == [8000, 8080]
+    assert properties["FEATURES"]["pattern"] == "FEATURE_*"
+    assert exported["definitions"]["DB"]["properties"]["URL"]["docs"] == "https://docs"
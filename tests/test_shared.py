@@ -0,0 +1,122 @@
+"""Test Shared Memory Results."""
+
+import multiprocessing
+from types import MappingProxyType
+
+import pytest
+
+from envalidate import Bool, Group, Json, Number, read_env, Str
+from envalidate.shared import attach_env, encode_env, publish_env, SharedEnv
+
+pytest.importorskip("multiprocessing.shared_memory")
+
+VALIDATORS = {
+    "HOST": Str(),
+    "DEBUG": Bool(),
+    "AGENTS": Number(),
+    "RATIO": Number(),
+    "CONFIG": Json(),
+    "NAME": Str(default="envalidate"),
+}
+ENVIRONMENT = {
+    "HOST": "gööglé",
+    "DEBUG": "false",
+    "AGENTS": "1234567890",
+    "RATIO": "0.25",
+    "CONFIG": '{"hosts": ["a", "b"], "limits": {"cpu": 2}, "enabled": null}',
+}
+
+
+@pytest.fixture
+def block():
+    """Published environment."""
+    shared = publish_env(read_env(ENVIRONMENT, VALIDATORS))
+    yield shared
+    shared.close()
+    shared.unlink()
+
+
+def _worker(name, results):
+    """Attach and send values back."""
+    env = attach_env(name)
+    results.put((env.HOST, env.AGENTS, env.CONFIG["limits"]["cpu"]))
+    env.close()
+
+
+@pytest.mark.parametrize("result", ["model", "slots"])
+def test_shared_env_round_trip(result):
+    """Test attached view values, for both result backends."""
+    env = read_env(ENVIRONMENT, VALIDATORS, result=result)
+    shared = publish_env(env)
+    try:
+        view = attach_env(shared.name)
+        assert {key: value for key, value in view if key != "CONFIG"} == {
+            key: value for key, value in env if key != "CONFIG"
+        }
+        assert view.HOST == "gööglé"
+        assert view.DEBUG is False
+        assert view.AGENTS == 1234567890
+        assert view.RATIO == 0.25
+        assert view.NAME == "envalidate"
+        assert isinstance(view.CONFIG, MappingProxyType)
+        assert view.CONFIG["hosts"] == ("a", "b")
+        assert view.CONFIG["enabled"] is None
+        assert "HOST" in view and "OTHER" not in view
+        assert view.dict().keys() == dict(env).keys()
+        view.close()
+    finally:
+        shared.close()
+        shared.unlink()
+
+
+def test_shared_env_read_only(block):
+    """Test view is immutable."""
+    view = attach_env(block.name)
+    with pytest.raises(TypeError):
+        view.HOST = "other"
+    with pytest.raises(TypeError):
+        del view.HOST
+    with pytest.raises(AttributeError):
+        _ = view.OTHER
+    with pytest.raises(TypeError):
+        view.CONFIG["limits"]["cpu"] = 4
+    view.close()
+
+
+def test_shared_env_forked_workers(block):
+    """Test forked workers attach the published block, which outlives them."""
+    context = multiprocessing.get_context("fork")
+    results = context.Queue()
+    workers = [context.Process(target=_worker, args=(block.name, results)) for _ in range(2)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(10)
+    assert [results.get(timeout=1) for _ in workers] == [("gööglé", 1234567890, 2)] * 2
+    attach_env(block.name).close()
+
+
+def test_encode_env_unshareable_value():
+    """Test values that can't be encoded."""
+    with pytest.raises(TypeError):
+        encode_env({"OBJECT": object()})
+
+
+def test_shared_env_invalid_block(block):
+    """Test a block not holding an environment."""
+    block.buf[:4] = b"XXXX"
+    with pytest.raises(ValueError):
+        SharedEnv(block)
+
+
+def test_shared_env_groups():
+    """Test nested group results are shared as nested views."""
+    validators = {"HOST": Str(), "DB": Group({"PORT": Number()}, prefix="DB_")}
+    shared = publish_env(read_env({"HOST": "a", "DB_PORT": "1"}, validators))
+    try:
+        view = attach_env(shared.name)
+        assert view.DB.PORT == 1
+        view.close()
+    finally:
+        shared.close()
+        shared.unlink()
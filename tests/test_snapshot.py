@@ -0,0 +1,103 @@
+"""Test SnapshotCache."""
+
+import importlib
+import os
+import sys
+from unittest.mock import Mock, patch
+
+import pytest
+
+from envalidate import compile_schema, EnValidator, Json, Number, Port, read_env, Str
+from envalidate import snapshot as snapshot_module
+from envalidate.reporters import DefaultReporter
+from envalidate.snapshot import SnapshotCache
+
+VALIDATORS = {"HOST": Str(), "PORT": Port(default=8000), "CONFIG": Json()}
+ENVIRONMENT = {"HOST": "google", "CONFIG": '{"hosts": ["a", "b"], "ratio": 0.5}'}
+
+
+class Point(EnValidator):
+    """Point validator, returning a tuple."""
+
+    def __init__(self, **kwargs):
+        """Init Point Validator."""
+        super().__init__(name="point", **kwargs)
+
+    def __validate__value__(self, value):
+        """Validate point value."""
+        return tuple(int(part) for part in value.split(","))
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    """Snapshot cache in a temporary directory."""
+    yield SnapshotCache(str(tmp_path / "snapshots"))
+
+
+def test_snapshot_warm_read(snapshot):
+    """Test the second read loads the snapshot, without validating."""
+    cold = read_env(ENVIRONMENT, VALIDATORS, snapshot=snapshot)
+    assert (snapshot.hits, snapshot.misses) == (0, 1)
+    files = os.listdir(snapshot.directory)
+    assert len(files) == 1 and files[0].endswith(".json")
+    assert os.stat(os.path.join(snapshot.directory, files[0])).st_mode & 0o077 == 0
+    with patch.object(Json, "__validate__value__") as validate:
+        warm = read_env(ENVIRONMENT, VALIDATORS, snapshot=snapshot)
+        validate.assert_not_called()
+    assert (snapshot.hits, snapshot.misses) == (1, 1)
+    assert warm == cold
+    assert warm.CONFIG == {"hosts": ["a", "b"], "ratio": 0.5}
+    assert warm.PORT == 8000
+
+
+def test_snapshot_key_changes(snapshot):
+    """Test raw values, schema and version are part of the key."""
+    schema = compile_schema(VALIDATORS)
+    key = snapshot.key(schema, ENVIRONMENT)
+    assert key == snapshot.key(schema, dict(ENVIRONMENT))
+    assert key != snapshot.key(schema, {**ENVIRONMENT, "HOST": "other"})
+    assert key != snapshot.key(schema, {**ENVIRONMENT, "PORT": "8000"})
+    assert key != snapshot.key(compile_schema({**VALIDATORS, "PORT": Port()}), ENVIRONMENT)
+    with patch.object(snapshot_module, "VERSION", "0.0.0"):
+        assert key != snapshot.key(schema, ENVIRONMENT)
+
+
+def test_snapshot_key_covers_validators_code(snapshot, tmp_path, monkeypatch):
+    """Test editing the source of a validator changes the key."""
+    source = tmp_path / "snapshot_validators.py"
+    source.write_text(
+        "from envalidate import validator\n\n@validator\ndef even(value):\n    return int(value)\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "snapshot_validators", raising=False)
+    module = importlib.import_module("snapshot_validators")
+    schema = compile_schema({"AGENTS": module.even(), "HOST": Str()})
+    key = snapshot.key(schema, ENVIRONMENT)
+    assert key == SnapshotCache(snapshot.directory).key(schema, ENVIRONMENT)
+    source.write_text(source.read_text().replace("int(value)", "int(value) * 2"))
+    assert key != SnapshotCache(snapshot.directory).key(schema, ENVIRONMENT)
+
+
+def test_snapshot_not_stored(snapshot):
+    """Test invalid environments and non JSON values are not stored."""
+    read_env({"HOST": "a"}, VALIDATORS, DefaultReporter(on_error=Mock()), snapshot=snapshot)
+    env = read_env({"POINT": "1,2"}, {"POINT": Point()}, snapshot=snapshot)
+    assert env.POINT == (1, 2)
+    assert not os.path.exists(snapshot.directory) or not os.listdir(snapshot.directory)
+
+
+def test_snapshot_corrupted_file(snapshot):
+    """Test a corrupted or mismatching snapshot is a miss."""
+    schema = compile_schema({"AGENTS": Number()})
+    environment = {"AGENTS": "2"}
+    read_env(environment, schema, snapshot=snapshot)
+    path = snapshot.path(snapshot.key(schema, environment))
+    with open(path, "w", encoding="utf-8") as file:
+        file.write('{"format": 1, "values": {"AGENTS": 3}}')
+    assert snapshot.load(schema, environment) is None
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("{")
+    assert read_env(environment, schema, snapshot=snapshot).AGENTS == 2
+    assert snapshot.load(schema, environment) == {"AGENTS": 2}
+    snapshot.clear()
+    assert os.listdir(snapshot.directory) == []
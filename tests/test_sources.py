@@ -0,0 +1,201 @@
+"""Test Configuration Sources."""
+
+import asyncio
+import json
+import os
+import pickle
+from unittest.mock import Mock
+
+import pytest
+
+from envalidate import (
+    aread_env,
+    Group,
+    Json,
+    Number,
+    Pattern,
+    Port,
+    read_env,
+    Source,
+    Sources,
+    Str,
+)
+
+
+@pytest.fixture
+def sources(tmp_path):
+    """Overrides, dotenv and JSON sources, by precedence."""
+    dotenv = tmp_path / ".env"
+    dotenv.write_text("HOST=dotenv\nPORT=8000\n")
+    config = tmp_path / "config.json"
+    config.write_text(json.dumps({"PORT": 9000, "DEBUG": True, "TAGS": ["a"], "NONE": None}))
+    return Sources(
+        [
+            Source.overrides({"HOST": "override"}),
+            Source.dotenv(str(dotenv)),
+            Source.json(str(config)),
+        ]
+    )
+
+
+def test_sources_precedence(sources):
+    """Test the first source supplying a key wins."""
+    assert dict(sources) == {"HOST": "override", "PORT": "8000", "DEBUG": "true", "TAGS": '["a"]'}
+    assert sources.source("HOST") == "overrides"
+    assert sources.source("PORT").endswith(".env")
+    assert sources.source("DEBUG").endswith("config.json")
+    assert sources.source("MISSING") is None
+    assert "NONE" not in sources
+
+
+class CountingDict(dict):
+    """Dict counting value lookups."""
+
+    lookups = 0
+
+    def __getitem__(self, key):
+        """Count the lookup."""
+        self.lookups += 1
+        return super().__getitem__(key)
+
+
+def test_sources_single_lookup():
+    """Test a key is read from its source alone, with a single lookup."""
+    high, low = CountingDict(KEY="high"), CountingDict(KEY="low", OTHER="low")
+    sources = Sources([Source(high, "high"), Source(low, "low")])
+    assert sources.get("KEY") == "high"
+    assert high.lookups == 1
+    assert sources["OTHER"] == "low"
+    assert (high.lookups, low.lookups) == (1, 1)
+
+
+def test_sources_not_copied():
+    """Test values are read live, and keys indexed again on refresh."""
+    values = {"KEY": "before"}
+    sources = Sources([values])
+    values["KEY"] = "after"
+    values["NEW"] = "new"
+    assert sources["KEY"] == "after"
+    assert "NEW" not in sources
+    assert sources.refresh()["NEW"] == "new"
+    del values["KEY"]
+    assert sources.get("KEY", "default") == "default"
+    with pytest.raises(KeyError):
+        _ = sources["KEY"]
+
+
+def test_sources_removed_key_falls_back(tmp_path):
+    """Test a key removed from its source is read from the next source supplying it."""
+    dotenv = tmp_path / ".env"
+    dotenv.write_text("HOST=dotenv\n")
+    environ = {"HOST": "environ", "PORT": "80"}
+    sources = Sources([Source(environ, "environ"), Source.dotenv(str(dotenv))])
+    del environ["HOST"], environ["PORT"]
+    assert sources.get("HOST") == "dotenv"
+    assert sources.source("HOST").endswith(".env")
+    assert "PORT" not in sources
+    assert sources.get("PORT", "default") == "default"
+    assert sources["HOST"] == "dotenv"
+
+
+@pytest.mark.parametrize(
+    "validators",
+    [
+        {"FEATURES": Pattern("FEATURE_*", Str())},
+        {"FEATURES": Group({"B": Str(), "C": Str()}, "FEATURE_")},
+    ],
+    ids=["pattern", "group"],
+)
+def test_sources_iterated_after_removal(validators):
+    """Test groups and patterns read the live keys, after keys are removed and added."""
+    environ = {"FEATURE_A": "a", "FEATURE_B": "b"}
+    sources = Sources([environ, {"FEATURE_B": "low"}])
+    del environ["FEATURE_A"], environ["FEATURE_B"]
+    environ["FEATURE_C"] = "c"
+    env = read_env(sources, validators, result="slots")
+    assert sorted(dict(env.FEATURES).values()) == ["c", "low"]
+    assert len(sources) == 2
+    assert dict(sources) == {"FEATURE_B": "low", "FEATURE_C": "c"}
+
+
+def test_sources_names():
+    """Test unnamed mappings naming."""
+    sources = Sources([{"A": "1"}, os.environ, Source({"B": "2"})])
+    assert [source.name for source in sources.sources] == ["sources[0]", "environ", "sources[2]"]
+    assert repr(sources) == "Sources(['sources[0]', 'environ', 'sources[2]'])"
+    assert Source.environ().mapping is os.environ
+
+
+def test_source_json_not_object(tmp_path):
+    """Test JSON files must hold an object."""
+    path = tmp_path / "config.json"
+    path.write_text("[1]")
+    with pytest.raises(ValueError, match="expected a JSON object"):
+        Source.json(str(path))
+
+
+def test_source_toml(tmp_path):
+    """Test TOML files values."""
+    pytest.importorskip("tomllib")
+    path = tmp_path / "config.toml"
+    path.write_text('HOST = "toml"\nPORT = 8000\n[DB]\nurl = "x"\n')
+    source = Source.toml(str(path))
+    assert source.mapping == {"HOST": "toml", "PORT": "8000", "DB": '{"url": "x"}'}
+    assert source.name == str(path)
+
+
+@pytest.mark.parametrize("result", ["model", "slots"])
+def test_read_env_provenance(sources, result):
+    """Test results expose the source of each value."""
+    validators = {"HOST": Str(), "PORT": Port(), "EXTRA": Str(default="x")}
+    env = read_env(sources, validators, result=result)
+    assert env.HOST == "override"
+    assert env.PORT == 8000
+    assert dict(env.provenance()) == {"HOST": "overrides", "PORT": sources.source("PORT")}
+
+
+def test_read_env_without_sources_provenance():
+    """Test results of plain mappings have no provenance."""
+    assert dict(read_env({"HOST": "x"}, {"HOST": Str()}).provenance()) == {}
+    assert dict(read_env({"HOST": "x"}, {"HOST": Str()}, result="slots").provenance()) == {}
+
+
+def test_read_env_errors_source(sources):
+    """Test errors messages name the source of the rejected value."""
+    reporter = Mock()
+    read_env(sources, {"HOST": Number(), "MISSING": Str()}, reporter=reporter)
+    errors = reporter.report.call_args[0][0]
+    assert errors["HOST"].source == "overrides"
+    assert str(errors["HOST"]).startswith("Invalid number input: override")
+    assert str(errors["HOST"]).endswith("(from overrides)")
+    assert errors["MISSING"].source is None
+    assert str(errors["MISSING"]) == "missing environment key"
+
+
+def test_read_env_lazy_provenance(sources):
+    """Test lazy results add the source to errors on access."""
+    reporter = Mock()
+    env = read_env(sources, {"HOST": Number(), "PORT": Port()}, reporter=reporter, lazy=True)
+    assert env.provenance()["HOST"] == "overrides"
+    assert not hasattr(env, "HOST")
+    assert reporter.report.call_args[0][0]["HOST"].source == "overrides"
+
+
+def test_read_env_group_provenance(sources):
+    """Test provenance is keyed by env var name for groups."""
+    env = read_env(sources, {"app": Group({"ST": Str()}, "HO")}, result="slots")
+    assert env.app.ST == "override"
+    assert dict(env.provenance()) == {"HOST": "overrides"}
+
+
+def test_aread_env_provenance(sources):
+    """Test async reads expose provenance."""
+    env = asyncio.run(aread_env(sources, {"TAGS": Json()}, result="slots"))
+    assert env.TAGS == ["a"]
+    assert env.provenance()["TAGS"].endswith("config.json")
+
+
+def test_result_provenance_pickle(sources):
+    """Test slots results keep provenance when pickled."""
+    env = read_env(sources, {"HOST": Str()}, result="slots")
+    assert dict(pickle.loads(pickle.dumps(env)).provenance()) == {"HOST": "overrides"}